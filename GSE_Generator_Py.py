@@ -8,9 +8,251 @@ from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sqlite3
+import time
+import argparse
+import atexit
+import logging
+import logging.handlers
+import queue
+import codecs
+import ctypes
+import hashlib
+import ctypes.util
+import mmap
+import select
+import struct
+from html.parser import HTMLParser
 import subprocess
+import tempfile
+import sys
+import urllib.parse
+import uuid
 import zipfile
+import zlib
 import webbrowser
+import io
+import difflib
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# NumPy speeds up batch image processing, PIL is used without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# zstd compresses the page store better, zlib is used without it
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Log of the generator; console verbosity and file sink are set up by setup_logging
+log = logging.getLogger("gse_generator")
+LOG_LEVELS = ["debug", "info", "warning", "error"]
+LOG_FILE_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(message)s"
+# Records buffered before the log file is written (errors are written at once)
+LOG_BUFFER_RECORDS = 512
+
+# Base URLs of the Steam services, pointed at local stand-ins by mock_steam.py
+STORE_API_URL = "https://store.steampowered.com/api/appdetails"
+STEAM_CDN_URL = "https://cdn.akamai.steamstatic.com"
+COMMUNITY_URL = "https://steamcommunity.com"
+# Connect / read timeout of Store API and CDN requests in seconds
+STEAM_REQUEST_TIMEOUT = 10
+
+# Request headers used when accessing the Steam Community achievement page
+COMMUNITY_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Game artwork downloaded from the Steam CDN
+GAME_IMAGES = ["header.jpg", "logo.png", "library_600x900.jpg"]
+
+# Steam Web API achievement schema (GetSchemaForGame), an alternative to the
+# SteamDB achievement page; the key is read from the environment by the GUI
+SCHEMA_API_URL = "https://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2/"
+SCHEMA_API_KEY_ENV = "STEAM_API_KEY"
+
+# Achievement icons on the Steam CDN, downloaded when missing from the imgs folder
+ACHIEVEMENT_ICON_URL = STEAM_CDN_URL + "/steamcommunity/public/images/apps/{appid}/{filename}"
+ICON_CACHE_DIR = "icon_cache"
+ICON_DOWNLOAD_WORKERS = 8
+ICON_DOWNLOAD_RETRIES = 3
+
+# Generated gray (locked) achievement icons: luminance weights and brightness factor
+GRAY_ICON_SUFFIX = "_gray"
+GRAY_ICON_LUMINANCE = (0.299, 0.587, 0.114)
+GRAY_ICON_BRIGHTNESS = 0.5
+
+# Perceptual-hash matching of SteamDB and Steam Community icons: maximum
+# Hamming distance (of 64 bits) accepted as the same image
+ICON_MATCH_MAX_DISTANCE = 10
+
+# Delay after the last AppID keystroke before prefetching (milliseconds)
+PREFETCH_DELAY_MS = 600
+
+# Shared cache of Steam Store API responses and game artwork, keyed by request
+_steam_cache = {}
+_steam_cache_lock = threading.Lock()
+_STEAM_CACHE_MAX_ENTRIES = 1024
+
+# Chunk size used when streaming HTML pages to the parsers
+HTML_CHUNK_SIZE = 64 * 1024
+
+# Bytes searched for the byte order mark and <meta charset> of saved pages
+HTML_SNIFF_SIZE = 4096
+_HTML_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
+
+# Files the source folder must provide
+CORE_FILES = [
+    "ColdClientLoader.ini",
+    "GameOverlayRenderer.dll",
+    "GameOverlayRenderer64.dll",
+    "steamclient.dll",
+    "steamclient_loader_x64.exe",
+    "steamclient64.dll"
+]
+
+# Files needed by the in-game overlay, relative to the source folder
+OVERLAY_FILES = [
+    "steam_settings/configs.overlay.ini",
+    "steam_settings/sounds/overlay_achievement_notification.wav",
+    "steam_settings/fonts/Roboto-Medium.ttf"
+]
+
+# GSE DLLs of each patch type
+PATCH_FILES = {
+    "regular": [
+        "source/GSE_DLL/regular/steam_api.dll",
+        "source/GSE_DLL/regular/steam_api64.dll"
+    ],
+    "experimental": [
+        "source/GSE_DLL/experimental/steam_api.dll",
+        "source/GSE_DLL/experimental/steam_api64.dll"
+    ]
+}
+
+# Known-good hashes of the source folder, and hashes cached by (path, size, mtime)
+SOURCE_MANIFEST_PATH = "source_manifest.json"
+INTEGRITY_CACHE_PATH = "integrity_cache.json"
+_integrity_cache_lock = threading.Lock()
+
+# Game root scan: index cache keyed by folder mtimes, scanning threads, and
+# executables that are never the main game EXE
+GAME_SCAN_CACHE_PATH = "game_scan_cache.json"
+GAME_SCAN_WORKERS = 16
+GAME_SCAN_IGNORED_EXES = re.compile(
+    r'unins|setup|install|redist|vc_?redist|dxsetup|directx|dotnet|crash|report|'
+    r'easyanticheat|battleye|launcherpatcher|ue4prereq|prereq|cef|helper|7z|unity(crash)?handler',
+    re.IGNORECASE)
+_game_scan_cache_lock = threading.Lock()
+
+# PE machine types, and the architecture each steam_api DLL name is built for
+PE_MACHINES = {0x14C: "x86", 0x8664: "x64", 0xAA64: "arm64"}
+STEAM_API_ARCHITECTURES = {"steam_api.dll": "x86", "steam_api64.dll": "x64"}
+
+# Patch file list written with every Patch.zip, and the delta patch built against it
+PATCH_MANIFEST_NAME = "Patch.manifest.json"
+DELTA_PATCH_NAME = "Patch_delta.zip"
+DELTA_DELETED_NAME = "Patch_delta_deleted.txt"
+
+# Multi-game bundles: manifest and content-addressed file objects in the bundle archive
+BUNDLE_MANIFEST_NAME = "bundle.json"
+# Hashes of exported game files, kept apart from the startup source check cache
+BUNDLE_CACHE_PATH = "bundle_cache.json"
+BUNDLE_OBJECTS_DIR = "objects"
+# Already compressed files are stored without compressing them again
+BUNDLE_STORED_EXTENSIONS = ('.zip', '.jpg', '.jpeg', '.png', '.webp', '.ogg', '.mp3')
+
+# Local catalog of apps, DLCs and achievements
+CATALOG_PATH = "catalog.db"
+
+# Compressed archive of saved pages; a stored page is used in place of a file
+# path as "{store}#{appid}/{page type}/{language}[@{saved at}]"
+PAGE_STORE_PATH = "page_store.db"
+PAGE_STORE_LEVELS = {'zstd': 19, 'zlib': 9}
+PAGE_STORE_READ_SIZE = 64 * 1024
+# Pages of one type share a dictionary, trained from the first batch of at
+# least PAGE_DICT_MIN_SAMPLES pages (zlib only uses the last 32 KiB of it)
+PAGE_DICT_SIZE = 112 * 1024
+PAGE_DICT_MIN_SAMPLES = 4
+PAGE_DICT_SAMPLE_SIZE = 1024 * 1024
+ZLIB_DICT_SIZE = 32 * 1024
+
+# Watch mode: quiet period before re-running, and snapshot interval without inotify
+WATCH_DEBOUNCE_SECONDS = 1.0
+WATCH_POLL_INTERVAL = 1.0
+
+# Service mode: local HTTP API, job folders and worker pool limits
+SERVICE_PORT = 8765
+SERVICE_DIR = "service"
+SERVICE_WORKERS = 2
+SERVICE_MAX_QUEUED = 16
+SERVICE_MAX_UPLOAD_SIZE = 64 * 1024 * 1024
+# Uploads are deleted after a day, and new ones are rejected while the folder holds this much
+SERVICE_UPLOAD_MAX_AGE = 24 * 60 * 60
+SERVICE_MAX_UPLOADS_SIZE = 1024 * 1024 * 1024
+
+
+def setup_logging(level="info", log_file=None):
+    """
+    Set up console logging and an optional log file
+
+    The console shows records of level and above; per-file and per-item
+    details are debug records, so the default level shows stage summaries.
+    The log file receives every record: records are queued and written by
+    a listener thread in batches of LOG_BUFFER_RECORDS (errors flush the
+    batch at once), so logging never waits on the disk.
+
+    Args:
+        level (str): Console level, one of LOG_LEVELS
+        log_file (str): Log file path, None for console only
+
+    Returns:
+        logging.handlers.QueueListener: File sink listener (stopped at exit), None without a log file
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers = [console_handler]
+    log.setLevel(console_handler.level)
+    log.propagate = False
+    if not log_file:
+        return None
+
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FILE_FORMAT))
+    buffered_handler = logging.handlers.MemoryHandler(
+        LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler)
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), buffered_handler)
+    log.addHandler(logging.handlers.QueueHandler(listener.queue))
+    log.setLevel(logging.DEBUG)
+    listener.start()
+
+    def stop():
+        listener.stop()
+        buffered_handler.close()
+        file_handler.close()
+
+    atexit.register(stop)
+    return listener
 
 
 def replace_exe_icon_with_ico(ico_file: str, target_exe: str, output_exe: str) -> bool:
@@ -31,16 +273,16 @@ def replace_exe_icon_with_ico(ico_file: str, target_exe: str, output_exe: str) -
 
     # Check if tool exists
     if not os.path.exists(resource_hacker_path):
-        print(f"ResourceHacker tool not found: {resource_hacker_path}")
+        log.warning(f"ResourceHacker tool not found: {resource_hacker_path}")
         return False
 
     # Check input files
     if not os.path.exists(ico_file):
-        print(f"ICO file not found: {ico_file}")
+        log.warning(f"ICO file not found: {ico_file}")
         return False
 
     if not os.path.exists(target_exe):
-        print(f"Target file not found: {target_exe}")
+        log.warning(f"Target file not found: {target_exe}")
         return False
 
     if not os.path.splitext(ico_file)[1].lower() == '.ico':
@@ -54,7 +296,7 @@ def replace_exe_icon_with_ico(ico_file: str, target_exe: str, output_exe: str) -
         shutil.copy2(target_exe, output_exe)
 
         # Use ResourceHacker to replace icon
-        print("Replacing icon...")
+        log.info("Replacing icon...")
         replace_cmd = [
             resource_hacker_path,
             "-open", os.path.abspath(output_exe),
@@ -67,15 +309,15 @@ def replace_exe_icon_with_ico(ico_file: str, target_exe: str, output_exe: str) -
         result = subprocess.run(replace_cmd, capture_output=True, text=True)
 
         if result.returncode == 0:
-            print("Icon replacement successful!")
+            log.info("Icon replacement successful!")
             return True
         else:
-            print(f"ResourceHacker replacement failed: {result.stderr}")
-            print(f"ResourceHacker output: {result.stdout}")
+            log.warning(f"ResourceHacker replacement failed: {result.stderr}")
+            log.info(f"ResourceHacker output: {result.stdout}")
             return False
 
     except Exception as e:
-        print(f"Operation failed: {e}")
+        log.warning(f"Operation failed: {e}")
         return False
 
 
@@ -95,32 +337,28 @@ def replace_exe_icon(source_exe: str, target_exe: str, output_exe: str) -> bool:
     # Tool path
     resource_hacker_path = "./tool/ResourceHacker.exe"
 
-    # Temporary icon directory
-    temp_icon_dir = "./temp_icon"
-
     # Check if tool exists
     if not os.path.exists(resource_hacker_path):
-        print(f"ResourceHacker tool not found: {resource_hacker_path}")
+        log.warning(f"ResourceHacker tool not found: {resource_hacker_path}")
         return False
 
     # Check input files
     if not os.path.exists(source_exe):
-        print(f"Source file not found: {source_exe}")
+        log.warning(f"Source file not found: {source_exe}")
         return False
 
     if not os.path.exists(target_exe):
-        print(f"Target file not found: {target_exe}")
+        log.warning(f"Target file not found: {target_exe}")
         return False
 
-    # Create temporary icon directory
-    if not os.path.exists(temp_icon_dir):
-        os.makedirs(temp_icon_dir)
+    # Temporary icon directory, one per call so concurrent jobs do not share it
+    temp_icon_dir = tempfile.mkdtemp(prefix="temp_icon_")
 
     try:
         # Use ResourceHacker to extract icon resources
         res_path = os.path.join(temp_icon_dir, "extracted_icon.res")
 
-        print("Extracting icon resources...")
+        log.info("Extracting icon resources...")
         extract_cmd = [
             resource_hacker_path,
             "-open", os.path.abspath(source_exe),
@@ -133,18 +371,18 @@ def replace_exe_icon(source_exe: str, target_exe: str, output_exe: str) -> bool:
 
         # Check if resource extraction was successful
         if not os.path.exists(res_path) or os.path.getsize(res_path) == 0:
-            print("Icon resource extraction failed")
-            print(f"ResourceHacker output: {result.stdout}")
-            print(f"ResourceHacker error: {result.stderr}")
+            log.warning("Icon resource extraction failed")
+            log.info(f"ResourceHacker output: {result.stdout}")
+            log.warning(f"ResourceHacker error: {result.stderr}")
             return False
 
-        print("Icon resource extraction successful")
+        log.info("Icon resource extraction successful")
 
         # Copy target file to output path
         shutil.copy2(target_exe, output_exe)
 
         # Use ResourceHacker to replace icon
-        print("Replacing icon...")
+        log.info("Replacing icon...")
         replace_cmd = [
             resource_hacker_path,
             "-open", os.path.abspath(output_exe),
@@ -156,21 +394,424 @@ def replace_exe_icon(source_exe: str, target_exe: str, output_exe: str) -> bool:
         result = subprocess.run(replace_cmd, capture_output=True, text=True)
 
         if result.returncode == 0:
-            print("Icon replacement successful!")
+            log.info("Icon replacement successful!")
             return True
         else:
-            print(f"ResourceHacker replacement failed: {result.stderr}")
-            print(f"ResourceHacker output: {result.stdout}")
+            log.warning(f"ResourceHacker replacement failed: {result.stderr}")
+            log.info(f"ResourceHacker output: {result.stdout}")
             return False
 
     except Exception as e:
-        print(f"Operation failed: {e}")
+        log.warning(f"Operation failed: {e}")
         return False
 
     finally:
         # Clean up temporary icon directory
-        if os.path.exists(temp_icon_dir):
-            shutil.rmtree(temp_icon_dir, ignore_errors=True)
+        shutil.rmtree(temp_icon_dir, ignore_errors=True)
+
+
+def _cached_fetch(key, loader):
+    """
+    Return the cached result for key, calling loader on a cache miss
+
+    Concurrent callers of the same key wait for the request already in flight
+    instead of sending a duplicate one. Failed requests are not cached.
+    """
+    with _steam_cache_lock:
+        entry = _steam_cache.get(key)
+        is_owner = entry is None
+        if is_owner:
+            # Evict the oldest finished entries once the cache is full
+            for old_key in list(_steam_cache):
+                if len(_steam_cache) < _STEAM_CACHE_MAX_ENTRIES:
+                    break
+                if _steam_cache[old_key].done():
+                    del _steam_cache[old_key]
+            entry = Future()
+            _steam_cache[key] = entry
+
+    if is_owner:
+        try:
+            entry.set_result(loader())
+        except BaseException as e:
+            with _steam_cache_lock:
+                _steam_cache.pop(key, None)
+            entry.set_exception(e)
+
+    return entry.result()
+
+
+def fetch_app_details(appid, web_language):
+    """
+    Get Steam Store API appdetails JSON of an app (cached)
+
+    Args:
+        appid (int): Steam application ID
+        web_language (str): Language code
+
+    Returns:
+        dict: Parsed appdetails response
+    """
+    def load():
+        url = f"{STORE_API_URL}?appids={appid}&l={web_language}"
+        response = requests.get(url, timeout=STEAM_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    return _cached_fetch(('appdetails', str(appid), web_language), load)
+
+
+def fetch_game_image(appid, image_name):
+    """
+    Get game artwork from the Steam CDN (cached)
+
+    Args:
+        appid (int): Steam game application ID
+        image_name (str): Image file name, one of GAME_IMAGES
+
+    Returns:
+        bytes: Image content, or None if the image does not exist
+
+    Raises:
+        requests.RequestException: The request failed (e.g. 429, 5xx or timeout)
+    """
+    def load():
+        url = f"{STEAM_CDN_URL}/steam/apps/{appid}/{image_name}"
+        response = requests.get(url, timeout=STEAM_REQUEST_TIMEOUT)
+        if response.status_code == 404:
+            return None
+        # Throttling and server errors are raised, so they are not cached as missing
+        response.raise_for_status()
+        return response.content
+
+    return _cached_fetch(('image', str(appid), image_name), load)
+
+
+def download_game_images(appid, temp_dir="_temp"):
+    """
+    Download game artwork (GAME_IMAGES) to temp_dir
+
+    Returns:
+        int: Number of images downloaded
+    """
+    if not os.path.exists(temp_dir):
+        os.makedirs(temp_dir)
+
+    downloaded = 0
+    # Header image, logo and library cover (served from cache when prefetched)
+    for image_name in GAME_IMAGES:
+        try:
+            image_content = fetch_game_image(appid, image_name)
+            if image_content is not None:
+                image_path = os.path.join(temp_dir, image_name)
+                with open(image_path, "wb") as f:
+                    f.write(image_content)
+                log.info(f"{image_name} downloaded successfully")
+                downloaded += 1
+        except Exception as e:
+            log.warning(f"Failed to download {image_name}: {e}")
+    return downloaded
+
+
+def is_plain_filename(filename):
+    """Check if filename is a single file name (no folders), e.g. an icon name taken from a page"""
+    return (bool(filename) and filename not in ('.', '..')
+            and filename == os.path.basename(filename) and '\\' not in filename)
+
+
+def icon_cache_path(appid, filename, cache_dir=ICON_CACHE_DIR):
+    """Get the path of an achievement icon in the persistent icon cache"""
+    return os.path.join(cache_dir, str(appid), filename)
+
+
+def create_download_session(max_workers, retries=ICON_DOWNLOAD_RETRIES):
+    """
+    Create a requests session that reuses connections across worker threads
+
+    Failed connections and 429/5xx responses are retried with backoff.
+    """
+    retry = Retry(total=retries, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET']))
+    adapter = HTTPAdapter(pool_connections=max_workers,
+                          pool_maxsize=max_workers, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def download_achievement_icons(appid, filenames, cache_dir=ICON_CACHE_DIR,
+                               max_workers=ICON_DOWNLOAD_WORKERS, retries=ICON_DOWNLOAD_RETRIES, timeout=10):
+    """
+    Get achievement icons from the icon cache, downloading missing ones from the Steam CDN
+
+    Args:
+        appid (str): Steam game application ID
+        filenames (iterable): Icon file names (icon hash and extension)
+        cache_dir (str): Persistent icon cache folder, icons are stored in {cache_dir}/{appid}
+        max_workers (int): Maximum number of concurrent downloads
+        retries (int): Retries of a failed download
+        timeout (float): Timeout of a single request in seconds
+
+    Returns:
+        tuple: ({filename: cached icon path}, [filenames that could not be downloaded])
+    """
+    icons = {}
+    failed = []
+    pending = []
+    for filename in sorted(set(filenames)):
+        if not is_plain_filename(filename):
+            failed.append(filename)
+            continue
+        cached_path = icon_cache_path(appid, filename, cache_dir)
+        if os.path.isfile(cached_path) and os.path.getsize(cached_path) > 0:
+            icons[filename] = cached_path
+        else:
+            pending.append(filename)
+
+    if not pending:
+        return icons, failed
+
+    cached_count = len(icons)
+    os.makedirs(os.path.join(cache_dir, str(appid)), exist_ok=True)
+    session = create_download_session(max_workers, retries)
+
+    def download(filename):
+        url = ACHIEVEMENT_ICON_URL.format(
+            appid=appid, filename=urllib.parse.quote(filename))
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        if not response.content:
+            raise ValueError("Empty response")
+
+        # Write to a temporary file first, so an interrupted download never
+        # leaves a truncated icon in the cache
+        cached_path = icon_cache_path(appid, filename, cache_dir)
+        temp_path = f"{cached_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(response.content)
+            os.replace(temp_path, cached_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return cached_path
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(download, filename): filename
+                       for filename in pending}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    icons[filename] = future.result()
+                except (requests.RequestException, OSError, ValueError) as e:
+                    log.debug("Icon download failed: %s - %s", filename, e)
+                    failed.append(filename)
+    finally:
+        session.close()
+
+    log.log(logging.WARNING if failed else logging.INFO,
+            f"Achievement icons: {len(icons) - cached_count} downloaded, "
+            f"{cached_count} from icon cache, {len(failed)} failed")
+    return icons, sorted(failed)
+
+
+def gray_icon_name(icon):
+    """Get the file name of the gray icon generated for icon (e.g. abc.jpg -> abc_gray.jpg)"""
+    stem, ext = os.path.splitext(icon)
+    if ext.lower() not in Image.registered_extensions():
+        ext = ".png"
+    return f"{stem}{GRAY_ICON_SUFFIX}{ext}"
+
+
+def make_gray_icons(images):
+    """
+    Create desaturated, dimmed variants of achievement icons
+
+    The luminance of every icon comes from PIL and is dimmed with one level
+    table, so the result does not depend on whether NumPy is installed. With
+    NumPy, icons of the same size are stacked and dimmed together with array
+    operations; without it every icon is dimmed with PIL.
+
+    Args:
+        images (list): PIL images
+
+    Returns:
+        list: Gray PIL images (RGBA), in the order of images
+    """
+    images = [image.convert('RGBA') for image in images]
+    luminances = [image.convert('RGB').convert('L', GRAY_ICON_LUMINANCE + (0,))
+                  for image in images]
+    levels = [min(255, int(value * GRAY_ICON_BRIGHTNESS + 0.5)) for value in range(256)]
+    if np is None:
+        gray_images = []
+        for image, luminance in zip(images, luminances):
+            luminance = luminance.point(levels)
+            gray_image = Image.merge(
+                'RGBA', (luminance, luminance, luminance, image.getchannel('A')))
+            gray_images.append(gray_image)
+        return gray_images
+
+    # Group icons by size, so each group is one (N, H, W) array
+    groups = {}
+    for index, image in enumerate(images):
+        groups.setdefault(image.size, []).append(index)
+
+    gray_images = [None] * len(images)
+    level_table = np.asarray(levels, dtype=np.uint8)
+    for indexes in groups.values():
+        luminance = np.stack([np.asarray(luminances[index]) for index in indexes])
+        gray = np.empty(luminance.shape + (4,), dtype=np.uint8)
+        gray[..., :3] = level_table[luminance][..., None]
+        gray[..., 3] = np.stack([np.asarray(images[index].getchannel('A')) for index in indexes])
+        for index, gray_array in zip(indexes, gray):
+            gray_images[index] = Image.fromarray(gray_array, 'RGBA')
+    return gray_images
+
+
+def icon_hashes(image_paths):
+    """
+    Compute 64-bit difference hashes (dHash) of icons
+
+    Each icon is reduced to 9x8 grayscale pixels, and every bit tells whether
+    a pixel is brighter than its left neighbour, so the hash survives
+    resizing and recompression of the same image.
+
+    Args:
+        image_paths (list): Icon file paths
+
+    Returns:
+        list: Hashes (int) in the order of image_paths, None for unreadable icons
+    """
+    pixels = []
+    for image_path in image_paths:
+        try:
+            with Image.open(image_path) as image:
+                # Let JPEG decode at a reduced size
+                image.draft('L', (18, 16))
+                pixels.append(image.convert('L').resize((9, 8), Image.LANCZOS).tobytes())
+        except Exception as e:
+            log.warning(f"Cannot read icon: {image_path} - {e}")
+            pixels.append(None)
+
+    valid = [index for index, data in enumerate(pixels) if data is not None]
+    hashes = [None] * len(pixels)
+    if not valid:
+        return hashes
+
+    if np is not None:
+        stack = np.frombuffer(b"".join(pixels[index] for index in valid),
+                              dtype=np.uint8).reshape(len(valid), 8, 9)
+        bits = stack[:, :, 1:] > stack[:, :, :-1]
+        packed = np.packbits(bits.reshape(len(valid), 64), axis=1)
+        for index, value in zip(valid, packed.view('>u8').ravel()):
+            hashes[index] = int(value)
+        return hashes
+
+    for index in valid:
+        data = pixels[index]
+        value = 0
+        for row in range(8):
+            for column in range(8):
+                value = (value << 1) | (data[row * 9 + column + 1] > data[row * 9 + column])
+        hashes[index] = value
+    return hashes
+
+
+def match_icon_hashes(hashes_a, hashes_b, max_distance=ICON_MATCH_MAX_DISTANCE):
+    """
+    Pair icons of two sets by the Hamming distance of their hashes
+
+    The full N x M distance matrix is computed at once with NumPy. A pair is
+    accepted when each icon is the other's closest one and the distance is
+    within max_distance, so every icon is used at most once.
+
+    Args:
+        hashes_a (list): Hashes (int) of the first set
+        hashes_b (list): Hashes (int) of the second set
+        max_distance (int): Maximum accepted Hamming distance
+
+    Returns:
+        list: (index in hashes_a, index in hashes_b, distance) tuples
+    """
+    if not hashes_a or not hashes_b:
+        return []
+
+    if np is not None:
+        a = np.asarray(hashes_a, dtype=np.uint64)
+        b = np.asarray(hashes_b, dtype=np.uint64)
+        xor = a[:, None] ^ b[None, :]
+        if hasattr(np, 'bitwise_count'):
+            distances = np.bitwise_count(xor)
+        else:
+            distances = np.unpackbits(xor.view(np.uint8), axis=-1).reshape(
+                len(a), len(b), 64).sum(axis=-1)
+        best_b = distances.argmin(axis=1)
+        best_a = distances.argmin(axis=0)
+        rows = np.arange(len(a))
+        best_distances = distances[rows, best_b]
+        mutual = (best_a[best_b] == rows) & (best_distances <= max_distance)
+        return [(int(i), int(best_b[i]), int(best_distances[i]))
+                for i in np.flatnonzero(mutual)]
+
+    distances = [[(value_a ^ value_b).bit_count() for value_b in hashes_b]
+                 for value_a in hashes_a]
+    best_b = [min(range(len(hashes_b)), key=row.__getitem__) for row in distances]
+    best_a = [min(range(len(hashes_a)), key=lambda i: distances[i][j])
+              for j in range(len(hashes_b))]
+    return [(i, j, distances[i][j]) for i, j in enumerate(best_b)
+            if best_a[j] == i and distances[i][j] <= max_distance]
+
+
+def encode_icon(image, filename):
+    """Encode a PIL image in the format given by the extension of filename"""
+    image_format = Image.registered_extensions().get(
+        os.path.splitext(filename)[1].lower(), 'PNG')
+    if image_format in ('JPEG', 'BMP'):
+        image = image.convert('RGB')
+    buffer = io.BytesIO()
+    image.save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def prefetch_game_info(appid, web_language, cancel_event, max_workers=4):
+    """
+    Fill the cache with appdetails, DLC names and artwork of a game
+
+    Args:
+        appid (int): Steam game application ID
+        web_language (str): Language code
+        cancel_event (threading.Event): Set to stop prefetching (e.g. AppID changed)
+        max_workers (int): Maximum number of concurrent requests
+    """
+    def run(loader, *args):
+        if not cancel_event.is_set():
+            loader(*args)
+
+    try:
+        data = fetch_app_details(appid, web_language)
+        if cancel_event.is_set() or not data.get(str(appid), {}).get('success'):
+            return
+
+        dlc_list = data[str(appid)]['data'].get('dlc', [])
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(run, fetch_game_image, appid, image_name)
+                       for image_name in GAME_IMAGES]
+            futures += [pool.submit(run, fetch_app_details, dlc_id, web_language)
+                        for dlc_id in dlc_list]
+            for future in futures:
+                future.result()
+
+        if not cancel_event.is_set():
+            log.info(f"Prefetched game information for appid {appid}")
+
+    except requests.RequestException as e:
+        log.warning(f"Prefetch failed for appid {appid}: {e}")
+    except Exception as e:
+        log.warning(f"Prefetch error for appid {appid}: {e}")
 
 
 def get_game_dlc_info(appid, web_language, use_html_mode=False, html_file_path=None):
@@ -191,16 +832,16 @@ def get_game_dlc_info(appid, web_language, use_html_mode=False, html_file_path=N
         # Choose DLC acquisition method based on mode
         if use_html_mode:
             if not html_file_path:
-                print("HTML mode requires html_file_path parameter")
+                log.warning("HTML mode requires html_file_path parameter")
                 return {
                     'game_name': game_name,
                     'game_id': appid,
                     'dlc_list': {}
                 }
 
-            print("Using HTML file mode to get DLC information...")
-            with open(html_file_path, 'r', encoding='utf-8') as file:
-                html_content = file.read()
+            log.info("Using HTML file mode to get DLC information...")
+            with open_html_page(html_file_path) as page:
+                html_content = page.text()
 
             # Create BeautifulSoup object
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -238,16 +879,16 @@ def get_game_dlc_info(appid, web_language, use_html_mode=False, html_file_path=N
 
                     dlc_info[int(app_id)] = app_name
 
-            print(f"Game name: {game_name}")
-            print(f"Game ID: {appid}")
-            print("-" * 50)
+            log.info(f"Game name: {game_name}")
+            log.info(f"Game ID: {appid}")
+            log.debug("-" * 50)
 
             if not dlc_info:
-                print("No related DLC found in HTML file")
+                log.info("No related DLC found in HTML file")
             else:
-                print(f"Found {len(dlc_info)} related DLCs from HTML file:")
+                log.info(f"Found {len(dlc_info)} related DLCs from HTML file")
                 for dlc_id, dlc_name in dlc_info.items():
-                    print(f"DLC ID: {dlc_id} - Name: {dlc_name}")
+                    log.debug("DLC ID: %s - Name: %s", dlc_id, dlc_name)
 
             return {
                 'game_name': game_name,
@@ -260,62 +901,56 @@ def get_game_dlc_info(appid, web_language, use_html_mode=False, html_file_path=N
             # Get DLC list
             # Send request to get basic game information
 
-            # Steam Store API URL
-            url = f"https://store.steampowered.com/api/appdetails?appids={appid}&l={web_language}"
-
-            response = requests.get(url)
-            response.raise_for_status()
-
-            # Parse JSON data
-            data = response.json()
+            # Steam Store API (served from cache when prefetched)
+            data = fetch_app_details(appid, web_language)
 
             # Check if data was successfully retrieved
             if str(appid) not in data or not data[str(appid)]['success']:
-                print(f"Unable to get information for appid {appid}")
+                log.warning(f"Unable to get information for appid {appid}")
                 return {}
 
             game_data = data[str(appid)]['data']
             game_name = game_data.get('name', 'Unknown Game')
 
-            print(f"Game name: {game_name}")
-            print(f"Game ID: {appid}")
-            print("-" * 50)
+            log.info(f"Game name: {game_name}")
+            log.info(f"Game ID: {appid}")
+            log.debug("-" * 50)
             dlc_list = game_data.get('dlc', [])
 
             if not dlc_list:
-                print("This game has no DLC")
+                log.info("This game has no DLC")
                 return {
                     'game_name': game_name,
                     'game_id': appid,
                     'dlc_list': {}
                 }
 
-            print(f"Found {len(dlc_list)} DLCs:")
+            log.info(f"Found {len(dlc_list)} DLCs")
 
             # Dictionary to store DLC information
             dlc_info = {}
 
             # Get detailed information for each DLC
+            failed_count = 0
             for dlc_id in dlc_list:
-                dlc_url = f"https://store.steampowered.com/api/appdetails?appids={dlc_id}&l={web_language}"
-
                 try:
-                    dlc_response = requests.get(dlc_url)
-                    dlc_response.raise_for_status()
-                    dlc_data = dlc_response.json()
+                    dlc_data = fetch_app_details(dlc_id, web_language)
 
                     if str(dlc_id) in dlc_data and dlc_data[str(dlc_id)]['success']:
                         dlc_name = dlc_data[str(dlc_id)]['data'].get(
                             'name', f'DLC_{dlc_id}')
                         dlc_info[dlc_id] = dlc_name
-                        print(f"DLC ID: {dlc_id} - Name: {dlc_name}")
                     else:
                         dlc_info[dlc_id] = f'Unknown_DLC_{dlc_id}'
-                        print(f"DLC ID: {dlc_id} - Name: Unknown_DLC_{dlc_id}")
+                    log.debug("DLC ID: %s - Name: %s", dlc_id, dlc_info[dlc_id])
 
                 except requests.RequestException as e:
-                    print(f"Error getting DLC {dlc_id} information: {e}")
+                    log.debug("Error getting DLC %s information: %s", dlc_id, e)
                     dlc_info[dlc_id] = f'Failed_to_get_{dlc_id}'
+                    failed_count += 1
+
+            if failed_count:
+                log.warning(f"Failed to get information of {failed_count} of {len(dlc_list)} DLCs")
 
             return {
                 'game_name': game_name,
@@ -323,160 +958,4667 @@ def get_game_dlc_info(appid, web_language, use_html_mode=False, html_file_path=N
                 'dlc_list': dlc_info
             }
     except FileNotFoundError:
-        print(f"HTML file {html_file_path} not found")
+        log.warning(f"HTML file {html_file_path} not found")
         return {}
     except requests.RequestException as e:
-        print(f"Request failed: {e}")
+        log.warning(f"Request failed: {e}")
         return {}
     except json.JSONDecodeError as e:
-        print(f"JSON parsing failed: {e}")
+        log.warning(f"JSON parsing failed: {e}")
         return {}
     except Exception as e:
-        print(f"Error occurred: {e}")
+        log.warning(f"Error occurred: {e}")
         return {}
 
 
-class AchievementDisplayWindow:
-    def __init__(self, achievements, game_name):
-        self.achievements = achievements
-        self.game_name = game_name
-        self.window = tk.Toplevel()
-        self.window.title(
-            f"Achievement List - Total {len(achievements)} achievements")
-        self.window.geometry("1000x800")
+def sniff_html_encoding(head):
+    """
+    Detect the encoding of an HTML page from its first bytes
 
-        self.setup_ui()
-        self.display_achievements()
+    Args:
+        head (bytes): Beginning of the page
 
-    def setup_ui(self):
-        # Main frame
-        main_frame = ttk.Frame(self.window, padding="10")
-        main_frame.pack(fill=tk.BOTH, expand=True)
+    Returns:
+        tuple: (codec name, length of the byte order mark)
+    """
+    for bom, encoding in _HTML_BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
 
-        # Title
-        title_label = ttk.Label(main_frame, text=f"Achievement List ({len(self.achievements)} achievements)",
-                                font=("Arial", 14, "bold"))
-        title_label.pack(pady=(0, 10))
+    match = re.search(
+        rb'<meta[^>]+charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', head, re.IGNORECASE)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name, 0
+        except LookupError:
+            pass
 
-        # Create scroll box
-        self.canvas = tk.Canvas(main_frame, bg="white")
-        self.scrollbar = ttk.Scrollbar(
-            main_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+    return 'utf-8', 0
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all"))
-        )
 
-        self.canvas.create_window(
-            (0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+class HTMLPage:
+    """
+    Saved HTML page, memory-mapped and decoded once
 
-        # Bind mouse wheel
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    The encoding is sniffed from the byte order mark or <meta charset>, the
+    browser may have saved the page in any encoding.
+    """
 
-        self.canvas.bind("<MouseWheel>", _on_mousewheel)
+    def __init__(self, html_file_path):
+        self.path = html_file_path
+        self._file = open(html_file_path, 'rb')
+        try:
+            self._data = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._data = b''
+        self.encoding, self._bom_length = sniff_html_encoding(
+            self._data[:HTML_SNIFF_SIZE])
+        self._text = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._text = None
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def view(self):
+        """Raw page content (after the byte order mark) as a memoryview"""
+        return memoryview(self._data)[self._bom_length:]
+
+    def head(self, size=HTML_SNIFF_SIZE):
+        """Decode only the beginning of the page"""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        return decoder.decode(self._data[self._bom_length:self._bom_length + size])
+
+    def text(self):
+        """Whole page as str, decoded on first use only"""
+        if self._text is None:
+            with self.view() as view:
+                self._text = str(view, self.encoding, 'replace')
+        return self._text
+
+    def iter_text_chunks(self, chunk_size=HTML_CHUNK_SIZE):
+        """Decode the page chunk by chunk straight from the mapping"""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        view = self.view()
+        try:
+            for offset in range(0, len(view), chunk_size):
+                yield decoder.decode(view[offset:offset + chunk_size])
+            yield decoder.decode(b'', final=True)
+        finally:
+            view.release()
 
-        # Layout scroll components
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
 
-        # Bottom button bar
-        button_frame = ttk.Frame(self.window)
-        button_frame.pack(fill=tk.X, padx=10, pady=5)
+def read_text_chunks(html_file_path, chunk_size=HTML_CHUNK_SIZE):
+    """Read a saved HTML page (file or page store reference) in decoded chunks"""
+    with open_html_page(html_file_path) as page:
+        yield from page.iter_text_chunks(chunk_size)
 
-        ttk.Button(button_frame, text="Close Window", command=self.window.destroy).pack(
-            side=tk.RIGHT, padx=5)
 
-    def display_achievements(self):
-        """Display achievement list"""
-        if not self.achievements:
-            ttk.Label(self.scrollable_frame,
-                      text="No achievement data available").pack(pady=20)
-            return
+_PAGE_REFERENCE = re.compile(
+    r"^(?P<store>.+)#(?P<appid>\d+)/(?P<page_type>\w+)/(?P<language>\w+)(?:@(?P<saved_at>\d+))?$")
 
-        # Display each achievement
-        for i, achievement in enumerate(self.achievements):
-            self.create_achievement_widget(
-                self.scrollable_frame, achievement, i)
 
-    def create_achievement_widget(self, parent, achievement, index):
-        """Create display widget for a single achievement"""
-        # Main frame
-        achievement_frame = ttk.Frame(parent, relief=tk.RIDGE, borderwidth=1)
-        achievement_frame.pack(fill=tk.X, padx=5, pady=5)
+def parse_page_reference(path):
+    """
+    Split a page store reference ("{store}#{appid}/{page type}/{language}[@{saved at}]")
 
-        # Left side: Image area
-        image_frame = ttk.Frame(achievement_frame)
-        image_frame.pack(side=tk.LEFT, padx=10, pady=10)
+    Returns:
+        tuple: (store path, appid, page type, language, saved at or None), None for file paths
+    """
+    match = _PAGE_REFERENCE.match(path) if isinstance(path, str) else None
+    if not match:
+        return None
+    saved_at = match.group('saved_at')
+    return (match.group('store'), int(match.group('appid')), match.group('page_type'),
+            match.group('language'), int(saved_at) if saved_at else None)
+
+
+def open_html_page(html_file_path):
+    """Open a saved page, from the page store for references, otherwise from disk"""
+    if parse_page_reference(html_file_path):
+        return StoredPage(html_file_path)
+    return HTMLPage(html_file_path)
+
+
+def page_mtime(html_file_path):
+    """Get the modification time of a saved page (saved time for stored pages), None if missing"""
+    reference = parse_page_reference(html_file_path)
+    if reference is None:
+        if html_file_path and os.path.isfile(html_file_path):
+            return os.path.getmtime(html_file_path)
+        return None
+
+    store_path, appid, page_type, language, saved_at = reference
+    if not os.path.isfile(store_path):
+        return None
+    conn = PageStore.connect_read_only(store_path)
+    try:
+        row = PageStore.find_page(conn, appid, page_type, language, saved_at)
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    return row['saved_at'] if row else None
 
-        # Get game name to build path
-        game_name = self.game_name
-        safe_game_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
 
-        # Load and display normal icon
-        icon_path = achievement.get('icon', '')
-        if icon_path:
-            full_icon_path = os.path.join(
-                "Output", safe_game_name, "steam_settings", "achievement_images", icon_path)
-            if os.path.exists(full_icon_path):
-                try:
-                    img = Image.open(full_icon_path)
-                    img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
+def page_exists(html_file_path):
+    """Check if a saved page (file or page store reference) exists"""
+    return bool(html_file_path) and page_mtime(html_file_path) is not None
 
-                    icon_label = ttk.Label(image_frame, image=photo)
-                    icon_label.image = photo  # Keep reference
-                    icon_label.pack(side=tk.TOP, pady=2)
 
-                    ttk.Label(image_frame, text="Normal Icon",
-                              font=("Arial", 8)).pack()
-                except Exception as e:
-                    ttk.Label(image_frame, text="Normal Icon\nLoad Failed",
-                              width=12, anchor=tk.CENTER).pack(pady=2)
-            else:
-                ttk.Label(image_frame, text="No Normal Icon", width=12,
-                          anchor=tk.CENTER).pack(pady=2)
+class StoredPage:
+    """
+    Saved page read from the page store, same interface as HTMLPage
+
+    The compressed page is read from the database and decompressed chunk by
+    chunk; only text() holds the whole page.
+    """
+
+    def __init__(self, reference):
+        store_path, appid, page_type, language, saved_at = parse_page_reference(reference)
+        if not os.path.isfile(store_path):
+            raise FileNotFoundError(f"Page store not found: {store_path}")
+        self.path = reference
+        self._conn = PageStore.connect_read_only(store_path)
+        try:
+            row = PageStore.find_page(self._conn, appid, page_type, language, saved_at)
+            if row is None:
+                raise FileNotFoundError(f"Page not found in page store: {reference}")
+            self._rowid = row['rowid']
+            self.saved_at = row['saved_at']
+            self.codec = row['codec']
+            self._dictionary = row['dictionary']
+            self.encoding, self._bom_length = sniff_html_encoding(
+                self._read_head(HTML_SNIFF_SIZE))
+        except BaseException:
+            self._conn.close()
+            raise
+        self._text = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._text = None
+        self._conn.close()
+
+    def _iter_compressed(self, chunk_size=PAGE_STORE_READ_SIZE):
+        """Read the compressed page in chunks"""
+        if hasattr(self._conn, 'blobopen'):
+            with self._conn.blobopen('pages', 'data', self._rowid, readonly=True) as blob:
+                while True:
+                    chunk = blob.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
         else:
-            ttk.Label(image_frame, text="No Normal Icon", width=12,
-                      anchor=tk.CENTER).pack(pady=2)
+            data = self._conn.execute(
+                "SELECT data FROM pages WHERE rowid = ?", (self._rowid,)).fetchone()[0]
+            for offset in range(0, len(data), chunk_size):
+                yield data[offset:offset + chunk_size]
+
+    def iter_bytes(self):
+        """Decompress the raw page content chunk by chunk"""
+        decompressor = PageStore.decompressor(self.codec, self._dictionary)
+        for chunk in self._iter_compressed():
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+        data = decompressor.flush()
+        if data:
+            yield data
+
+    def _read_head(self, size):
+        head = bytearray()
+        chunks = self.iter_bytes()
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= size:
+                break
+        chunks.close()
+        return bytes(head[:size])
+
+    def head(self, size=HTML_SNIFF_SIZE):
+        """Decode only the beginning of the page"""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        return decoder.decode(self._read_head(self._bom_length + size)[self._bom_length:])
+
+    def text(self):
+        """Whole page as str, decoded on first use only"""
+        if self._text is None:
+            self._text = "".join(self.iter_text_chunks())
+        return self._text
+
+    def iter_text_chunks(self, chunk_size=HTML_CHUNK_SIZE):
+        """Decode the page while it is decompressed"""
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        skip = self._bom_length
+        for data in self.iter_bytes():
+            if skip:
+                data, skip = data[skip:], max(0, skip - len(data))
+            for offset in range(0, len(data), chunk_size):
+                yield decoder.decode(data[offset:offset + chunk_size])
+        yield decoder.decode(b'', final=True)
+
+
+class PageStore:
+    """
+    Compressed archive of saved SteamDB / Steam Community pages
+
+    Pages are kept in SQLite keyed by (appid, page type, language, saved at),
+    compressed with zstd when the zstandard module is installed, zlib
+    otherwise. Pages of the same type share a trained dictionary, so the
+    markup they have in common is not stored again for every page. Stored
+    pages are read through references (see parse_page_reference) wherever a
+    saved page path is accepted.
+    """
 
-        # Separator
-        ttk.Label(image_frame, text="").pack(pady=5)
+    def __init__(self, db_path=PAGE_STORE_PATH, codec=None):
+        """
+        Args:
+            db_path (str): Page store database path
+            codec (str): 'zstd' or 'zlib' for new pages, default zstd if available
+        """
+        self.db_path = db_path
+        self.codec = codec or ('zstd' if zstandard else 'zlib')
+        if self.codec not in PAGE_STORE_LEVELS:
+            raise ValueError(f"Unknown page store codec: {self.codec}")
+        if self.codec == 'zstd' and zstandard is None:
+            raise ValueError("zstd compression requires the zstandard module")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS dictionaries (
+                id INTEGER PRIMARY KEY,
+                page_type TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                appid INTEGER NOT NULL,
+                page_type TEXT NOT NULL,
+                language TEXT NOT NULL,
+                saved_at INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                dictionary_id INTEGER REFERENCES dictionaries (id),
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                source_path TEXT,
+                data BLOB NOT NULL,
+                PRIMARY KEY (appid, page_type, language, saved_at)
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_sha256 ON pages (sha256);
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def connect_read_only(db_path):
+        """Open a separate read-only connection, e.g. for one page reader"""
+        conn = sqlite3.connect(
+            f"file:{urllib.parse.quote(os.path.abspath(db_path))}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def find_page(conn, appid, page_type, language, saved_at=None):
+        """Get the row (rowid, saved_at, codec, dictionary) of a page, the newest one without saved_at"""
+        query = ("SELECT pages.rowid AS rowid, saved_at, pages.codec AS codec, dictionaries.data AS dictionary"
+                 " FROM pages LEFT JOIN dictionaries ON dictionaries.id = pages.dictionary_id"
+                 " WHERE appid = ? AND pages.page_type = ? AND language = ?")
+        params = [int(appid), page_type, language]
+        if saved_at is None:
+            query += " ORDER BY saved_at DESC LIMIT 1"
+        else:
+            query += " AND saved_at = ?"
+            params.append(int(saved_at))
+        return conn.execute(query, params).fetchone()
+
+    @staticmethod
+    def compressor(codec, dictionary=None, level=None):
+        """Create a streaming compressor (compress/flush) for codec"""
+        level = level or PAGE_STORE_LEVELS[codec]
+        if codec == 'zstd':
+            dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            return zstandard.ZstdCompressor(level=level, dict_data=dict_data).compressobj()
+        if dictionary:
+            return zlib.compressobj(level, zdict=dictionary)
+        return zlib.compressobj(level)
+
+    @staticmethod
+    def decompressor(codec, dictionary=None):
+        """Create a streaming decompressor (decompress/flush) for codec"""
+        if codec == 'zstd':
+            if zstandard is None:
+                raise ValueError("Page is zstd-compressed, install the zstandard module to read it")
+            dict_data = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+            return zstandard.ZstdDecompressor(dict_data=dict_data).decompressobj()
+        if dictionary:
+            return zlib.decompressobj(zdict=dictionary)
+        return zlib.decompressobj()
+
+    def reference(self, appid, page_type, language, saved_at=None):
+        """Get the reference of a stored page, of the newest one without saved_at"""
+        reference = f"{self.db_path}#{appid}/{page_type}/{language}"
+        return reference if saved_at is None else f"{reference}@{saved_at}"
+
+    def _train_dictionary(self, samples):
+        """Build a shared dictionary from sample pages"""
+        samples = [sample[:PAGE_DICT_SAMPLE_SIZE] for sample in samples]
+        if self.codec == 'zstd':
+            return zstandard.train_dictionary(PAGE_DICT_SIZE, samples).as_bytes()
+        # zlib matches only reach 32 KiB back, so the dictionary only helps the
+        # beginning of a page: the head markup, the same on every page
+        return samples[-1][:ZLIB_DICT_SIZE]
+
+    def _dictionary(self, page_type, samples):
+        """Get the id and data of the dictionary of a page type, trained from samples on first use"""
+        row = self._conn.execute(
+            "SELECT id, data FROM dictionaries WHERE page_type = ? AND codec = ? ORDER BY id DESC LIMIT 1",
+            (page_type, self.codec)).fetchone()
+        if row:
+            return row['id'], row['data']
+        if len(samples) < PAGE_DICT_MIN_SAMPLES:
+            return None, None
+        try:
+            data = self._train_dictionary(samples)
+        except Exception as e:
+            # Training fails on too few or too uniform samples
+            log.warning(f"Cannot train {page_type} page dictionary: {e}")
+            return None, None
+        cursor = self._conn.execute(
+            "INSERT INTO dictionaries (page_type, codec, data, created_at) VALUES (?, ?, ?, ?)",
+            (page_type, self.codec, data, time.time()))
+        log.info(f"Trained {page_type} page dictionary ({len(data)} bytes)")
+        return cursor.lastrowid, data
+
+    def add_pages(self, pages):
+        """
+        Store saved pages, pages already stored with the same content are skipped
+
+        Args:
+            pages (list): (path, page type, appid, language) of each page,
+                stored under its modification time
+
+        Returns:
+            dict: {'stored', 'duplicates', 'size', 'compressed_size'}
+        """
+        stats = {'stored': 0, 'duplicates': 0, 'size': 0, 'compressed_size': 0}
+        by_type = {}
+        for path, page_type, appid, language in pages:
+            by_type.setdefault(page_type, []).append((path, appid, language))
+
+        for page_type, entries in by_type.items():
+            contents = []
+            for path, appid, language in entries:
+                with open(path, 'rb') as f:
+                    contents.append(f.read())
+
+            with self._lock, self._conn:
+                dictionary_id, dictionary = self._dictionary(page_type, contents)
+                for (path, appid, language), content in zip(entries, contents):
+                    digest = hashlib.sha256(content).hexdigest()
+                    if self._conn.execute(
+                            "SELECT 1 FROM pages WHERE appid = ? AND page_type = ? AND language = ? AND sha256 = ?",
+                            (int(appid), page_type, language, digest)).fetchone():
+                        stats['duplicates'] += 1
+                        continue
+
+                    compressor = self.compressor(self.codec, dictionary)
+                    data = compressor.compress(content) + compressor.flush()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO pages (appid, page_type, language, saved_at, codec, dictionary_id,"
+                        " size, sha256, source_path, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (int(appid), page_type, language, int(os.path.getmtime(path)), self.codec,
+                         dictionary_id, len(content), digest, os.path.abspath(path), data))
+                    stats['stored'] += 1
+                    stats['size'] += len(content)
+                    stats['compressed_size'] += len(data)
+                    log.debug("Stored %s as %s/%s/%s (%d -> %d bytes)",
+                              path, appid, page_type, language, len(content), len(data))
+        return stats
+
+    def list_pages(self, appid=None):
+        """
+        List stored pages, newest first
+
+        Returns:
+            list: Dicts of appid, page_type, language, saved_at, size, compressed_size and reference
+        """
+        query = ("SELECT appid, page_type, language, saved_at, size, length(data) AS compressed_size"
+                 " FROM pages")
+        params = []
+        if appid is not None:
+            query += " WHERE appid = ?"
+            params.append(int(appid))
+        query += " ORDER BY appid, page_type, language, saved_at DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row, reference=self.reference(
+            row['appid'], row['page_type'], row['language'], row['saved_at'])) for row in rows]
+
+
+def _as_chunks(html_content):
+    """Wrap a whole page (str or bytes) as a single chunk, pass chunk iterables through"""
+    if isinstance(html_content, bytes):
+        encoding, bom_length = sniff_html_encoding(
+            html_content[:HTML_SNIFF_SIZE])
+        return [html_content[bom_length:].decode(encoding, errors='replace')]
+    if isinstance(html_content, str):
+        return [html_content]
+    return html_content
+
+
+class _StreamingPageParser(HTMLParser):
+    """
+    Event-driven parser base that keeps only the record being built
 
-        # Load and display gray icon
-        icon_gray_path = achievement.get(
-            'icongray', achievement.get('icon_gray', ''))
-        if icon_gray_path:
-            full_icon_gray_path = os.path.join(
-                "Output", safe_game_name, "steam_settings", "achievement_images", icon_gray_path)
-            if os.path.exists(full_icon_gray_path):
-                try:
-                    img_gray = Image.open(full_icon_gray_path)
-                    img_gray = img_gray.resize(
-                        (64, 64), Image.Resampling.LANCZOS)
-                    photo_gray = ImageTk.PhotoImage(img_gray)
+    Text is buffered until the next markup event, so a text node split across
+    chunks is still handled as one string (same as BeautifulSoup).
+    """
 
-                    icon_gray_label = ttk.Label(image_frame, image=photo_gray)
-                    icon_gray_label.image = photo_gray  # Keep reference
-                    icon_gray_label.pack(side=tk.TOP, pady=2)
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records = []
+        self._text = []
 
-                    ttk.Label(image_frame, text="Gray Icon",
-                              font=("Arial", 8)).pack()
-                except Exception as e:
-                    ttk.Label(image_frame, text="Gray Icon\nLoad Failed",
-                              width=12, anchor=tk.CENTER).pack(pady=2)
-            else:
-                ttk.Label(image_frame, text="No Gray Icon", width=12,
-                          anchor=tk.CENTER).pack(pady=2)
-        else:
-            ttk.Label(image_frame, text="No Gray Icon", width=12,
-                      anchor=tk.CENTER).pack(pady=2)
+    def drain(self):
+        """Return and forget the records completed so far"""
+        records = self.records
+        self.records = []
+        return records
 
-        # Right side: Text information
+    def _flush_text(self):
+        if self._text:
+            text = "".join(self._text)
+            self._text = []
+            # BeautifulSoup collapses whitespace-only strings the same way
+            if not text.strip(' \n\t\x0c\r'):
+                text = '\n' if '\n' in text else ' '
+            self.on_text(text)
+
+    def handle_data(self, data):
+        self._text.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        self.on_starttag(tag, dict(attrs))
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        self.on_endtag(tag)
+
+    def handle_comment(self, data):
+        # Comments are not part of the text
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+
+    def on_starttag(self, tag, attrs):
+        pass
+
+    def on_endtag(self, tag):
+        pass
+
+    def on_text(self, text):
+        pass
+
+
+class Achievement:
+    """
+    One entry of achievements.json
+
+    A slotted record instead of a dict: icon_gray is not stored, it is an
+    alias of icongray. Records also behave as read/write mappings of the
+    achievements.json keys (get, [], keys, items), in GSE's key order.
+    """
+
+    __slots__ = ('name', 'defaultvalue', 'displayName', 'hidden',
+                 'description', 'icon', 'icongray')
+
+    # Keys of an achievements.json entry, in output order
+    FIELDS = ('name', 'defaultvalue', 'displayName', 'hidden',
+              'description', 'icon', 'icongray', 'icon_gray')
+
+    def __init__(self, name="", defaultvalue=0, displayName="", hidden=0,
+                 description="", icon="", icongray=""):
+        self.name = name
+        self.defaultvalue = defaultvalue
+        self.displayName = displayName
+        self.hidden = hidden
+        self.description = description
+        self.icon = icon
+        self.icongray = icongray
+
+    @classmethod
+    def from_dict(cls, values, **changes):
+        """Create a record from an achievements.json entry (dict or Achievement), with changed fields"""
+        achievement = cls(
+            values.get('name', ""), values.get('defaultvalue', 0), values.get('displayName', ""),
+            values.get('hidden', 0), values.get('description', ""), values.get('icon', ""),
+            values.get('icongray', values.get('icon_gray', "")))
+        for key, value in changes.items():
+            achievement[key] = value
+        return achievement
+
+    def copy(self, **changes):
+        return self.from_dict(self, **changes)
+
+    @property
+    def icon_gray(self):
+        return self.icongray
+
+    @icon_gray.setter
+    def icon_gray(self, value):
+        self.icongray = value
+
+    def keys(self):
+        return self.FIELDS
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.FIELDS]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.FIELDS else default
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, (Achievement, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Achievement({self.to_dict()!r})"
+
+
+def json_default(value):
+    """json.dump default hook for Achievement records"""
+    if isinstance(value, Achievement):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_json_value(value, indent):
+    if isinstance(value, str):
+        return json.encoder.encode_basestring(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    # Nested values (e.g. per-language maps) indented like json.dump(..., indent=2)
+    return json.dumps(value, ensure_ascii=False, indent=2,
+                      default=json_default).replace("\n", "\n" + indent)
+
+
+def iter_achievements_json(achievements):
+    """
+    Stream achievements.json content record by record
+
+    Writes GSE's schema directly instead of building dicts for
+    json.JSONEncoder; the output is byte-identical to
+    json.dump(achievements, ensure_ascii=False, indent=2).
+
+    Args:
+        achievements (list): Achievement records or dicts
+
+    Yields:
+        str: JSON text, one chunk per achievement
+    """
+    if not achievements:
+        yield "[]"
+        return
+
+    encode = _encode_json_value
+    separator = "[\n"
+    for achievement in achievements:
+        items = achievement.items()
+        if not items:
+            yield separator + "  {}"
+        else:
+            yield separator + "  {\n" + ",\n".join(
+                f"    {encode(key, '')}: {encode(value, '    ')}" for key, value in items) + "\n  }"
+        separator = ",\n"
+    yield "\n]"
+
+
+class _SteamDBAchievementParser(_StreamingPageParser):
+    """Streaming parser for div.achievement blocks of a SteamDB achievement page"""
+
+    def __init__(self):
+        super().__init__()
+        self.failed_count = 0
+        self._current = None
+
+    def on_starttag(self, tag, attrs):
+        classes = (attrs.get('class') or '').split()
+        current = self._current
+
+        if current is None:
+            if tag == 'div' and 'achievement' in classes:
+                self._current = {
+                    'id': attrs.get('id') or '',
+                    'div_depth': 1,
+                    'name_depth': None,
+                    'name_parts': None,
+                    'desc_depth': None,
+                    'desc_parts': None,
+                    'i_depth': 0,
+                    'hidden': 0,
+                    'icon_img': None,
+                    'icon_gray_img': None
+                }
+            return
+
+        if tag == 'div':
+            current['div_depth'] += 1
+            if current['name_parts'] is None and 'achievement_name' in classes:
+                current['name_depth'] = current['div_depth']
+                current['name_parts'] = []
+            elif current['desc_parts'] is None and 'achievement_desc' in classes:
+                current['desc_depth'] = current['div_depth']
+                current['desc_parts'] = []
+        elif tag == 'i' and current['desc_depth'] is not None:
+            # The first <i> inside the description marks a hidden achievement
+            if current['i_depth']:
+                current['i_depth'] += 1
+            elif not current['hidden']:
+                current['hidden'] = 1
+                current['i_depth'] = 1
+        elif tag == 'img':
+            if current['icon_img'] is None and 'achievement_image' in classes:
+                current['icon_img'] = attrs
+            elif current['icon_gray_img'] is None and 'achievement_image_small' in classes:
+                current['icon_gray_img'] = attrs
+
+    def on_endtag(self, tag):
+        current = self._current
+        if current is None:
+            return
+
+        if tag == 'i' and current['i_depth']:
+            current['i_depth'] -= 1
+        elif tag == 'div':
+            if current['div_depth'] == current['name_depth']:
+                current['name_depth'] = None
+            elif current['div_depth'] == current['desc_depth']:
+                current['desc_depth'] = None
+            current['div_depth'] -= 1
+            if current['div_depth'] == 0:
+                self._current = None
+                self._finish(current)
+
+    def on_text(self, text):
+        current = self._current
+        if current is None:
+            return
+        if current['name_depth'] is not None:
+            current['name_parts'].append(text)
+        if current['desc_depth'] is not None and not current['i_depth']:
+            current['desc_parts'].append(text)
+
+    @staticmethod
+    def _stripped_text(parts):
+        # Same as BeautifulSoup get_text(strip=True)
+        return "".join(part.strip() for part in parts if part.strip())
+
+    def _finish(self, current):
+        try:
+            # Extract achievement ID
+            achievement_id = current['id']
+            name = achievement_id.replace(
+                'achievement-', '') if achievement_id.startswith('achievement-') else achievement_id
+
+            # Extract achievement name
+            display_name = self._stripped_text(
+                current['name_parts']) if current['name_parts'] is not None else ""
+
+            # Extract achievement description, without the hidden marker
+            if current['desc_parts'] is None:
+                raise ValueError(
+                    f"achievement {name} has no description element")
+            description_clean = self._stripped_text(
+                current['desc_parts']).rstrip('。')
+
+            # Extract icon
+            icon_img = current['icon_img']
+            icon = ""
+            if icon_img:
+                src = icon_img.get('src')
+                if src and '.jpg' in src:
+                    # Handle normal src path
+                    icon = src.split('/')[-1]
+                elif icon_img.get('data-name'):
+                    # Handle data-name case
+                    icon = icon_img.get('data-name')
+
+            # Extract gray icon
+            icon_gray_img = current['icon_gray_img']
+            icongray = ""
+            if icon_gray_img:
+                src = icon_gray_img.get('src')
+                if src and '.jpg' in src:
+                    icongray = src.split('/')[-1]
+                elif icon_img.get('data-name'):
+                    icongray = icon_img.get('data-name')
+
+            self.records.append(Achievement(
+                name, 0, display_name, current['hidden'], description_clean, icon, icongray))
+
+        except Exception as e:
+            log.warning(f"Error processing achievement: {e}")
+            self.failed_count += 1
+
+
+class _CommunityAchievementParser(_StreamingPageParser):
+    """Streaming parser for div.achieveRow blocks of a Steam Community achievement page"""
+
+    def __init__(self):
+        super().__init__()
+        self._current = None
+
+    def on_starttag(self, tag, attrs):
+        classes = (attrs.get('class') or '').split()
+        current = self._current
+
+        if current is None:
+            if tag == 'div' and 'achieveRow' in classes:
+                self._current = {
+                    'div_depth': 1,
+                    'icon': None,
+                    'txt_depth': None,
+                    'txt_done': False,
+                    'capture': None,
+                    'capture_depth': 0,
+                    'h3': None,
+                    'h5': None
+                }
+            return
+
+        if tag == 'div':
+            current['div_depth'] += 1
+            if current['txt_depth'] is None and not current['txt_done'] and 'achieveTxt' in classes:
+                current['txt_depth'] = current['div_depth']
+        elif tag == 'img' and current['icon'] is None:
+            current['icon'] = attrs.get('src') or ''
+        elif tag in ('h3', 'h5') and current['txt_depth'] is not None:
+            if current['capture'] == tag:
+                current['capture_depth'] += 1
+            elif current['capture'] is None and current[tag] is None:
+                current['capture'] = tag
+                current['capture_depth'] = 1
+                current[tag] = []
+
+    def on_endtag(self, tag):
+        current = self._current
+        if current is None:
+            return
+
+        if tag == current['capture']:
+            current['capture_depth'] -= 1
+            if not current['capture_depth']:
+                current['capture'] = None
+        elif tag == 'div':
+            if current['div_depth'] == current['txt_depth']:
+                current['txt_depth'] = None
+                current['txt_done'] = True
+            current['div_depth'] -= 1
+            if current['div_depth'] == 0:
+                self._current = None
+                if current['icon']:
+                    self.records.append((
+                        current['icon'].split('/')[-1],
+                        "".join(current['h3']).strip(
+                        ) if current['h3'] is not None else "",
+                        "".join(current['h5']).strip(
+                        ) if current['h5'] is not None else ""
+                    ))
+
+    def on_text(self, text):
+        current = self._current
+        if current is not None and current['capture']:
+            current[current['capture']].append(text)
+
+
+def iter_steamdb_achievements(chunks, errors=None):
+    """
+    Stream achievement records from a SteamDB achievement page
+
+    Args:
+        chunks (iterable): Page text in chunks (see read_text_chunks)
+        errors (list): Optional list, one entry is appended per achievement that failed to parse
+
+    Yields:
+        dict: Achievement data, as soon as its block is complete
+    """
+    parser = _SteamDBAchievementParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.drain()
+    parser.close()
+    yield from parser.drain()
+    if errors is not None:
+        errors.extend([None] * parser.failed_count)
+
+
+def iter_community_achievements(chunks):
+    """
+    Stream achievement rows from a Steam Community achievement page
+
+    Args:
+        chunks (iterable): Page text in chunks
+
+    Yields:
+        tuple: (icon filename, display name, description)
+    """
+    parser = _CommunityAchievementParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.drain()
+    parser.close()
+    yield from parser.drain()
+
+
+def parse_steamdb_achievements(html_content):
+    """
+    Parse a SteamDB achievement page
+
+    Args:
+        html_content (str | bytes | iterable): HTML content of the page, or its text in chunks
+
+    Returns:
+        tuple: (list of achievement data, number of achievements that failed to parse)
+    """
+    errors = []
+    achievements = list(iter_steamdb_achievements(
+        _as_chunks(html_content), errors))
+    return achievements, len(errors)
+
+
+def parse_achievement_schema(schema):
+    """
+    Convert a GetSchemaForGame response to achievements.json entries
+
+    Icons are full CDN URLs in the schema; only their filenames (the icon
+    hashes) are kept, the same as on the SteamDB page.
+
+    Args:
+        schema (dict): Decoded GetSchemaForGame response
+
+    Returns:
+        list: Achievement records, empty when the game has no achievements
+    """
+    game = schema.get('game') or {}
+    stats = game.get('availableGameStats') or {}
+    achievements = []
+    for entry in stats.get('achievements') or []:
+        icons = [urllib.parse.urlsplit(entry.get(key) or "").path.rsplit("/", 1)[-1]
+                 for key in ('icon', 'icongray')]
+        achievements.append(Achievement(
+            entry['name'], int(entry.get('defaultvalue') or 0), entry.get('displayName', ""),
+            1 if entry.get('hidden') else 0, entry.get('description') or "", *icons))
+    return achievements
+
+
+def parse_achievement_schema_file(json_file_path):
+    """Parse a saved GetSchemaForGame response"""
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        return parse_achievement_schema(json.load(f))
+
+
+def fetch_achievement_schema(appid, api_key, language="english", base_url=SCHEMA_API_URL, timeout=10):
+    """
+    Download the achievement schema of a game from the Steam Web API
+
+    Args:
+        appid (int): Steam game application ID
+        api_key (str): Steam Web API key
+        language (str): Steam language code of the display names and descriptions
+        base_url (str): GetSchemaForGame endpoint, e.g. a local stand-in server
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        list: Achievement records
+    """
+    try:
+        response = requests.get(base_url, params={'key': api_key, 'appid': appid, 'l': language},
+                                timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        # Error messages contain the request URL, keep the key out of logs
+        raise requests.RequestException(str(e).replace(api_key, "***")) from None
+    return parse_achievement_schema(response.json())
+
+
+def fetch_community_achievement_page(appid, language, timeout=None):
+    """
+    Download the Steam Community achievement page of a game
+
+    Args:
+        appid (int): Steam game application ID
+        language (str): Steam language code
+        timeout (int): Request timeout in seconds, default STEAM_REQUEST_TIMEOUT
+
+    Returns:
+        bytes: Raw HTML content of the page
+    """
+    url = f"{COMMUNITY_URL}/stats/{appid}/achievements/?l={language}"
+    response = requests.get(url, headers=COMMUNITY_HEADERS, timeout=timeout or STEAM_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def parse_community_achievements(html_content):
+    """
+    Parse a Steam Community achievement page
+
+    Args:
+        html_content (str | bytes | iterable): HTML content of the page, or its text in chunks
+
+    Returns:
+        dict: Mapping of icon filename to (display name, description)
+    """
+    translations = {}
+    for icon, display_name, description in iter_community_achievements(_as_chunks(html_content)):
+        # Keep the first row for each icon, same as the sequential lookup
+        if icon not in translations:
+            translations[icon] = (display_name, description)
+    return translations
+
+
+def parse_community_achievements_file(html_file_path):
+    """Parse a saved Steam Community achievement page without loading it at once"""
+    return parse_community_achievements(read_text_chunks(html_file_path))
+
+
+def stream_community_achievement_page(appid, language, timeout=None, chunk_size=HTML_CHUNK_SIZE):
+    """
+    Download the Steam Community achievement page of a game in chunks
+
+    Yields:
+        str: Decoded page text
+    """
+    url = f"{COMMUNITY_URL}/stats/{appid}/achievements/?l={language}"
+    with requests.get(url, headers=COMMUNITY_HEADERS, timeout=timeout or STEAM_REQUEST_TIMEOUT,
+                      stream=True) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder(
+            response.encoding or 'utf-8')(errors='replace')
+        for chunk in response.iter_content(chunk_size):
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+
+
+def get_community_localizations(appid, languages, html_dir=".", max_workers=8, saved_pages=None):
+    """
+    Get Steam Community achievement translations for several languages
+
+    Pages saved as achs_{language}.html in html_dir are read from disk, the
+    others are downloaded concurrently. Every page is parsed in a process pool
+    as soon as it is available.
+
+    Args:
+        appid (int): Steam game application ID
+        languages (list): Steam language codes
+        html_dir (str): Folder containing saved Steam Community pages
+        max_workers (int): Maximum number of concurrent downloads
+        saved_pages (dict): Saved page paths by language, take precedence over html_dir
+
+    Returns:
+        tuple: (dict of language -> parsed translations, dict of language -> error message)
+    """
+    localizations = {}
+    failures = {}
+
+    if not languages:
+        return localizations, failures
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(languages))) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(languages))) as parse_pool:
+        fetch_futures = {}
+        parse_futures = {}
+        for language in languages:
+            saved_page = (saved_pages or {}).get(language) or \
+                os.path.join(html_dir, f"achs_{language}.html")
+            if page_exists(saved_page):
+                # Saved pages are streamed from disk by the parser process
+                parse_futures[parse_pool.submit(
+                    parse_community_achievements_file, saved_page)] = language
+            else:
+                fetch_futures[fetch_pool.submit(
+                    fetch_community_achievement_page, appid, language)] = language
+
+        for future in as_completed(fetch_futures):
+            language = fetch_futures[future]
+            try:
+                parse_futures[parse_pool.submit(
+                    parse_community_achievements, future.result())] = language
+            except (requests.RequestException, OSError) as e:
+                log.warning(f"Cannot get SteamCommunity page ({language}): {e}")
+                failures[language] = str(e)
+
+        for future in as_completed(parse_futures):
+            language = parse_futures[future]
+            try:
+                localizations[language] = future.result()
+                log.info(
+                    f"SteamCommunity page parsed ({language}): {len(localizations[language])} achievements")
+            except Exception as e:
+                log.warning(f"Cannot parse SteamCommunity page ({language}): {e}")
+                failures[language] = str(e)
+
+    # Keep the requested language order so the generated JSON is stable
+    localizations = {language: localizations[language]
+                     for language in languages if language in localizations}
+    return localizations, failures
+
+
+def apply_community_localizations(achievements, localizations, fallback_language="english"):
+    """
+    Replace displayName/description with per-language maps
+
+    The SteamDB text is kept under fallback_language unless a Steam Community
+    translation exists for that language.
+
+    Args:
+        achievements (list): Achievement data extracted from SteamDB
+        localizations (dict): Language -> parsed Steam Community translations
+        fallback_language (str): Language of the SteamDB page
+
+    Returns:
+        int: Number of achievements without any matching translation
+    """
+    unmatched = 0
+
+    for achievement in achievements:
+        icon = achievement.get('icon', '')
+        display_names = {fallback_language: achievement.get('displayName', '')}
+        descriptions = {fallback_language: achievement.get('description', '')}
+        matched = False
+
+        for language, translations in localizations.items():
+            if icon not in translations:
+                continue
+            matched = True
+            display_name, description = translations[icon]
+            if display_name:
+                display_names[language] = display_name
+            if description:
+                descriptions[language] = description
+
+        if not matched:
+            unmatched += 1
+            log.debug(
+                "No matching achievements found, SteamDB achievements Page icon: %s", icon)
+
+        achievement['displayName'] = display_names
+        achievement['description'] = descriptions
+
+    return unmatched
+
+
+def add_translation_aliases(translations, icon_map):
+    """Make translations of community icons also available under the matched SteamDB icons"""
+    for steamdb_icon, community_icon in icon_map.items():
+        if steamdb_icon not in translations and community_icon in translations:
+            translations[steamdb_icon] = translations[community_icon]
+
+
+def localized_text(value, language, fallback_language="english"):
+    """Get displayable text from a plain string or a per-language map"""
+    if isinstance(value, dict):
+        return value.get(language) or value.get(fallback_language) or next(iter(value.values()), '')
+    return value
+
+
+class LocalCatalog:
+    """
+    Local SQLite catalog of apps, DLC lists and parsed achievement schemas
+
+    Every record keeps its source (e.g. store_api, steamdb_html, import), the
+    path of the source file if any, and the time it was written.
+    """
+
+    def __init__(self, db_path=CATALOG_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS apps (
+                appid INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                source TEXT NOT NULL,
+                source_path TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS dlcs (
+                appid INTEGER NOT NULL,
+                dlc_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (appid, dlc_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS achievements (
+                appid INTEGER NOT NULL,
+                language TEXT NOT NULL,
+                schema_json TEXT NOT NULL,
+                source TEXT NOT NULL,
+                source_path TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (appid, language)
+            );
+            CREATE INDEX IF NOT EXISTS idx_apps_source_path ON apps (source_path);
+            CREATE INDEX IF NOT EXISTS idx_dlcs_position ON dlcs (appid, position);
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def is_fresh(record, source_path):
+        """
+        Check if a record can be used instead of parsing source_path
+
+        Without a source file any record is used, otherwise the record must
+        come from the same file and be newer than it.
+        """
+        source_mtime = page_mtime(source_path)
+        if source_mtime is None:
+            return True
+        return (record['source_path'] == os.path.abspath(source_path)
+                and record['updated_at'] >= source_mtime)
+
+    def store_app(self, game_info, source, source_path=None):
+        """Store game name and DLC list"""
+        appid = int(game_info['game_id'])
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO apps (appid, name, source, source_path, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (appid, game_info.get('game_name', ''), source,
+                 os.path.abspath(source_path) if source_path else None, time.time()))
+            self._conn.execute("DELETE FROM dlcs WHERE appid = ?", (appid,))
+            self._conn.executemany(
+                "INSERT INTO dlcs (appid, dlc_id, position, name) VALUES (?, ?, ?, ?)",
+                ((appid, int(dlc_id), position, dlc_name)
+                 for position, (dlc_id, dlc_name) in enumerate(game_info.get('dlc_list', {}).items())))
+
+    def _load_app(self, row):
+        with self._lock:
+            dlc_rows = self._conn.execute(
+                "SELECT dlc_id, name FROM dlcs WHERE appid = ? ORDER BY position", (row['appid'],)).fetchall()
+        return {
+            'game_name': row['name'],
+            'game_id': row['appid'],
+            'dlc_list': {dlc_row['dlc_id']: dlc_row['name'] for dlc_row in dlc_rows},
+            'source': row['source'],
+            'source_path': row['source_path'],
+            'updated_at': row['updated_at']
+        }
+
+    def get_app(self, appid):
+        """Get game information by AppID, None if not cataloged"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM apps WHERE appid = ?", (int(appid),)).fetchone()
+        return self._load_app(row) if row else None
+
+    def get_app_by_source(self, source_path):
+        """Get game information parsed from a given HTML file, None if not cataloged"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM apps WHERE source_path = ? ORDER BY updated_at DESC LIMIT 1",
+                (os.path.abspath(source_path),)).fetchone()
+        return self._load_app(row) if row else None
+
+    def store_achievements(self, appid, language, achievements, source, source_path=None):
+        """Store achievement schema of a language"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO achievements (appid, language, schema_json, source, source_path, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (int(appid), language, json.dumps(achievements, ensure_ascii=False, default=json_default), source,
+                 os.path.abspath(source_path) if source_path else None, time.time()))
+
+    def get_achievements(self, appid, language):
+        """Get achievement schema of a language, None if not cataloged"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM achievements WHERE appid = ? AND language = ?", (int(appid), language)).fetchone()
+        if not row:
+            return None
+        return {
+            'achievements': [Achievement.from_dict(achievement)
+                             for achievement in json.loads(row['schema_json'])],
+            'source': row['source'],
+            'source_path': row['source_path'],
+            'updated_at': row['updated_at']
+        }
+
+
+def split_localized_achievements(achievements):
+    """
+    Split achievements with per-language maps into one plain list per language
+
+    Returns:
+        dict: Language -> achievement list (missing translations are None)
+    """
+    languages = []
+    for achievement in achievements:
+        for key in ('displayName', 'description'):
+            if isinstance(achievement.get(key), dict):
+                languages += [language for language in achievement[key]
+                              if language not in languages]
+
+    per_language = {}
+    for language in languages:
+        per_language[language] = [
+            Achievement.from_dict(achievement,
+                                  displayName=achievement['displayName'].get(language),
+                                  description=achievement['description'].get(language))
+            for achievement in achievements]
+    return per_language
+
+
+def merge_localized_achievements(per_language):
+    """Rebuild per-language displayName/description maps, reverse of split_localized_achievements"""
+    languages = list(per_language)
+    merged = []
+    for index, achievement in enumerate(per_language[languages[0]]):
+        display_names = {}
+        descriptions = {}
+        for language in languages:
+            localized = per_language[language][index]
+            if localized['displayName'] is not None:
+                display_names[language] = localized['displayName']
+            if localized['description'] is not None:
+                descriptions[language] = localized['description']
+        merged.append(Achievement.from_dict(achievement, displayName=display_names,
+                                            description=descriptions))
+    return merged
+
+
+def identify_saved_page(html_file_path):
+    """
+    Identify a saved SteamDB / Steam Community page from its head
+
+    Returns:
+        tuple: (page type, appid, language) or (None, None, None);
+               page type is one of 'info', 'achievements', 'community'.
+               Only the app page and its DLC page are 'info', other SteamDB
+               subpages (charts, depots, history...) are not recognized
+    """
+    with HTMLPage(html_file_path) as page:
+        head = page.head(65536)
+
+    # Browsers record the page URL in a "saved from url" comment, canonical link or og:url
+    urls = re.findall(
+        r'saved from url=\(\d+\)(\S+)|<link[^>]+rel="canonical"[^>]+href="([^"]+)"|<meta[^>]+property="og:url"[^>]+content="([^"]+)"',
+        head)
+    for url in (part for match in urls for part in match if part):
+        url = url.replace('&amp;', '&')
+        match = re.search(
+            r'steamcommunity\.com/stats/(\d+)/achievements', url)
+        if match:
+            language_match = re.search(r'[?&]l=(\w+)', url)
+            if language_match:
+                language = language_match.group(1)
+            else:
+                name_match = re.match(
+                    r'achs_(\w+)\.html?$', os.path.basename(html_file_path))
+                language = name_match.group(1) if name_match else "english"
+            return 'community', int(match.group(1)), language
+
+        match = re.search(r'steamdb\.info/app/(\d+)(?:/(\w*))?', url)
+        if match:
+            subpage = match.group(2) or ""
+            if subpage == 'stats':
+                return 'achievements', int(match.group(1)), "english"
+            if subpage in ('', 'dlc'):
+                return 'info', int(match.group(1)), "english"
+            return None, None, None
+
+    return None, None, None
+
+
+def find_saved_page_resources(html_file_path):
+    """Get the resource folder saved by the browser next to a page ({name}_files), None if missing"""
+    resources_dir = os.path.splitext(html_file_path)[0] + "_files"
+    return resources_dir if os.path.isdir(resources_dir) else None
+
+
+def _parse_saved_page(html_file_path, page_type):
+    """Parse one saved page (process pool worker)"""
+    if page_type == 'info':
+        return get_game_dlc_info(None, "english", True, html_file_path)
+
+    if page_type == 'achievements':
+        achievements, failed_count = parse_steamdb_achievements(
+            read_text_chunks(html_file_path))
+        return achievements
+    return parse_community_achievements_file(html_file_path)
+
+
+def find_saved_pages(folder):
+    """
+    Find and identify the saved SteamDB / Steam Community pages of a folder tree
+
+    Returns:
+        tuple: (list of (mtime, path, page type, appid, language) sorted by mtime,
+                list of skipped page paths)
+    """
+    pages = []
+    skipped = []
+
+    for root, dirs, files in os.walk(folder):
+        # Browser resource folders only contain images, scripts and styles
+        dirs[:] = [d for d in dirs if not d.endswith("_files")]
+        for file in files:
+            if not file.lower().endswith(('.html', '.htm')):
+                continue
+            path = os.path.join(root, file)
+            try:
+                page_type, appid, language = identify_saved_page(path)
+            except OSError as e:
+                log.warning(f"Cannot read {path}: {e}")
+                page_type = None
+            if page_type is None:
+                log.info(f"Skip unrecognized page: {path}")
+                skipped.append(path)
+                continue
+            pages.append((os.path.getmtime(path), path,
+                         page_type, appid, language))
+
+    # Newest pages last, so they replace older pages of the same type
+    pages.sort()
+    return pages, skipped
+
+
+def scan_saved_pages(folder, max_workers=None):
+    """
+    Scan a folder tree of saved SteamDB / Steam Community pages and build job inputs
+
+    Pages are identified by sniffing their head and parsed in a process pool.
+    When a game has several pages of the same type, the newest one is used;
+    an info page without DLC rows never replaces one with DLC rows.
+
+    Args:
+        folder (str): Folder containing saved pages (searched recursively)
+        max_workers (int): Number of parser processes, defaults to CPU count
+
+    Returns:
+        tuple: (list of job input dicts sorted by appid, list of skipped page paths)
+    """
+    pages, skipped = find_saved_pages(folder)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_parse_saved_page, path, page_type): path
+                   for mtime, path, page_type, appid, language in pages}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                log.warning(f"Failed to parse {path}: {e}")
+
+    jobs = {}
+    for mtime, path, page_type, appid, language in pages:
+        result = results.get(path)
+        if not result:
+            skipped.append(path)
+            continue
+
+        job = jobs.setdefault(appid, {
+            'appid': appid,
+            'game_name': '',
+            'dlc_list': {},
+            'info_html': None,
+            'achievement_html': None,
+            'imgs_dir': None,
+            'community_html': {},
+            'achievements': [],
+            'translations': {}
+        })
+
+        if page_type == 'info':
+            if job['dlc_list'] and not result.get('dlc_list'):
+                log.info(f"Skip info page without DLCs, {job['info_html']} has them: {path}")
+                skipped.append(path)
+                continue
+            job['game_name'] = result.get('game_name', '')
+            job['dlc_list'] = result.get('dlc_list', {})
+            job['info_html'] = path
+        elif page_type == 'achievements':
+            job['achievements'] = result
+            job['achievement_html'] = path
+            job['imgs_dir'] = find_saved_page_resources(path)
+        else:
+            job['translations'][language] = result
+            job['community_html'][language] = path
+
+    return [jobs[appid] for appid in sorted(jobs)], skipped
+
+
+def import_saved_pages(catalog, folder):
+    """
+    Import saved SteamDB Info/Achievement and Steam Community pages into the catalog
+
+    Community pages are merged with the SteamDB achievement page of the same game.
+
+    Args:
+        catalog (LocalCatalog): Target catalog
+        folder (str): Folder containing saved pages (searched recursively)
+
+    Returns:
+        dict: Number of imported pages per page type
+    """
+    jobs, skipped = scan_saved_pages(folder)
+    counts = {'info': 0, 'achievements': 0,
+              'community': 0, 'skipped': len(skipped)}
+
+    for job in jobs:
+        appid = job['appid']
+        if job['info_html']:
+            game_info = {
+                'game_name': job['game_name'],
+                'game_id': appid,
+                'dlc_list': job['dlc_list']
+            }
+            catalog.store_app(game_info, 'import', job['info_html'])
+            counts['info'] += 1
+
+        if job['achievement_html']:
+            catalog.store_achievements(
+                appid, "english", job['achievements'], 'import', job['achievement_html'])
+            counts['achievements'] += 1
+
+        for language, translations in job['translations'].items():
+            if not job['achievement_html']:
+                log.info(
+                    f"Skip Community page without SteamDB achievement page: {job['community_html'][language]}")
+                counts['skipped'] += 1
+                continue
+            achievements = [Achievement.from_dict(achievement) for achievement in job['achievements']]
+            for achievement in achievements:
+                display_name, description = translations.get(
+                    achievement.get('icon', ''), ("", ""))
+                if display_name:
+                    achievement['displayName'] = display_name
+                if description:
+                    achievement['description'] = description
+            catalog.store_achievements(
+                appid, language, achievements, 'import', job['community_html'][language])
+            counts['community'] += 1
+
+        log.info(f"Imported pages of appid {appid}")
+
+    return counts
+
+
+def store_saved_pages(folder, store_path=PAGE_STORE_PATH):
+    """
+    Archive the saved SteamDB / Steam Community pages of a folder tree in the page store
+
+    Returns:
+        dict: {'stored', 'duplicates', 'skipped', 'size', 'compressed_size'}
+    """
+    pages, skipped = find_saved_pages(folder)
+    store = PageStore(store_path)
+    try:
+        stats = store.add_pages([(path, page_type, appid, language)
+                                 for mtime, path, page_type, appid, language in pages])
+    finally:
+        store.close()
+    stats['skipped'] = len(skipped)
+    return stats
+
+
+def save_job_inputs(jobs, jobs_file_path):
+    """Save scanned job inputs as JSON"""
+    with open(jobs_file_path, 'w', encoding='utf-8') as f:
+        json.dump(jobs, f, ensure_ascii=False, indent=2, default=json_default)
+
+
+def read_pe_header(file_path):
+    """
+    Read the COFF and optional header fields of a PE file (EXE / DLL)
+
+    Returns:
+        dict: {'machine', 'is_64bit', 'is_dll', 'subsystem'}, None if not a PE file
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(1024)
+            if header[:2] != b'MZ' or len(header) < 0x40:
+                return None
+            pe_offset = struct.unpack_from('<I', header, 0x3C)[0]
+            if pe_offset + 0x60 > len(header):
+                f.seek(pe_offset)
+                header = f.read(0x60)
+                pe_offset = 0
+    except OSError:
+        return None
+
+    if len(header) < pe_offset + 0x60 or header[pe_offset:pe_offset + 4] != b'PE\0\0':
+        return None
+    machine, _, _, _, _, _, characteristics = struct.unpack_from(
+        '<HHIIIHH', header, pe_offset + 4)
+    magic = struct.unpack_from('<H', header, pe_offset + 24)[0]
+    subsystem = struct.unpack_from('<H', header, pe_offset + 24 + 68)[0]
+    return {
+        'machine': machine,
+        'is_64bit': magic == 0x20B,
+        'is_dll': bool(characteristics & 0x2000),
+        'subsystem': subsystem
+    }
+
+
+def pe_architecture(file_path):
+    """Get the architecture of a PE file ("x86", "x64", "arm64"), None if unknown or not a PE file"""
+    header = read_pe_header(file_path)
+    return PE_MACHINES.get(header['machine']) if header else None
+
+
+def _scan_directory(path):
+    """Scan one folder: (mtime_ns, [(name, size) of .exe / steam_api*.dll files], [subfolders])"""
+    files = []
+    subdirs = []
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name = entry.name.lower()
+                    if name.endswith('.exe') or (name.startswith('steam_api') and name.endswith('.dll')):
+                        files.append((entry.name, entry.stat().st_size))
+                except OSError:
+                    continue
+    except OSError:
+        return None, files, subdirs
+    return mtime, files, subdirs
+
+
+def _index_game_root(game_root, max_workers):
+    """Walk game_root with os.scandir on a thread pool, one level of folders at a time"""
+    dirs = {}
+    exes = []
+    dlls = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        level = [game_root]
+        while level:
+            next_level = []
+            for path, (mtime, files, subdirs) in zip(level, pool.map(_scan_directory, level)):
+                if mtime is None:
+                    continue
+                relative_dir = os.path.relpath(path, game_root)
+                dirs[relative_dir] = mtime
+                for name, size in files:
+                    entry = {'path': os.path.normpath(os.path.join(relative_dir, name)), 'size': size}
+                    (exes if name.lower().endswith('.exe') else dlls).append(entry)
+                next_level.extend(subdirs)
+            level = next_level
+
+    exes.sort(key=lambda entry: entry['path'])
+    dlls.sort(key=lambda entry: entry['path'])
+    return {'dirs': dirs, 'exes': exes, 'steam_api': dlls}
+
+
+def _index_is_current(game_root, index, max_workers):
+    """Check that no indexed folder was changed (added, removed or renamed entries change its mtime)"""
+    def mtime(relative_dir):
+        try:
+            return os.stat(os.path.join(game_root, relative_dir)).st_mtime_ns
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return all(current == index['dirs'][relative_dir] for relative_dir, current in
+                   zip(index['dirs'], pool.map(mtime, index['dirs'])))
+
+
+def _normalize_game_name(name):
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def rank_game_exes(game_root, exes, game_name="", steam_api_dirs=()):
+    """
+    Rank EXE candidates by how likely each one is the main game executable
+
+    Scores GUI subsystem PE files, size relative to the largest EXE, name
+    similarity to the game name, closeness to a steam_api DLL and shallow
+    paths; installers, redistributables and crash reporters rank last.
+
+    Returns:
+        list: EXE entries ({'path', 'size', 'score'}), best first, non-PE files removed
+    """
+    if not exes:
+        return []
+    max_size = max(entry['size'] for entry in exes) or 1
+    game_name = _normalize_game_name(game_name)
+
+    with ThreadPoolExecutor(max_workers=GAME_SCAN_WORKERS) as pool:
+        headers = list(pool.map(lambda entry: read_pe_header(
+            os.path.join(game_root, entry['path'])), exes))
+
+    ranked = []
+    for entry, header in zip(exes, headers):
+        if header is None or header['is_dll']:
+            continue
+        folder, name = os.path.split(entry['path'])
+        stem = _normalize_game_name(os.path.splitext(name)[0])
+        score = 2.0 * entry['size'] / max_size
+        # Windows GUI subsystem
+        score += 2.0 if header['subsystem'] == 2 else -1.0
+        if game_name and stem:
+            score += 4.0 * difflib.SequenceMatcher(None, stem, game_name).ratio()
+            if stem in game_name or game_name in stem:
+                score += 1.0
+        if folder in steam_api_dirs:
+            score += 1.0
+        if GAME_SCAN_IGNORED_EXES.search(name):
+            score -= 6.0
+        score -= 0.2 * (entry['path'].count(os.sep))
+        ranked.append(dict(entry, score=round(score, 3), is_64bit=header['is_64bit']))
+
+    ranked.sort(key=lambda entry: -entry['score'])
+    return ranked
+
+
+def scan_game_root(game_root, game_name="", cache_path=GAME_SCAN_CACHE_PATH, max_workers=GAME_SCAN_WORKERS,
+                   update_cache=True):
+    """
+    Find the main game EXE and the steam_api DLL folders of a game
+
+    The folder tree is walked with parallel os.scandir calls. The index of
+    EXE and steam_api*.dll files is cached per game root together with the
+    mtime of every folder, and reused while none of them changed.
+
+    Args:
+        game_root (str): Game root folder
+        game_name (str): Game name, used to rank EXEs by name similarity
+        cache_path (str): Index cache file, None to disable caching
+        max_workers (int): Concurrent scanning threads
+        update_cache (bool): Save a new index to the cache file
+
+    Returns:
+        dict: {'exes': ranked EXE entries (see rank_game_exes), 'steam_api_dirs':
+            folders with steam_api DLLs, closest to the best EXE first}; paths are
+            relative to game_root
+    """
+    game_root = os.path.normpath(os.path.abspath(game_root))
+    index = None
+    with _game_scan_cache_lock:
+        cache = _load_json_cache(cache_path) if cache_path else {}
+        cached = cache.get(game_root)
+        if cached and _index_is_current(game_root, cached, max_workers):
+            index = cached
+
+        if index is None:
+            index = _index_game_root(game_root, max_workers)
+            log.info(f"Scanned {len(index['dirs'])} folders of {game_root}: "
+                     f"{len(index['exes'])} EXE files, {len(index['steam_api'])} steam_api DLLs")
+            if cache_path and update_cache:
+                cache[game_root] = index
+                try:
+                    _save_json_cache(cache_path, cache)
+                except OSError as e:
+                    log.warning(f"Failed to save game scan cache: {e}")
+
+    steam_api_dirs = sorted({os.path.dirname(entry['path']) for entry in index['steam_api']})
+    exes = rank_game_exes(game_root, index['exes'], game_name, steam_api_dirs)
+
+    if exes:
+        # The steam_api DLL sharing the longest path with the EXE is the one it loads
+        exe_dir = os.path.dirname(exes[0]['path'])
+        steam_api_dirs.sort(key=lambda folder: (
+            -len(os.path.commonpath([exe_dir, folder]) if exe_dir and folder else ""),
+            folder.count(os.sep)))
+    return {'exes': exes, 'steam_api_dirs': steam_api_dirs}
+
+
+def file_digest(file_path):
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HTML_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_patch_manifest(patch_path):
+    """
+    Load the file list of a previous patch
+
+    Args:
+        patch_path (str): Patch.manifest.json written with a patch, or the previous Patch.zip itself
+
+    Returns:
+        dict: Path in zip -> {'size', 'sha256'}
+    """
+    if os.path.splitext(patch_path)[1].lower() == ".json":
+        with open(patch_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['files']
+
+    files = {}
+    with zipfile.ZipFile(patch_path) as zipf:
+        for info in zipf.infolist():
+            if info.is_dir():
+                continue
+            digest = hashlib.sha256()
+            with zipf.open(info) as f:
+                for block in iter(lambda: f.read(HTML_CHUNK_SIZE), b""):
+                    digest.update(block)
+            files[info.filename] = {
+                'size': info.file_size, 'sha256': digest.hexdigest()}
+    return files
+
+
+def diff_patch_manifests(previous_files, current_files):
+    """
+    Compare two patch file lists
+
+    Returns:
+        tuple: (added paths, changed paths, deleted paths), each sorted
+    """
+    added = sorted(path for path in current_files if path not in previous_files)
+    changed = sorted(path for path, entry in current_files.items()
+                     if path in previous_files and previous_files[path]['sha256'] != entry['sha256'])
+    deleted = sorted(
+        path for path in previous_files if path not in current_files)
+    return added, changed, deleted
+
+
+def _load_json_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json_cache(cache_path, cache):
+    # Write a temporary file and rename it, so other processes never read half a cache
+    temp_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def hash_files(file_paths, cache_path=INTEGRITY_CACHE_PATH, max_workers=None, update_cache=True):
+    """
+    Hash files in parallel, reusing hashes cached by (path, size, mtime)
+
+    Args:
+        file_paths (list): Files to hash, missing files are skipped
+        cache_path (str): Hash cache file, None to disable caching
+        max_workers (int): Concurrent hashing threads
+        update_cache (bool): Save new hashes to the cache file, dropping those of deleted files
+
+    Returns:
+        dict: Path -> {'size', 'sha256'} for the existing files
+    """
+    with _integrity_cache_lock:
+        cache = _load_json_cache(cache_path) if cache_path else {}
+
+        results = {}
+        to_hash = []
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            key = os.path.abspath(file_path)
+            cached = cache.get(key)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                results[file_path] = {'size': stat.st_size, 'sha256': cached[2]}
+            else:
+                to_hash.append((file_path, key, stat))
+
+        if to_hash:
+            # hashlib releases the GIL on large buffers, so threads hash in parallel
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for (file_path, key, stat), digest in zip(to_hash, pool.map(
+                        lambda entry: file_digest(entry[0]), to_hash)):
+                    results[file_path] = {'size': stat.st_size, 'sha256': digest}
+                    cache[key] = [stat.st_size, stat.st_mtime_ns, digest]
+
+            if cache_path and update_cache:
+                # Drop the hashes of deleted files, so the cache does not grow forever
+                for key in [key for key in cache if not os.path.exists(key)]:
+                    del cache[key]
+                try:
+                    _save_json_cache(cache_path, cache)
+                except OSError as e:
+                    log.warning(f"Failed to save integrity cache: {e}")
+
+    return results
+
+
+def write_source_manifest(manifest_path=SOURCE_MANIFEST_PATH, source_dir="source", cache_path=INTEGRITY_CACHE_PATH):
+    """
+    Record the hashes of a known-good source folder
+
+    Returns:
+        int: Number of files recorded
+    """
+    file_paths = []
+    for root, dirs, files in os.walk(source_dir):
+        for file in files:
+            file_paths.append(os.path.join(root, file))
+
+    hashes = hash_files(file_paths, cache_path)
+    manifest = {file_path.replace(os.sep, '/'): entry
+                for file_path, entry in sorted(hashes.items())}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'files': manifest}, f, ensure_ascii=False, indent=2)
+    return len(manifest)
+
+
+def verify_source_integrity(manifest_path=SOURCE_MANIFEST_PATH, cache_path=INTEGRITY_CACHE_PATH, update_cache=True):
+    """
+    Check source files (including GSE_DLL) against the known-good manifest
+
+    Args:
+        manifest_path (str): Manifest written by write_source_manifest
+        cache_path (str): Hash cache file
+        update_cache (bool): Save new hashes to the cache file, dropping those of deleted files
+
+    Returns:
+        dict: {'missing': [paths], 'corrupted': [paths], 'verified': count},
+            None if there is no manifest
+    """
+    if not os.path.isfile(manifest_path):
+        return None
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        expected = json.load(f)['files']
+
+    hashes = hash_files(list(expected), cache_path,
+                        update_cache=update_cache)
+    missing = sorted(path for path in expected if path not in hashes)
+    corrupted = sorted(path for path, entry in expected.items()
+                       if path in hashes and (hashes[path]['size'] != entry['size']
+                                              or hashes[path]['sha256'] != entry['sha256']))
+    return {'missing': missing, 'corrupted': corrupted,
+            'verified': len(expected) - len(missing) - len(corrupted)}
+
+
+def _bundle_object_name(digest):
+    return f"{BUNDLE_OBJECTS_DIR}/{digest}"
+
+
+def export_bundle(game_dirs, bundle_path, cache_path=BUNDLE_CACHE_PATH):
+    """
+    Pack generated game folders into one archive, storing each unique file once
+
+    Files are stored by content hash; every game gets a manifest of its
+    relative paths. Zip files in the game folders (Patch.zip, delta patches)
+    are stored as their member lists, so the GSE DLLs and steam_settings
+    files they repeat are deduplicated as well.
+
+    Args:
+        game_dirs (list): Generated game folders (e.g. Output/{Game Name})
+        bundle_path (str): Bundle archive to write
+        cache_path (str): Hash cache file, None to disable caching
+
+    Returns:
+        dict: {'games', 'files', 'unique_files', 'size', 'unique_size'}
+    """
+    games = {}
+    file_paths = {}
+    for game_dir in game_dirs:
+        name = os.path.basename(os.path.normpath(game_dir))
+        if name in games:
+            raise ValueError(f"Duplicate game folder name: {name}")
+        games[name] = {'files': {}, 'archives': {}}
+        for root, dirs, files in os.walk(game_dir):
+            for file in files:
+                file_path = os.path.join(root, file)
+                relative_path = os.path.relpath(file_path, game_dir).replace(os.sep, '/')
+                file_paths[file_path] = (name, relative_path)
+
+    objects = {}
+    object_sources = {}
+    stats = {'games': len(games), 'files': 0, 'unique_files': 0, 'size': 0, 'unique_size': 0}
+
+    def add_object(digest, size, source):
+        stats['files'] += 1
+        stats['size'] += size
+        if digest not in objects:
+            objects[digest] = size
+            object_sources[digest] = source
+
+    hashes = hash_files(list(file_paths), cache_path)
+    for file_path in sorted(hashes):
+        name, relative_path = file_paths[file_path]
+        entry = hashes[file_path]
+        if relative_path.lower().endswith('.zip') and zipfile.is_zipfile(file_path):
+            members = []
+            with zipfile.ZipFile(file_path) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    content = archive.read(info)
+                    digest = hashlib.sha256(content).hexdigest()
+                    members.append({'name': info.filename, 'sha256': digest,
+                                    'date_time': list(info.date_time)})
+                    add_object(digest, len(content), (file_path, info.filename))
+            games[name]['archives'][relative_path] = members
+        else:
+            games[name]['files'][relative_path] = entry['sha256']
+            add_object(entry['sha256'], entry['size'], (file_path, None))
+
+    temp_path = f"{bundle_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as bundle:
+            open_archives = {}
+            try:
+                for digest in sorted(object_sources):
+                    file_path, member = object_sources[digest]
+                    compress_type = zipfile.ZIP_STORED if (member or file_path).lower().endswith(
+                        BUNDLE_STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                    if member is None:
+                        bundle.write(file_path, _bundle_object_name(digest), compress_type)
+                        continue
+                    if file_path not in open_archives:
+                        open_archives[file_path] = zipfile.ZipFile(file_path)
+                    bundle.writestr(_bundle_object_name(digest),
+                                    open_archives[file_path].read(member), compress_type)
+            finally:
+                for archive in open_archives.values():
+                    archive.close()
+            bundle.writestr(BUNDLE_MANIFEST_NAME, json.dumps(
+                {'version': 1, 'games': games, 'objects': objects}, ensure_ascii=False, indent=2))
+        os.replace(temp_path, bundle_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    stats['unique_files'] = len(objects)
+    stats['unique_size'] = sum(objects.values())
+    return stats
+
+
+def extract_bundle(bundle_path, dest_dir="Output", games=None, max_workers=None):
+    """
+    Recreate the game folders stored in a bundle
+
+    Every unique object is read from the bundle once and written to all
+    the paths using it; objects are extracted in parallel, each thread with
+    its own handle of the bundle.
+
+    Args:
+        bundle_path (str): Bundle written by export_bundle
+        dest_dir (str): Folder to recreate the game folders in
+        games (list): Game folder names to extract, None for all
+        max_workers (int): Concurrent extracting threads
+
+    Returns:
+        list: Extracted game folder names
+    """
+    with zipfile.ZipFile(bundle_path) as bundle:
+        manifest = json.loads(bundle.read(BUNDLE_MANIFEST_NAME))
+
+    selected = {name: game for name, game in manifest['games'].items()
+                if games is None or name in games}
+    missing = set(games or ()) - set(selected)
+    if missing:
+        raise ValueError(f"Games not in bundle: {', '.join(sorted(missing))}")
+
+    def target_path(name, relative_path):
+        game_dir = os.path.normpath(os.path.join(dest_dir, name))
+        path = os.path.normpath(os.path.join(game_dir, relative_path))
+        if not is_plain_filename(name) or not ConfigGenerator.is_within(game_dir, path) or path == game_dir:
+            raise ValueError(f"Invalid path in bundle: {name}/{relative_path}")
+        return path
+
+    destinations = {}
+    for name, game in selected.items():
+        for relative_path, digest in game['files'].items():
+            destinations.setdefault(digest, []).append(target_path(name, relative_path))
+
+    local = threading.local()
+    handles = []
+
+    def extract_object(digest):
+        if not hasattr(local, 'bundle'):
+            local.bundle = zipfile.ZipFile(bundle_path)
+            handles.append(local.bundle)
+        content = local.bundle.read(_bundle_object_name(digest))
+        for path in destinations[digest]:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(content)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(extract_object, destinations))
+    finally:
+        for handle in handles:
+            handle.close()
+
+    # Rebuild zip files from their members, reading objects shared by several zips once
+    with zipfile.ZipFile(bundle_path) as bundle:
+        contents = {}
+        for name, game in selected.items():
+            for relative_path, members in game['archives'].items():
+                path = target_path(name, relative_path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                    for member in members:
+                        if member['sha256'] not in contents:
+                            contents[member['sha256']] = bundle.read(
+                                _bundle_object_name(member['sha256']))
+                        info = zipfile.ZipInfo(member['name'], tuple(member['date_time']))
+                        info.compress_type = zipfile.ZIP_DEFLATED
+                        archive.writestr(info, contents[member['sha256']])
+
+    return sorted(selected)
+
+
+class AtomicWriter:
+    """
+    Write generated files atomically and skip unchanged ones
+
+    Content is first compared with the existing target while it is streamed;
+    when they are the same, nothing is written and the target is left
+    untouched. Otherwise, from the first difference on, content goes into a
+    temporary file next to the target, which is fsynced and renamed over the
+    target, so an interrupted run never leaves a half-written file. Renames
+    are made durable by sync(), which fsyncs each touched folder once (called
+    after every generation stage).
+
+    Newlines are written as os.linesep, like files opened in text mode.
+    """
+
+    def __init__(self):
+        self._dirty_dirs = set()
+        self.written = 0
+        self.unchanged = 0
+
+    @staticmethod
+    def encode_chunks(content, encoding='utf-8'):
+        """Encode str / bytes content or an iterable of chunks to bytes chunks"""
+        if isinstance(content, (str, bytes)):
+            content = (content,)
+        for chunk in content:
+            if isinstance(chunk, str):
+                if os.linesep != "\n":
+                    chunk = chunk.replace("\n", os.linesep)
+                chunk = chunk.encode(encoding)
+            yield chunk
+
+    @classmethod
+    def content_size(cls, content, encoding='utf-8'):
+        """Size in bytes content would have on disk"""
+        return sum(len(chunk) for chunk in cls.encode_chunks(content, encoding))
+
+    def write(self, path, content, encoding='utf-8'):
+        """
+        Write content to path atomically
+
+        Args:
+            path (str): Target file, its folder is created when missing
+            content: str, bytes, or an iterable of str / bytes chunks (e.g. an emitter)
+            encoding (str): Encoding of str chunks
+
+        Returns:
+            bool: True if the file was written, False if it was unchanged
+        """
+        folder = os.path.dirname(path) or "."
+        os.makedirs(folder, exist_ok=True)
+
+        chunks = self.encode_chunks(content, encoding)
+        try:
+            existing = open(path, "rb")
+        except OSError:
+            existing = None
+
+        temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            # Compare with the existing file before creating anything
+            first_chunk = b""
+            matched = 0
+            if existing:
+                for chunk in chunks:
+                    if existing.read(len(chunk)) != chunk:
+                        first_chunk = chunk
+                        break
+                    matched += len(chunk)
+                else:
+                    if not existing.read(1):
+                        self.unchanged += 1
+                        return False
+                existing.seek(0)
+
+            # os.open applies the umask like a plain open()
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT |
+                         os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+            with open(fd, "wb") as f:
+                # The matching start is copied from the existing file
+                while matched > 0:
+                    block = existing.read(min(HTML_CHUNK_SIZE, matched))
+                    if not block:
+                        raise OSError(f"{path} changed while it was written")
+                    f.write(block)
+                    matched -= len(block)
+                f.write(first_chunk)
+                for chunk in chunks:
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Windows cannot rename over an open file
+            if existing:
+                existing.close()
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            if existing:
+                existing.close()
+
+        self._dirty_dirs.add(folder)
+        self.written += 1
+        return True
+
+    def sync(self):
+        """fsync every folder with renamed files once"""
+        for folder in self._dirty_dirs:
+            try:
+                fd = os.open(folder, os.O_RDONLY)
+            except OSError:
+                # Folders cannot be opened on Windows, renames are durable there
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        self._dirty_dirs.clear()
+
+
+class FileWatcher:
+    """
+    Watch files and folders and report changes in debounced batches
+
+    Uses inotify on Linux and falls back to polling (size, mtime) snapshots
+    elsewhere. Files are watched through their parent folder, so replacing a
+    file (as browsers do when re-saving a page) is reported as well.
+    """
+
+    # inotify event masks
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_IGNORED = 0x00008000
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | \
+        IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, targets, callback, debounce=WATCH_DEBOUNCE_SECONDS, poll_interval=WATCH_POLL_INTERVAL):
+        """
+        Args:
+            targets (dict): Watched paths by key
+            callback (callable): callback(keys) with the set of changed keys, called from the watcher thread
+            debounce (float): Seconds without changes before a batch is reported
+            poll_interval (float): Seconds between snapshots in polling mode
+        """
+        self.targets = {key: os.path.abspath(path)
+                        for key, path in targets.items() if path}
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching, a batch being processed still completes"""
+        self._stop_event.set()
+
+    def _run(self):
+        # inotify is Linux only (on Windows there is no libc to load)
+        if not sys.platform.startswith("linux"):
+            self._run_polling()
+            return
+        try:
+            self._run_inotify()
+        except (OSError, AttributeError, TypeError) as e:
+            log.info(f"inotify not available ({e}), polling for changes")
+            self._run_polling()
+
+    def _report(self, pending):
+        try:
+            self.callback(pending)
+        except Exception as e:
+            log.warning(f"Failed to process changes: {e}")
+
+    def _run_inotify(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        try:
+            # wd -> [(key, path, whole folder)]
+            watches = {}
+
+            def add_watches():
+                watches.clear()
+                for key, path in self.targets.items():
+                    # Parent folder catches the target being created, replaced or deleted
+                    watched = [(os.path.dirname(path), False)]
+                    if os.path.isdir(path):
+                        watched.append((path, True))
+                    for folder, whole_folder in watched:
+                        wd = libc.inotify_add_watch(
+                            fd, os.fsencode(folder), self.WATCH_MASK)
+                        if wd >= 0:
+                            watches.setdefault(wd, []).append(
+                                (key, path, whole_folder))
+
+            add_watches()
+            pending = set()
+            last_change = 0
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([fd], [], [], 0.2)
+                if readable:
+                    rewatch = False
+                    data = os.read(fd, 64 * 1024)
+                    offset = 0
+                    while offset < len(data):
+                        wd, mask, _, name_length = struct.unpack_from(
+                            "iIII", data, offset)
+                        name = data[offset + 16:offset + 16 +
+                                    name_length].rstrip(b"\0")
+                        offset += 16 + name_length
+                        if mask & self.IN_IGNORED:
+                            rewatch = True
+                            continue
+                        for key, path, whole_folder in watches.get(wd, []):
+                            if whole_folder or os.fsdecode(name) == os.path.basename(path):
+                                pending.add(key)
+                                last_change = time.monotonic()
+                    if rewatch or pending:
+                        # Folders may have been recreated
+                        add_watches()
+
+                if pending and time.monotonic() - last_change >= self.debounce:
+                    self._report(pending)
+                    pending = set()
+        finally:
+            os.close(fd)
+
+    def _snapshot(self, path):
+        try:
+            if os.path.isdir(path):
+                with os.scandir(path) as entries:
+                    return tuple(sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                                        for entry in entries))
+            stat = os.stat(path)
+            return (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def _run_polling(self):
+        snapshots = {key: self._snapshot(path)
+                     for key, path in self.targets.items()}
+        pending = set()
+        last_change = 0
+        while not self._stop_event.wait(self.poll_interval):
+            for key, path in self.targets.items():
+                snapshot = self._snapshot(path)
+                if snapshot != snapshots[key]:
+                    snapshots[key] = snapshot
+                    pending.add(key)
+                    last_change = time.monotonic()
+
+            if pending and time.monotonic() - last_change >= self.debounce:
+                self._report(pending)
+                pending = set()
+
+
+class GenerationCancelled(Exception):
+    """Raised by ConfigGenerator.run when the run was cancelled"""
+
+
+class ConfigGenerator:
+    """
+    Generate the GSE configuration of one game, independent of the GUI
+
+    Each generation step is a stage, so a run can execute all of them or only
+    the ones affected by a changed input (see WATCH_STAGES).
+
+    Settings keys (see DEFAULT_SETTINGS):
+        appid, game_name, dlc_list: Game information; loaded from info_html,
+            the local catalog or the Steam Store API when game_name is missing
+        info_html, achievement_html, imgs_dir: SteamDB pages and achievement images
+        achievement_schema, schema_api_key, schema_api_url: Achievements from a saved
+            GetSchemaForGame response or the Steam Web API, when there is no SteamDB page
+        download_icons, icon_cache_dir: Download achievement images missing from
+            imgs_dir from the Steam CDN, kept in the icon cache
+        generate_gray_icons: Generate gray icons for achievements without one
+        community_html: Saved Steam Community pages, {language: path}
+        use_community: Translate achievements with the Steam Community page of language
+        community_languages: Languages for multi-language achievements
+        username, userid, language, local_storage, overlay: configs.user.ini / overlay options
+        game_root, exe_path, use_custom_ico, custom_ico_path: Game EXE and launcher icon
+        generate_patch, patch_type, steamapi_dll_path: Patch.zip generation
+        match_dll_architecture: Only package the GSE steam_api DLLs the game has
+        delta_patch, previous_patch: Also package the changes since a previous
+            Patch.zip or Patch.manifest.json (default: manifest of the last patch)
+        use_catalog, output_root, temp_dir: Local catalog and working folders
+    """
+
+    DEFAULT_SETTINGS = {
+        'appid': None,
+        'game_name': None,
+        'dlc_list': None,
+        'info_html': None,
+        'achievement_html': None,
+        'achievement_schema': None,
+        'schema_api_key': None,
+        'schema_api_url': SCHEMA_API_URL,
+        'imgs_dir': "imgs",
+        'download_icons': True,
+        'icon_cache_dir': ICON_CACHE_DIR,
+        'generate_gray_icons': True,
+        'community_html': {},
+        'use_community': False,
+        'community_languages': [],
+        'username': "O.T",
+        'userid': "76561198964222222",
+        'language': "english",
+        'local_storage': True,
+        'overlay': True,
+        'game_root': "",
+        'exe_path': "",
+        'use_custom_ico': False,
+        'custom_ico_path': "",
+        'generate_patch': False,
+        'patch_type': "",
+        'steamapi_dll_path': "",
+        'match_dll_architecture': True,
+        'delta_patch': False,
+        'previous_patch': "",
+        'use_catalog': True,
+        'output_root': "Output",
+        'temp_dir': "_temp"
+    }
+
+    # Stages of a full run, in order
+    STAGES = [
+        'copy_source',
+        'exe',
+        'achievements',
+        'config',
+        'game_images',
+        'loader_ini',
+        'remove_loader',
+        'patch'
+    ]
+
+    # Stages re-run in watch mode when a watched input changes
+    WATCH_STAGES = {
+        'achievement_html': ['achievements', 'patch'],
+        'achievement_schema': ['achievements', 'patch'],
+        'community_html': ['achievements', 'patch'],
+        'imgs_dir': ['achievement_images', 'patch'],
+        'info_html': ['game_info', 'config', 'loader_ini', 'patch'],
+        'exe_path': ['exe', 'loader_ini'],
+        'custom_ico_path': ['exe'],
+        'steamapi_dll_path': ['patch']
+    }
+
+    def __init__(self, settings, catalog=None, notify=None, ask_retry=None, status=None, progress=None):
+        """
+        Args:
+            settings (dict): Job settings, missing keys use DEFAULT_SETTINGS
+            catalog (LocalCatalog): Local catalog, None to disable
+            notify (callable): notify(level, title, message) for warnings and errors, level is 'warning' or 'error'
+            ask_retry (callable): ask_retry(error) -> bool, whether to retry a failed Steam Community download
+            status (callable): status(text) for progress messages
+            progress (callable): progress(done, total) after each stage
+        """
+        self.settings = dict(self.DEFAULT_SETTINGS)
+        self.settings.update(
+            {key: value for key, value in settings.items() if value is not None})
+        self.catalog = catalog
+        self.notify = notify or (lambda level, title, message: log.info(
+            f"{title}: {message}"))
+        self.ask_retry = ask_retry or (lambda error: False)
+        self.status = status or (lambda text: log.info(text))
+        self.progress = progress or (lambda done, total: None)
+        self.cancel_event = threading.Event()
+        # Counters of the running stage, logged as its summary
+        self.stats = Counter()
+
+        self.game_info = {}
+        self.achievements = []
+        self.has_resource_hacker = os.path.exists("tool/ResourceHacker.exe")
+        self.icon_replacement_failed = False
+        self.achievement_processing_failed = False
+        self.exe_valid = True
+        self.writer = AtomicWriter()
+
+        # Achievements parsed beforehand (e.g. by scan_saved_pages) are used on the first run
+        self._preparsed_achievements = settings.get('achievements') or None
+
+    def cancel(self):
+        """Stop a run before its next stage"""
+        self.cancel_event.set()
+
+    def clone(self, settings=None, notify=None, status=None):
+        """
+        Create a generator for another run on the results of this one (e.g. a patch job)
+
+        Args:
+            settings (dict): Settings replacing those of this generator
+            notify, status: Callbacks of the new run (see __init__)
+        """
+        generator = ConfigGenerator(dict(self.settings, **(settings or {})), self.catalog,
+                                    notify=notify, status=status)
+        generator.game_info = dict(self.game_info)
+        generator.achievements = list(self.achievements)
+        generator.has_resource_hacker = self.has_resource_hacker
+        generator.icon_replacement_failed = self.icon_replacement_failed
+        generator.achievement_processing_failed = self.achievement_processing_failed
+        generator.exe_valid = self.exe_valid
+        return generator
+
+    @property
+    def safe_game_name(self):
+        game_name = self.game_info.get('game_name', 'Game')
+        return re.sub(r'[<>:"/\\|?*]', '_', game_name)
+
+    @property
+    def output_dir(self):
+        return os.path.join(self.settings['output_root'], self.safe_game_name)
+
+    @property
+    def appid(self):
+        return str(self.game_info.get('game_id', self.settings['appid'] or '')).strip()
+
+    @property
+    def multi_language(self):
+        return bool(self.settings['community_languages'])
+
+    @staticmethod
+    def get_relative_path(base_path, target_path):
+        """Get relative path"""
+        base_path = os.path.normpath(base_path)
+        target_path = os.path.normpath(target_path)
+
+        # Use os.path.relpath to get relative path
+        try:
+            relative_path = os.path.relpath(target_path, base_path)
+            # If relative path starts with .., it means target_path is not under base_path
+            if relative_path.startswith('..'):
+                return target_path
+            return relative_path
+        except ValueError:
+            # Different drive case
+            return target_path
+
+    @staticmethod
+    def is_within(base_path, target_path):
+        """Check if target_path is inside base_path"""
+        try:
+            return os.path.commonpath([base_path, target_path]) == os.path.normpath(base_path)
+        except ValueError:
+            # Different drive, or absolute and relative paths mixed
+            return False
+
+    def validate_inputs(self):
+        """
+        Check game root and EXE selection
+
+        Returns:
+            str: Error message, None if the inputs are valid
+        """
+        game_root_path = self.settings['game_root'].strip()
+        exe_path = self.settings['exe_path'].strip()
+
+        if not game_root_path or not os.path.exists(game_root_path):
+            return "Please select a valid game root directory"
+
+        if not exe_path or not os.path.isfile(exe_path) or not exe_path.endswith(".exe"):
+            return "Please select an EXE file"
+
+        if not self.is_within(game_root_path, exe_path):
+            return "Please select a valid game EXE file within the game root directory"
+
+        return None
+
+    def detect_game_files(self, update_cache=True):
+        """
+        Fill exe_path and steamapi_dll_path (patch jobs) from a scan of game_root when they are not set
+
+        Args:
+            update_cache (bool): Save a new scan to the game scan cache, False for dry runs
+
+        Returns:
+            dict: Scan result (see scan_game_root), None if nothing was missing
+        """
+        settings = self.settings
+        game_root_path = settings['game_root'].strip()
+        needs_exe = not settings['exe_path'].strip()
+        needs_steamapi = settings['generate_patch'] and not settings['steamapi_dll_path']
+        if not (needs_exe or needs_steamapi) or not os.path.isdir(game_root_path):
+            return None
+
+        result = scan_game_root(game_root_path, self.game_info.get(
+            'game_name') or settings['game_name'] or "", update_cache=update_cache)
+        if needs_exe and result['exes']:
+            settings['exe_path'] = os.path.join(game_root_path, result['exes'][0]['path'])
+            log.info(f"Detected game EXE: {settings['exe_path']}")
+        if needs_steamapi and result['steam_api_dirs']:
+            settings['steamapi_dll_path'] = os.path.normpath(
+                os.path.join(game_root_path, result['steam_api_dirs'][0]))
+            log.info(f"Detected steamapi dll folder: {settings['steamapi_dll_path']}")
+        return result
+
+    def plan(self):
+        """
+        Compute the output of a full run without writing anything
+
+        Resolves every input, lists the files a run would write with their
+        sizes and sources, the Patch.zip layout, and problems that would make
+        the run fail (errors) or produce incomplete output (warnings).
+        Sizes are None when they are only known after the run (icon
+        replacement, downloads, compression).
+
+        Returns:
+            dict: {'output_dir', 'files': [{'path', 'size', 'source'}],
+                'zip_layout': [path in Patch.zip], 'problems': [{'level', 'message'}],
+                'total_size', 'ok'}
+        """
+        settings = self.settings
+        problems = []
+        files = {}
+
+        def problem(level, message):
+            problems.append({'level': level, 'message': message})
+
+        def add_file(relative_path, size, source):
+            files[relative_path.replace('\\', '/')] = {
+                'path': relative_path.replace('\\', '/'), 'size': size, 'source': source}
+
+        def file_size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return None
+
+        error = self.validate_inputs()
+        if error:
+            problem('error', error)
+
+        for file in CORE_FILES:
+            if not os.path.exists(os.path.join("source", file)):
+                problem('error', f"Core file missing: source/{file}")
+        if settings['overlay']:
+            for file in OVERLAY_FILES:
+                if not os.path.exists(os.path.join("source", file)):
+                    problem('warning', f"Overlay file missing: source/{file}")
+
+        integrity = verify_source_integrity(update_cache=False)
+        if integrity:
+            patch_files = PATCH_FILES.get(
+                settings['patch_type'], []) if settings['generate_patch'] else []
+            for path in integrity['corrupted']:
+                file = os.path.relpath(path, "source").replace(os.sep, '/')
+                level = 'error' if file in CORE_FILES or path in patch_files else 'warning'
+                problem(level, f"Source file corrupted: {path}")
+
+        info_html = settings['info_html']
+        if info_html and not (os.path.splitext(info_html)[1].lower() == '.html'
+                              or parse_page_reference(info_html)):
+            problem('warning', f"Game info page is not an HTML file: {info_html}")
+        if not self.game_info:
+            try:
+                self.load_game_info(store=False)
+            except Exception as e:
+                problem('error', f"Failed to get game information: {e}")
+        if not self.game_info:
+            problem('error', "Failed to get game information")
+            return {'output_dir': None, 'files': [], 'zip_layout': [],
+                    'problems': problems, 'total_size': 0, 'ok': False}
+
+        # Source folder (GSE_DLL is packaged into Patch.zip only, the loader is renamed)
+        source_dir = "source"
+        if os.path.exists(source_dir):
+            for root, dirs, filenames in os.walk(source_dir):
+                relative_root = os.path.relpath(root, source_dir)
+                if relative_root.split(os.sep)[0] == "GSE_DLL":
+                    continue
+                for filename in filenames:
+                    relative_path = os.path.normpath(
+                        os.path.join(relative_root, filename))
+                    if relative_path == "steamclient_loader_x64.exe":
+                        continue
+                    if relative_path == os.path.normpath("steam_settings/configs.overlay.ini") and not settings['overlay']:
+                        continue
+                    add_file(relative_path, file_size(os.path.join(root, filename)),
+                             os.path.join(root, filename))
+
+        # Launcher EXE
+        source_loader = os.path.join("source", "steamclient_loader_x64.exe")
+        exe_name = f"{self.safe_game_name}.exe"
+        if not self.has_resource_hacker:
+            problem('warning', "tool/ResourceHacker.exe missing, EXE icon will not be replaced")
+            add_file(exe_name, file_size(source_loader), source_loader)
+        elif settings['use_custom_ico']:
+            if not settings['custom_ico_path'] or not os.path.isfile(settings['custom_ico_path']):
+                problem('warning', f"Custom ICO file not found: {settings['custom_ico_path']}")
+            add_file(exe_name, None,
+                     f"{source_loader} with icon of {settings['custom_ico_path']}")
+        else:
+            add_file(exe_name, None,
+                     f"{source_loader} with icon of {settings['exe_path']}")
+
+        # ColdClientLoader.ini
+        ini_source = os.path.join(source_dir, "ColdClientLoader.ini")
+        if os.path.exists(ini_source) and not error:
+            with open(ini_source, 'r', encoding='utf-8') as f:
+                content, _, _ = self.build_cold_client_loader_ini(f.read())
+            add_file("ColdClientLoader.ini", AtomicWriter.content_size(content),
+                     "source/ColdClientLoader.ini (updated)")
+
+        # Config files
+        add_file("steam_settings/configs.user.ini",
+                 AtomicWriter.content_size(self.emit_user_config()), "generated")
+        if self.has_app_config():
+            add_file("steam_settings/configs.app.ini",
+                     AtomicWriter.content_size(self.emit_app_config()), "generated")
+        add_file("steam_settings/steam_appid.txt",
+                 AtomicWriter.content_size(self.appid), "generated")
+
+        # Game images
+        for image_file in GAME_IMAGES:
+            temp_image_path = os.path.join(settings['temp_dir'], image_file)
+            if os.path.exists(temp_image_path):
+                add_file(f"steam_settings/{image_file}",
+                         file_size(temp_image_path), temp_image_path)
+            else:
+                add_file(f"steam_settings/{image_file}", None,
+                         f"Steam CDN ({self.appid}/{image_file})")
+
+        # Achievements (Steam Community translations are applied during the run)
+        achievement_html = settings['achievement_html']
+        achievements = self.load_catalog_achievements()
+        if achievements is None and self._preparsed_achievements:
+            achievements = self._preparsed_achievements
+        if self.achievement_processing_failed:
+            achievements = None
+        elif achievements is None and achievement_html:
+            if not (os.path.splitext(achievement_html)[1].lower() in ('.html', '.htm')
+                    or parse_page_reference(achievement_html)):
+                problem('warning', f"Achievement page is not an HTML file: {achievement_html}")
+            elif not page_exists(achievement_html):
+                problem('warning', f"Achievement page not found: {achievement_html}")
+            else:
+                achievements, failed_count = parse_steamdb_achievements(
+                    read_text_chunks(achievement_html))
+                if failed_count:
+                    problem('warning', f"Error processing {failed_count} achievements")
+                if not achievements:
+                    problem('warning', "No achievement data in the achievement page")
+                # The run reuses the parsed page
+                self._preparsed_achievements = achievements
+        if (achievements is None and not self.achievement_processing_failed
+                and not page_exists(achievement_html)
+                and self.has_schema_source()):
+            try:
+                achievements = self.load_schema_achievements()
+            except (requests.RequestException, OSError, ValueError, KeyError) as e:
+                problem('warning', f"Cannot get the achievement schema: {e}")
+            else:
+                if not achievements:
+                    problem('warning', "No achievements in the achievement schema")
+                self._preparsed_achievements = achievements
+                achievement_html = self.achievement_source()[1] or "Steam Web API schema"
+        if (achievements is None and not achievement_html and not self.has_schema_source()
+                and not self.achievement_processing_failed):
+            problem('warning', "No SteamDB achievement page or schema, achievements will not be configured")
+
+        if achievements:
+            add_file("steam_settings/achievements.json",
+                     AtomicWriter.content_size(self.emit_achievements_json(achievements)),
+                     achievement_html or "local catalog")
+            source_images = settings['imgs_dir']
+            image_files_needed = set()
+            for achievement in achievements:
+                for key in ('icon', 'icongray'):
+                    if achievement.get(key):
+                        image_files_needed.add(achievement[key])
+            missing_images = []
+            # Image file name -> path it is copied from, None when downloaded from the CDN
+            available_images = {}
+            for filename in sorted(image_files_needed):
+                source_path = os.path.join(source_images or "", filename)
+                cached_path = icon_cache_path(self.appid, filename, settings['icon_cache_dir'])
+                if source_images and os.path.exists(source_path):
+                    add_file(f"steam_settings/achievement_images/{filename}",
+                             file_size(source_path), source_path)
+                    available_images[filename] = source_path
+                elif settings['download_icons'] and os.path.isfile(cached_path):
+                    add_file(f"steam_settings/achievement_images/{filename}",
+                             file_size(cached_path), cached_path)
+                    available_images[filename] = cached_path
+                elif settings['download_icons'] and is_plain_filename(filename):
+                    add_file(f"steam_settings/achievement_images/{filename}",
+                             None, "Steam CDN")
+                    available_images[filename] = None
+                else:
+                    missing_images.append(filename)
+            if missing_images:
+                problem('warning', f"{len(missing_images)} achievement images missing in {source_images}")
+            if settings['generate_gray_icons']:
+                for icon in self.find_missing_gray_icons(achievements, available_images):
+                    add_file(f"steam_settings/achievement_images/{gray_icon_name(icon)}",
+                             None, f"gray icon generated from {icon}")
+
+        # Patch.zip
+        zip_layout = []
+        if settings['generate_patch']:
+            game_root_path = settings['game_root'].strip()
+            steamapi_dll_path = settings['steamapi_dll_path']
+            patch_type = settings['patch_type']
+            if patch_type not in PATCH_FILES:
+                problem('error', f"Unknown patch type: {patch_type}")
+            else:
+                for file in PATCH_FILES[patch_type]:
+                    if not os.path.exists(file):
+                        problem('error', f"Patch file missing: {file}")
+            if not steamapi_dll_path or not os.path.isdir(steamapi_dll_path):
+                problem('error', "Please select the steamapi dll folder")
+            elif not self.is_within(game_root_path, steamapi_dll_path):
+                problem('error', "Please select steamapi dll folder within the game root directory")
+            elif patch_type in PATCH_FILES:
+                dll_relative_path = self.get_relative_path(
+                    game_root_path, steamapi_dll_path).replace('\\', '/')
+                source_dll_dir = os.path.join("source", "GSE_DLL", patch_type)
+                skipped_dlls, dll_warnings = self.select_patch_dlls(source_dll_dir)
+                for message in dll_warnings:
+                    problem('warning', message)
+                if os.path.isdir(source_dll_dir):
+                    for root, dirs, filenames in os.walk(source_dll_dir):
+                        for filename in filenames:
+                            if root == source_dll_dir and filename in skipped_dlls:
+                                continue
+                            relative_path = os.path.relpath(
+                                os.path.join(root, filename), source_dll_dir).replace('\\', '/')
+                            zip_layout.append(f"{dll_relative_path}/{relative_path}")
+                for path in files:
+                    if path.startswith("steam_settings/"):
+                        zip_layout.append(f"{dll_relative_path}/{path}")
+                zip_layout.sort()
+                add_file("Patch.zip", None, f"{len(zip_layout)} files, see zip_layout")
+                add_file(PATCH_MANIFEST_NAME, None, "Patch.zip file list")
+                if settings['delta_patch']:
+                    previous_patch = self.previous_patch_path()
+                    if previous_patch:
+                        add_file(DELTA_PATCH_NAME, None,
+                                 f"Changes since {previous_patch}")
+                        add_file(DELTA_DELETED_NAME, None,
+                                 f"Files deleted since {previous_patch}")
+                    else:
+                        problem('warning', "Previous patch not found, delta patch will not be generated")
+
+        files = sorted(files.values(), key=lambda entry: entry['path'])
+        return {
+            'output_dir': self.output_dir,
+            'files': files,
+            'zip_layout': zip_layout,
+            'problems': problems,
+            'total_size': sum(entry['size'] or 0 for entry in files),
+            'ok': not any(entry['level'] == 'error' for entry in problems)
+        }
+
+    def load_game_info(self, reload=False, store=True):
+        """
+        Resolve game name and DLC list from settings, local catalog, info HTML or Steam Store API
+
+        Args:
+            reload (bool): Ignore game name and DLC list given in settings
+            store (bool): Store fetched information in the local catalog
+        """
+        settings = self.settings
+        if settings['game_name'] and not reload:
+            self.game_info = {
+                'game_name': settings['game_name'],
+                'game_id': settings['appid'],
+                'dlc_list': {int(dlc_id): dlc_name for dlc_id, dlc_name in (settings['dlc_list'] or {}).items()}
+            }
+            return self.game_info
+
+        html_path = settings['info_html']
+        html_mode = page_exists(html_path)
+
+        game_info = None
+        if self.catalog and settings['use_catalog']:
+            record = self.catalog.get_app_by_source(
+                html_path) if html_mode else self.catalog.get_app(settings['appid'])
+            if record and (not html_mode or LocalCatalog.is_fresh(record, html_path)):
+                game_info = {key: record[key]
+                             for key in ('game_name', 'game_id', 'dlc_list')}
+
+        if not game_info:
+            game_info = get_game_dlc_info(
+                settings['appid'], settings['language'], html_mode, html_path)
+            if game_info and self.catalog and store:
+                self.catalog.store_app(
+                    game_info, 'steamdb_html' if html_mode else 'store_api', html_path if html_mode else None)
+
+        if game_info:
+            self.game_info = game_info
+        return self.game_info
+
+    def run(self, stages=None):
+        """
+        Run generation stages
+
+        Args:
+            stages (iterable): Stage names, None for a full run
+
+        Returns:
+            list: Achievements of the game
+        """
+        if not self.game_info:
+            self.load_game_info()
+        if not self.game_info:
+            raise ValueError("Failed to get game information")
+
+        full_run = stages is None
+        stages = set(self.STAGES if full_run else stages)
+        self.stats.clear()
+
+        if 'game_info' in stages:
+            self.status("Reloading game information...")
+            old_output_dir = self.output_dir
+            self.load_game_info(reload=True)
+            # A renamed game is generated into a new folder
+            if self.output_dir != old_output_dir:
+                stages = set(self.STAGES)
+        if 'achievements' in stages:
+            # Changed inputs get a new chance
+            self.achievement_processing_failed = False
+
+        selected_stages = [stage for stage in self.STAGES if stage in stages]
+        for stage in self.STAGES:
+            # Cancellation takes effect between stages
+            if self.cancel_event.is_set():
+                self.cleanup_temp_directory()
+                raise GenerationCancelled("Generation cancelled")
+
+            if stage not in stages:
+                # Achievement images alone are copied where the achievement stage would run
+                if stage == 'achievements' and 'achievement_images' in stages and self.achievements:
+                    self.status("Copying image files...")
+                    self.copy_achievement_images(self.achievements)
+                    if self.generate_gray_icons(self.achievements):
+                        self.save_json_file(self.achievements)
+                    self.log_stage_summary('achievement_images')
+                continue
+            if stage == 'copy_source':
+                # First copy source folder to Output/{game name} folder
+                self.status("Copying source folder...")
+                self.copy_source_to_output()
+            elif stage == 'exe':
+                # Process game EXE file and icon replacement
+                self.status("Processing game EXE file...")
+                self.process_game_exe()
+            elif stage == 'achievements':
+                self.run_achievement_stage()
+            elif stage == 'config':
+                self.status("Generating config files...")
+                self.generate_config_files()
+            elif stage == 'game_images':
+                # Copy game images to Output folder
+                self.status("Copying game images...")
+                self.copy_game_images_to_output()
+            elif stage == 'loader_ini':
+                # Modify ColdClientLoader.ini
+                self.status("Configuring launcher...")
+                self.update_cold_client_loader_ini()
+            elif stage == 'remove_loader':
+                # Delete steamclient_loader_x64.exe
+                self.status("Cleaning files...")
+                self.remove_steamclient_loader()
+            elif stage == 'patch' and self.settings['generate_patch']:
+                self.status("Generating patch...")
+                self.generate_patch()
+
+            self.log_stage_summary(stage)
+
+            # Make the renames of this stage durable
+            self.writer.sync()
+            self.progress(selected_stages.index(stage) + 1, len(selected_stages))
+
+        # Clean temporary directory
+        self.status("Cleaning temporary files...")
+        self.cleanup_temp_directory()
+
+        log.info(
+            f"Config files written: {self.writer.written}, unchanged: {self.writer.unchanged}")
+        self.writer.written = self.writer.unchanged = 0
+
+        return self.achievements
+
+    def log_stage_summary(self, stage):
+        """Log the counters of a finished stage as one line and reset them"""
+        if self.stats:
+            log.info(f"{stage}: " + ", ".join(
+                f"{count} {name}" for name, count in self.stats.items()))
+            self.stats.clear()
+
+    def watch_targets(self):
+        """Get watched inputs by key (see WATCH_STAGES)"""
+        settings = self.settings
+        targets = {}
+        for key in self.WATCH_STAGES:
+            if key == 'community_html':
+                for language, path in settings['community_html'].items():
+                    targets[f"community_html:{language}"] = path
+            elif key == 'custom_ico_path' and not settings['use_custom_ico']:
+                continue
+            elif key == 'steamapi_dll_path' and not settings['generate_patch']:
+                continue
+            elif settings[key]:
+                targets[key] = settings[key]
+        # Stored pages change with their page store
+        for key, path in targets.items():
+            reference = parse_page_reference(path)
+            if reference:
+                targets[key] = reference[0]
+        return targets
+
+    def watch(self, on_finished=None):
+        """
+        Re-run the affected stages whenever a watched input changes
+
+        Args:
+            on_finished (callable): on_finished(achievements, stages) after each re-run
+
+        Returns:
+            FileWatcher: Started watcher, stop() it to end watch mode
+        """
+        def rerun(keys):
+            stages = set()
+            for key in keys:
+                stages.update(self.WATCH_STAGES[key.split(":")[0]])
+            log.info(
+                f"Changed: {', '.join(sorted(keys))}, re-running: {', '.join(sorted(stages))}")
+
+            try:
+                achievements = self.run(stages)
+            except Exception as e:
+                log.warning(f"Failed to regenerate config files: {e}")
+                self.notify('error', "Error",
+                            f"Failed to regenerate config files: {e}")
+                return
+
+            if on_finished:
+                on_finished(achievements, stages)
+
+        watcher = FileWatcher(self.watch_targets(), rerun)
+        watcher.start()
+        log.info(f"Watching: {', '.join(watcher.targets.values())}")
+        return watcher
+
+    def has_achievement_source(self):
+        """Check if achievements can be extracted (HTML file, pre-parsed data, schema or local catalog)"""
+        html_path = self.settings['achievement_html']
+        return bool(page_exists(html_path)
+                    or self._preparsed_achievements
+                    or self.has_schema_source()
+                    or self.load_catalog_achievements() is not None)
+
+    def has_schema_source(self):
+        """Check if achievements can be loaded from a schema file or the Steam Web API"""
+        schema_path = self.settings['achievement_schema']
+        return bool((schema_path and os.path.exists(schema_path))
+                    or self.settings['schema_api_key'])
+
+    def achievement_source(self):
+        """
+        Get the source achievements are extracted from
+
+        Returns:
+            tuple: (catalog source name, source file path or None)
+        """
+        html_path = self.settings['achievement_html']
+        if page_exists(html_path) or not self.has_schema_source():
+            return 'steamdb_html', html_path
+        schema_path = self.settings['achievement_schema']
+        if schema_path and os.path.exists(schema_path):
+            return 'steam_schema', schema_path
+        return 'steam_web_api', None
+
+    def load_schema_achievements(self):
+        """Load achievements from the schema file, or download them from the Steam Web API"""
+        source, schema_path = self.achievement_source()
+        if schema_path:
+            achievements = parse_achievement_schema_file(schema_path)
+        else:
+            # Multi-language runs translate the English schema with Steam Community pages
+            language = "english" if self.multi_language else self.settings['language']
+            achievements = fetch_achievement_schema(
+                self.appid, self.settings['schema_api_key'], language, self.settings['schema_api_url'])
+        log.info("Loaded %d achievements from %s", len(achievements),
+                 schema_path or "Steam Web API schema")
+        return achievements
+
+    def run_achievement_stage(self):
+        """Extract achievements, copy their images and save achievements.json"""
+        self.achievements = []
+
+        # Only process achievements if an achievement source is provided and not marked as failed
+        if not self.has_achievement_source() or self.achievement_processing_failed:
+            return
+
+        self.status("Parsing HTML file...")
+        achievements = self.extract_achievements_from_html()
+
+        # Check achievement count
+        if not achievements:
+            self.notify(
+                'warning', "Warning", "HTML file provided but no achievement data retrieved\nPlease get valid SteamDB achievement HTML page, see README file for details")
+            self.achievement_processing_failed = True
+            return
+
+        self.achievements = achievements
+
+        # Copy images
+        self.status("Copying image files...")
+        self.copy_achievement_images(achievements)
+        self.generate_gray_icons(achievements)
+
+        # Auto save JSON file
+        self.status("Saving config files...")
+        self.save_json_file(achievements)
+
+    def generate_patch(self):
+        """Generate patch"""
+
+        game_root_path = self.settings['game_root'].strip()
+        steamapi_dll_path = self.settings['steamapi_dll_path']
+        if not game_root_path or not os.path.exists(game_root_path):
+            self.notify('error',
+                        "Error", "Please select a valid game root directory")
+            return
+        if not self.is_within(game_root_path, steamapi_dll_path):
+            self.notify('error',
+                        "Error", "Please select steamapi dll folder within the game root directory")
+            return
+
+        try:
+            # Get steamapi dll file relative path
+            dll_relative_path = self.get_relative_path(
+                game_root_path, steamapi_dll_path)
+
+            # Create relative path folder structure in temporary directory
+            temp_dir = self.settings['temp_dir']
+            if not os.path.exists(temp_dir):
+                os.makedirs(temp_dir)
+
+            temp_dll_path = os.path.join(temp_dir, dll_relative_path)
+            if not os.path.exists(temp_dll_path):
+                os.makedirs(temp_dll_path)
+
+            # Copy corresponding DLL files based on selected type
+            source_dll_dir = os.path.join(
+                "source", "GSE_DLL", self.settings['patch_type'])
+
+            # Only the DLLs of the game's architectures are needed
+            skipped_dlls, dll_warnings = self.select_patch_dlls(source_dll_dir)
+            if dll_warnings:
+                self.notify('warning', "Warning", "\n".join(dll_warnings))
+
+            # Copy all files to temp relative path
+            for item in os.listdir(source_dll_dir):
+                source_item = os.path.join(source_dll_dir, item)
+                target_item = os.path.join(temp_dll_path, item)
+
+                if item in skipped_dlls:
+                    log.debug("Skip DLL file not used by the game: %s", item)
+                    self.stats['DLLs not used by the game'] += 1
+                elif os.path.isfile(source_item):
+                    shutil.copy2(source_item, target_item)
+                    log.debug("Copy DLL file: %s", item)
+                    self.stats['DLL files copied'] += 1
+                elif os.path.isdir(source_item):
+                    if os.path.exists(target_item):
+                        shutil.rmtree(target_item)
+                    shutil.copytree(source_item, target_item)
+                    log.debug("Copy DLL folder: %s", item)
+                    self.stats['DLL folders copied'] += 1
+
+            # Move steam_settings folder to relative path
+            output_steam_settings = os.path.join(
+                self.output_dir, "steam_settings")
+            temp_steam_settings = os.path.join(
+                temp_dll_path, "steam_settings")
+
+            if os.path.exists(output_steam_settings):
+                if os.path.exists(temp_steam_settings):
+                    shutil.rmtree(temp_steam_settings)
+                shutil.copytree(output_steam_settings, temp_steam_settings)
+                log.info("Move steam_settings folder to patch path")
+
+            # Package as Patch.zip
+            zip_path = os.path.join(self.output_dir, "Patch.zip")
+
+            # Get root folder to be packaged (first level of relative path)
+            relative_parts = dll_relative_path.split(os.sep)
+            if relative_parts:
+                root_folder_name = relative_parts[0]
+                root_folder_path = os.path.join(temp_dir, root_folder_name)
+
+                entries = {}
+                for root, dirs, files in os.walk(root_folder_path):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        # Get path relative to temp_dir as path in zip
+                        arc_path = os.path.relpath(
+                            file_path, temp_dir).replace(os.sep, '/')
+                        entries[arc_path] = file_path
+
+                # The previous manifest is replaced below, read it first
+                previous_files = self.load_previous_patch() if self.settings['delta_patch'] else None
+                for name in (DELTA_PATCH_NAME, DELTA_DELETED_NAME):
+                    if os.path.exists(os.path.join(self.output_dir, name)):
+                        os.remove(os.path.join(self.output_dir, name))
+
+                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                    for arc_path, file_path in entries.items():
+                        zipf.write(file_path, arc_path)
+
+                log.info(f"Patch packaged as: {zip_path}")
+
+                # File list of this patch, base of the next delta patch
+                current_files = {arc_path: {'size': os.path.getsize(file_path), 'sha256': file_digest(file_path)}
+                                 for arc_path, file_path in entries.items()}
+                self.writer.write(os.path.join(self.output_dir, PATCH_MANIFEST_NAME), json.dumps(
+                    {'appid': self.appid, 'patch_type': self.settings['patch_type'], 'files': current_files},
+                    ensure_ascii=False, indent=2))
+
+                if previous_files is not None:
+                    self.generate_delta_patch(
+                        entries, current_files, previous_files)
+
+        except Exception as e:
+            log.warning(f"Failed to generate patch: {e}")
+            self.notify('error', "Error", f"Failed to generate patch: {e}")
+
+    def select_patch_dlls(self, source_dll_dir):
+        """
+        Decide which GSE steam_api DLLs a patch needs from the PE headers of the game's files
+
+        Only the GSE DLLs with the architecture of a steam_api DLL found in the
+        steamapi dll folder are packaged, by the architecture in the PE header
+        rather than the file name. When the folder has both DLLs and the game
+        EXE's architecture is known, only the GSE DLL of the EXE's architecture
+        is packaged. Game and GSE DLLs whose architecture does not match their
+        name, and an EXE whose architecture no game DLL matches, are reported.
+
+        Args:
+            source_dll_dir (str): source/GSE_DLL/{patch type} folder
+
+        Returns:
+            tuple: (set of GSE DLL file names left out, list of warning messages)
+        """
+        steamapi_dll_path = self.settings['steamapi_dll_path']
+        if not self.settings['match_dll_architecture'] or not os.path.isdir(source_dll_dir) \
+                or not os.path.isdir(steamapi_dll_path):
+            return set(), []
+
+        game_dlls = {name.lower(): os.path.join(steamapi_dll_path, name)
+                     for name in os.listdir(steamapi_dll_path)
+                     if name.lower() in STEAM_API_ARCHITECTURES}
+        gse_dlls = {name.lower(): name for name in os.listdir(source_dll_dir)
+                    if name.lower() in STEAM_API_ARCHITECTURES}
+        if not game_dlls:
+            return set(), [f"No steam_api.dll or steam_api64.dll in {steamapi_dll_path}, all GSE DLLs are packaged"]
+
+        warnings = []
+        architectures = set()
+        for name, game_dll in sorted(game_dlls.items()):
+            architecture = pe_architecture(game_dll)
+            expected = STEAM_API_ARCHITECTURES[name]
+            if architecture is None:
+                warnings.append(f"{name} of the game is not a valid PE file, assuming {expected}")
+                architecture = expected
+            elif architecture != expected:
+                warnings.append(f"{name} of the game is {architecture}, expected {expected}")
+            architectures.add(architecture)
+
+        gse_architectures = {}
+        for name, filename in sorted(gse_dlls.items()):
+            architecture = pe_architecture(os.path.join(source_dll_dir, filename))
+            expected = STEAM_API_ARCHITECTURES[name]
+            if architecture and architecture != expected:
+                warnings.append(f"GSE {name} is {architecture}, expected {expected}")
+            gse_architectures[filename] = architecture or expected
+
+        exe_path = self.settings['exe_path'].strip()
+        exe_architecture = pe_architecture(exe_path) if exe_path and os.path.isfile(exe_path) else None
+        needed = architectures
+        if exe_architecture in architectures:
+            # The EXE only loads the DLL of its own architecture
+            needed = {exe_architecture}
+        elif exe_architecture:
+            warnings.append(
+                f"Game EXE is {exe_architecture}, but the steamapi dll folder only has "
+                f"{', '.join(sorted(architectures))} DLLs, is it the right folder?")
+
+        for architecture in sorted(needed - set(gse_architectures.values())):
+            warnings.append(f"No GSE {architecture} steam_api DLL in {source_dll_dir}")
+
+        skipped = {filename for filename, architecture in gse_architectures.items()
+                   if architecture not in needed}
+        return skipped, warnings
+
+    def previous_patch_path(self):
+        """Previous patch (manifest or Patch.zip) the delta patch is based on, None if not found"""
+        previous_patch = self.settings['previous_patch'] or os.path.join(
+            self.output_dir, PATCH_MANIFEST_NAME)
+        return previous_patch if os.path.isfile(previous_patch) else None
+
+    def load_previous_patch(self):
+        """Load the file list of the previous patch, None if it cannot be read"""
+        previous_patch = self.previous_patch_path()
+        if not previous_patch:
+            self.notify('warning', "Warning",
+                        "Previous patch not found, delta patch not generated")
+            return None
+
+        try:
+            return load_patch_manifest(previous_patch)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            log.warning(f"Failed to read previous patch: {e}")
+            self.notify('warning', "Warning",
+                        f"Cannot read previous patch {previous_patch}, delta patch not generated")
+            return None
+
+    def generate_delta_patch(self, entries, current_files, previous_files):
+        """
+        Package the files added or changed since the previous patch as Patch_delta.zip,
+        and list the files to delete in Patch_delta_deleted.txt
+
+        Args:
+            entries (dict): Path in zip -> file to package
+            current_files (dict): File list of the new patch
+            previous_files (dict): File list of the previous patch
+        """
+        added, changed, deleted = diff_patch_manifests(
+            previous_files, current_files)
+
+        delta_path = os.path.join(self.output_dir, DELTA_PATCH_NAME)
+        with zipfile.ZipFile(delta_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for arc_path in added + changed:
+                zipf.write(entries[arc_path], arc_path)
+
+        self.writer.write(os.path.join(self.output_dir, DELTA_DELETED_NAME),
+                          "".join(f"{arc_path}\n" for arc_path in deleted))
+
+        log.info(
+            f"Delta patch packaged as: {delta_path} ({len(added)} added, {len(changed)} changed, {len(deleted)} deleted)")
+
+    def build_cold_client_loader_ini(self, content):
+        """
+        Apply game EXE path, AppID and overlay injection to ColdClientLoader.ini content
+
+        Returns:
+            tuple: (new content, Exe line, AppId line)
+        """
+        # Get game name and AppID
+        safe_game_name = self.safe_game_name
+        appid = self.appid
+
+        # Calculate game relative path
+        game_root_path = self.settings['game_root'].strip()
+        game_exe_path = self.settings['exe_path'].strip()
+
+        # Modify Exe path
+        game_relative_path = self.get_relative_path(
+            game_root_path, game_exe_path).replace('\\', '/')
+        exe_pattern = r'^Exe=.*$'
+        new_exe_line = f"Exe={safe_game_name}" + \
+            "/"+f"{game_relative_path}"
+        content = re.sub(exe_pattern, new_exe_line,
+                         content, flags=re.MULTILINE)
+
+        # Modify AppId
+        appid_pattern = r'^AppId=.*$'
+        new_appid_line = f"AppId={appid}"
+        content = re.sub(appid_pattern, new_appid_line,
+                         content, flags=re.MULTILINE)
+
+        # Modify overlay injection
+        if self.settings['overlay']:
+            overlay_pattern = r'^ForceInjectGameOverlayRenderer=.*$'
+            content = re.sub(overlay_pattern, "ForceInjectGameOverlayRenderer=1",
+                             content, flags=re.MULTILINE)
+
+        return content, new_exe_line, new_appid_line
+
+    def update_cold_client_loader_ini(self):
+        """Modify ColdClientLoader.ini file"""
+        ini_path = os.path.join(self.output_dir, "ColdClientLoader.ini")
+
+        if not os.path.exists(ini_path):
+            log.warning(
+                f"ColdClientLoader.ini file does not exist: {ini_path}")
+            return
+
+        try:
+            # Read INI file content
+            with open(ini_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            content, new_exe_line, new_appid_line = self.build_cold_client_loader_ini(
+                content)
+
+            # Write back to file
+            self.writer.write(ini_path, content)
+
+            log.info(
+                f"ColdClientLoader.ini updated: Exe: {new_exe_line}, AppId: {new_appid_line}")
+
+        except Exception as e:
+            log.warning(f"Failed to modify ColdClientLoader.ini: {e}")
+
+    def remove_steamclient_loader(self):
+        """Delete steamclient_loader_x64.exe file in Output folder"""
+        loader_path = os.path.join(
+            self.output_dir, "steamclient_loader_x64.exe")
+
+        if os.path.exists(loader_path):
+            try:
+                os.remove(loader_path)
+                log.info("steamclient_loader_x64.exe deleted")
+            except Exception as e:
+                log.warning(f"Failed to delete steamclient_loader_x64.exe: {e}")
+        else:
+            log.info(
+                "steamclient_loader_x64.exe file does not exist, no need to delete")
+
+    def process_game_exe(self):
+        """Process game EXE file and icon replacement"""
+        safe_game_name = self.safe_game_name
+        output_dir = self.output_dir
+
+        # Check if ResourceHacker exists
+        if not self.has_resource_hacker:
+            # Directly copy steamclient_loader_x64.exe and rename
+            source_loader = os.path.join(
+                "source", "steamclient_loader_x64.exe")
+            if os.path.exists(source_loader):
+                final_exe_path = os.path.join(
+                    output_dir, f"{safe_game_name}.exe")
+                shutil.copy2(source_loader, final_exe_path)
+                log.info(
+                    f"Directly copied steamclient_loader_x64.exe as: {final_exe_path}")
+                self.icon_replacement_failed = True
+                self.notify('warning',
+                            "Warning", "Cannot replace EXE icon, please check tool folder integrity, please read README file for details")
+            return
+        else:
+            self.icon_replacement_failed = False
+
+        exe_path = self.settings['exe_path'].strip()
+        if not exe_path or not os.path.exists(exe_path):
+            self.exe_valid = False
+            log.warning("Game EXE file not selected or file does not exist")
+            # If no game EXE file is selected, also directly copy steamclient_loader_x64.exe
+            source_loader = os.path.join(
+                "source", "steamclient_loader_x64.exe")
+            if os.path.exists(source_loader):
+                final_exe_path = os.path.join(
+                    output_dir, f"{safe_game_name}.exe")
+                shutil.copy2(source_loader, final_exe_path)
+                log.info(
+                    f"Directly copied steamclient_loader_x64.exe as: {final_exe_path}")
+            return
+        else:
+            self.exe_valid = True
+
+        temp_dir = self.settings['temp_dir']
+        if not os.path.exists(temp_dir):
+            os.makedirs(temp_dir)
+
+        # Copy game EXE to temporary directory
+        game_exe_temp = os.path.join(temp_dir, "game.exe")
+        shutil.copy2(exe_path, game_exe_temp)
+        log.info(f"Game EXE copied to: {game_exe_temp}")
+
+        # Copy steamclient_loader_x64.exe to temporary directory
+        source_loader = os.path.join(
+            "source", "steamclient_loader_x64.exe")
+        if os.path.exists(source_loader):
+            loader_temp = os.path.join(
+                temp_dir, "steamclient_loader_x64.exe")
+            shutil.copy2(source_loader, loader_temp)
+            log.info(f"steamclient_loader_x64.exe copied to: {loader_temp}")
+
+            # Decide which icon replacement method to use based on whether custom ICO icon is used
+            output_exe = os.path.join(temp_dir, "output.exe")
+            success = False
+
+            custom_ico_path = self.settings['custom_ico_path']
+            if self.settings['use_custom_ico'] and custom_ico_path:
+                # Use custom ICO file
+                log.info(f"Using custom ICO file: {custom_ico_path}")
+                success = replace_exe_icon_with_ico(
+                    custom_ico_path, loader_temp, output_exe)
+            else:
+                # Use original icon extraction method
+                log.info("Using game EXE icon extraction method")
+                success = replace_exe_icon(
+                    game_exe_temp, loader_temp, output_exe)
+
+            if success and os.path.exists(output_exe):
+                # Copy directly to Output folder
+                final_exe_path = os.path.join(
+                    output_dir, f"{safe_game_name}.exe")
+                shutil.copy2(output_exe, final_exe_path)
+                log.info(f"Final EXE file generated: {final_exe_path}")
+                self.icon_replacement_failed = False
+            else:
+                log.warning("Icon replacement failed")
+                self.icon_replacement_failed = True
+        else:
+            log.warning(
+                f"steamclient_loader_x64.exe does not exist in source folder: {source_loader}")
+
+    def cleanup_temp_directory(self):
+        """Clean temporary directory"""
+        temp_dir = self.settings['temp_dir']
+        if os.path.exists(temp_dir):
+            try:
+                shutil.rmtree(temp_dir)
+                log.info(f"{temp_dir} directory cleaned")
+            except Exception as e:
+                log.warning(f"Failed to clean {temp_dir} directory: {e}")
+
+    def copy_source_to_output(self):
+        """Copy source folder contents to Output/{game name} folder, excluding GSE_DLL folder"""
+        source_dir = "source"
+        output_dir = self.output_dir
+
+        # Create Output/{game name} folder
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        # If source folder exists, copy all files and folders in it (excluding GSE_DLL)
+        if os.path.exists(source_dir):
+            for item in os.listdir(source_dir):
+                # Exclude GSE_DLL folder
+                if item == "GSE_DLL":
+                    log.debug("Skip folder: %s", item)
+                    continue
+
+                source_path = os.path.join(source_dir, item)
+                target_path = os.path.join(output_dir, item)
+
+                if os.path.isfile(source_path):
+                    shutil.copy2(source_path, target_path)
+                    log.debug("Copy file: %s", item)
+                    self.stats['files copied'] += 1
+                elif os.path.isdir(source_path):
+                    if os.path.exists(target_path):
+                        shutil.rmtree(target_path)
+                    shutil.copytree(source_path, target_path)
+                    log.debug("Copy folder: %s", item)
+                    self.stats['folders copied'] += 1
+            overlay_config_path = os.path.join(
+                output_dir, "steam_settings", "configs.overlay.ini")
+            if os.path.exists(overlay_config_path) and not self.settings['overlay']:
+                os.remove(overlay_config_path)
+                log.info("Delete file: steam_settings/configs.overlay.ini")
+
+        else:
+            log.warning("source folder does not exist")
+
+    def copy_game_images_to_output(self):
+        """Copy game images to Output/{game name}/steam_settings folder"""
+        temp_dir = self.settings['temp_dir']
+        output_steam_settings = os.path.join(self.output_dir, "steam_settings")
+
+        # Ensure target folder exists
+        if not os.path.exists(output_steam_settings):
+            os.makedirs(output_steam_settings)
+
+        # Copy three game images, downloaded ones are served from cache
+        for image_file in GAME_IMAGES:
+            temp_image_path = os.path.join(temp_dir, image_file)
+            target_path = os.path.join(output_steam_settings, image_file)
+            try:
+                if os.path.exists(temp_image_path):
+                    shutil.copy2(temp_image_path, target_path)
+                else:
+                    image_content = fetch_game_image(self.appid, image_file)
+                    if image_content is None:
+                        log.warning(f"Game image does not exist: {image_file}")
+                        continue
+                    with open(target_path, "wb") as f:
+                        f.write(image_content)
+                log.debug("Copy game image success: %s", image_file)
+                self.stats['game images copied'] += 1
+            except Exception as e:
+                log.warning(f"Copy game image failed: {image_file} - {e}")
+
+    def generate_config_files(self):
+        """Generate config files"""
+        # Generate configs.user.ini
+        self.generate_user_config()
+
+        # Generate configs.app.ini
+        self.generate_app_config()
+
+        # Generate steam_appid.txt
+        self.generate_steam_appid()
+
+    def emit_user_config(self):
+        """Emit configs.user.ini content"""
+        yield "[user::general]\n"
+        yield f"account_name={self.settings['username'].strip()}\n"
+        yield f"account_steamid={self.settings['userid'].strip()}\n"
+        yield f"language={self.settings['language']}\n"
+
+        # If local storage is enabled, add related configuration
+        if self.settings['local_storage']:
+            yield "\n[user::saves]\n"
+            yield "local_save_path=./GSE Saves\n"
+            yield "saves_folder_name=Goldberg SteamEmu Saves\n"
+
+    def generate_user_config(self):
+        """Generate configs.user.ini file"""
+        config_path = os.path.join(
+            self.output_dir, "steam_settings", "configs.user.ini")
+        self.writer.write(config_path, self.emit_user_config())
+
+    def has_app_config(self):
+        """configs.app.ini is only generated for games with DLCs"""
+        return bool(self.game_info and self.game_info.get('dlc_list'))
+
+    def emit_app_config(self):
+        """Emit configs.app.ini content"""
+        # Add DLC configuration
+        if self.has_app_config():
+            yield "[app::dlcs]\n"
+            yield "unlock_all=0\n"
+            for dlc_id, dlc_name in self.game_info['dlc_list'].items():
+                yield f"{dlc_id}={dlc_name}\n"
+
+    def generate_app_config(self):
+        """Generate configs.app.ini file"""
+        if self.has_app_config():
+            config_path = os.path.join(
+                self.output_dir, "steam_settings", "configs.app.ini")
+            self.writer.write(config_path, self.emit_app_config())
+
+    def generate_steam_appid(self):
+        """Generate steam_appid.txt file"""
+        appid_path = os.path.join(
+            self.output_dir, "steam_settings", "steam_appid.txt")
+        self.writer.write(appid_path, self.appid)
+
+    @staticmethod
+    def emit_achievements_json(achievements):
+        """Emit achievements.json content, same as json.dump(..., ensure_ascii=False, indent=2)"""
+        return iter_achievements_json(achievements)
+
+    def save_json_file(self, achievements):
+        """Auto save JSON file"""
+        json_path = os.path.join(
+            self.output_dir, "steam_settings", "achievements.json")
+        self.writer.write(json_path, self.emit_achievements_json(achievements))
+
+    def load_catalog_achievements(self):
+        """Get achievements from the local catalog, None if not cataloged or outdated"""
+        if not self.catalog or not self.settings['use_catalog']:
+            return None
+
+        appid = self.appid
+        if not appid.isdigit():
+            return None
+
+        if self.multi_language:
+            languages = ["english"] + \
+                [language for language in self.settings['community_languages'] if language != "english"]
+        else:
+            languages = [self.settings['language']]
+
+        per_language = {}
+        for language in languages:
+            record = self.catalog.get_achievements(appid, language)
+            if not record or not LocalCatalog.is_fresh(record, self.achievement_source()[1]):
+                return None
+            per_language[language] = record['achievements']
+
+        log.info("Loaded achievements from local catalog")
+        if self.multi_language:
+            return merge_localized_achievements(per_language)
+        return per_language[languages[0]]
+
+    def store_catalog_achievements(self, achievements):
+        """Store extracted achievements in the local catalog"""
+        appid = self.appid
+        source, source_path = self.achievement_source()
+        if not self.catalog or not achievements or not appid.isdigit():
+            return
+
+        try:
+            if self.multi_language:
+                for language, localized in split_localized_achievements(achievements).items():
+                    self.catalog.store_achievements(
+                        appid, language, localized, source, source_path)
+            else:
+                self.catalog.store_achievements(
+                    appid, self.settings['language'], achievements, source, source_path)
+        except sqlite3.Error as e:
+            log.warning(f"Failed to store achievements in local catalog: {e}")
+
+    def needs_community_choice(self):
+        """Check if a run would parse the SteamDB page in single-language mode (whether to use Steam Community is asked then)"""
+        html_file_path = self.settings['achievement_html']
+        return (not self.multi_language
+                and not self.achievement_processing_failed
+                and page_exists(html_file_path)
+                and self.load_catalog_achievements() is None)
+
+    def extract_achievements_from_html(self):
+        """Extract achievement data"""
+        # Query the local catalog first
+        achievements = self.load_catalog_achievements()
+        if achievements is not None:
+            return achievements
+
+        html_file_path = self.settings['achievement_html']
+        preparsed_achievements = self._preparsed_achievements
+        self._preparsed_achievements = None
+
+        has_html = page_exists(html_file_path)
+        if not preparsed_achievements and not has_html and not self.has_schema_source():
+            self.achievement_processing_failed = True
+            self.notify('error',
+                        "SteamDB achievement local HTML file not found",
+                        f"Please check if the path file exists"
+                        )
+            return []
+
+        if not preparsed_achievements and not has_html:
+            # No SteamDB page: use the achievement schema instead
+            try:
+                preparsed_achievements = self.load_schema_achievements()
+            except (requests.RequestException, OSError, ValueError, KeyError) as e:
+                self.achievement_processing_failed = True
+                self.notify('error', "Failed to get the achievement schema", str(e))
+                return []
+            if not preparsed_achievements:
+                self.notify('warning', "Warning", "The achievement schema has no achievements")
+                return []
+
+        appid = self.appid
+        multi_language = self.multi_language
+        sc_enable = not multi_language and self.settings['use_community']
+
+        with ThreadPoolExecutor(max_workers=1) as community_pool:
+            # Start loading Steam Community pages before parsing the SteamDB page,
+            # so the download overlaps with the parse
+            community_future = None
+            if multi_language:
+                community_future = community_pool.submit(
+                    get_community_localizations, appid, self.settings['community_languages'],
+                    saved_pages=self.settings['community_html'])
+            elif sc_enable:
+                community_future = community_pool.submit(
+                    self.load_community_translations, appid)
+
+            if preparsed_achievements:
+                achievements = [Achievement.from_dict(achievement)
+                                for achievement in preparsed_achievements]
+            else:
+                # Stream the page through the parser instead of building a DOM
+                achievements, failed_count = parse_steamdb_achievements(
+                    read_text_chunks(html_file_path))
+                if failed_count:
+                    self.notify('warning',
+                                "Warning", f"Error processing {failed_count} achievements")
+
+            # Wait for Steam Community pages
+            community_result = None
+            while community_future is not None:
+                try:
+                    community_result = community_future.result()
+                    break
+                except requests.RequestException as e:
+                    log.warning(f"Cannot access SteamCommunity page: {e}")
+                    if not self.ask_retry(e):
+                        self.notify('error',
+                                    "Failed to get Steam Community localized achievements",
+                                    "Will not use Steam Community achievement page as translation reference"
+                                    )
+                        break
+
+                    community_future = community_pool.submit(
+                        self.load_community_translations, appid)
+                except Exception as e:
+                    log.warning(
+                        f"Error getting achievement info from SteamCommunity page: {e}")
+                    self.notify('warning',
+                                "Warning", "Error getting achievement info from SteamCommunity page")
+                    break
+
+        if community_result is not None and multi_language:
+            localizations, failures = community_result
+
+            if failures:
+                failed_languages_str = ", ".join(sorted(failures))
+                self.notify('warning',
+                            "Warning", f"Cannot get Steam Community achievements for: {failed_languages_str}")
+
+            if localizations:
+                icon_map = self.match_translation_icons(
+                    achievements, set().union(*localizations.values()))
+                for translations in localizations.values():
+                    add_translation_aliases(translations, icon_map)
+                unmatched = apply_community_localizations(achievements, localizations)
+                self.stats['achievements without translation'] += unmatched
+        elif community_result is not None:
+            add_translation_aliases(community_result, self.match_translation_icons(
+                achievements, community_result))
+            for achievement in achievements:
+                page1_icon = achievement.get('icon', '')
+                if page1_icon in community_result:
+                    display_name, description = community_result[page1_icon]
+                    if display_name:
+                        achievement['displayName'] = display_name
+                    if description:
+                        achievement['description'] = description
+                else:
+                    log.debug(
+                        "No matching achievements found, SteamDB achievements Page icon: %s", page1_icon)
+                    self.stats['achievements without translation'] += 1
+
+        self.store_catalog_achievements(achievements)
+        return achievements
+
+    def find_icon_file(self, filename, folders):
+        """Get the path of an icon in the first folder containing it, or in the icon cache"""
+        if not is_plain_filename(filename):
+            return None
+        for folder in folders:
+            if folder and os.path.isfile(os.path.join(folder, filename)):
+                return os.path.join(folder, filename)
+        cached_path = icon_cache_path(self.appid, filename, self.settings['icon_cache_dir'])
+        return cached_path if os.path.isfile(cached_path) else None
+
+    def match_translation_icons(self, achievements, translation_icons):
+        """
+        Match SteamDB icons without an exact Steam Community match by perceptual hash
+
+        SteamDB icons are read from imgs_dir, Steam Community icons from the
+        resource folders of the saved pages; icons found in neither are taken
+        from the icon cache or downloaded (when download_icons is set).
+
+        Args:
+            achievements (list): Achievements extracted from SteamDB
+            translation_icons (iterable): Icon filenames of the Steam Community rows
+
+        Returns:
+            dict: SteamDB icon -> Steam Community icon
+        """
+        translation_icons = set(translation_icons)
+        steamdb_icons = sorted({achievement.get('icon') for achievement in achievements
+                                if achievement.get('icon')} - translation_icons)
+        community_icons = sorted(translation_icons - {achievement.get('icon')
+                                                      for achievement in achievements})
+        if not steamdb_icons or not community_icons:
+            return {}
+
+        page_folders = [find_saved_page_resources(page) for page in
+                        list(self.settings['community_html'].values()) + ["achs.html"]
+                        if os.path.isfile(page)]
+
+        def locate(icons, folders):
+            paths = {icon: self.find_icon_file(icon, folders) for icon in icons}
+            missing = [icon for icon, path in paths.items() if path is None]
+            if missing and self.settings['download_icons'] and self.appid:
+                try:
+                    downloaded, _ = download_achievement_icons(
+                        self.appid, missing, self.settings['icon_cache_dir'])
+                    paths.update(downloaded)
+                except OSError as e:
+                    log.warning(f"Cannot download icons for matching: {e}")
+            return {icon: path for icon, path in paths.items() if path}
+
+        steamdb_paths = locate(steamdb_icons, [self.settings['imgs_dir']])
+        community_paths = locate(community_icons, page_folders)
+        if not steamdb_paths or not community_paths:
+            return {}
+
+        steamdb_icons = list(steamdb_paths)
+        community_icons = list(community_paths)
+        steamdb_hashes = icon_hashes([steamdb_paths[icon] for icon in steamdb_icons])
+        community_hashes = icon_hashes([community_paths[icon] for icon in community_icons])
+        steamdb_icons = [icon for icon, value in zip(steamdb_icons, steamdb_hashes) if value is not None]
+        community_icons = [icon for icon, value in zip(community_icons, community_hashes) if value is not None]
+
+        matches = match_icon_hashes([value for value in steamdb_hashes if value is not None],
+                                    [value for value in community_hashes if value is not None])
+        icon_map = {steamdb_icons[i]: community_icons[j] for i, j, _ in matches}
+        if icon_map:
+            log.info(f"Matched {len(icon_map)} achievements by icon image")
+        return icon_map
+
+    def load_community_translations(self, appid):
+        """Load Steam Community achievement page (saved page, achs.html or online) and parse translations"""
+        saved_page = self.settings['community_html'].get(
+            self.settings['language'], "achs.html")
+        if page_exists(saved_page):
+            return parse_community_achievements_file(saved_page)
+
+        return parse_community_achievements(stream_community_achievement_page(
+            appid, self.settings['language']))
+
+    def copy_achievement_images(self, achievements):
+        """Copy achievement images to Output/{game name}/steam_settings/achievement_images folder"""
+        source_dir = self.settings['imgs_dir']
+        target_dir = os.path.join(
+            self.output_dir, "steam_settings", "achievement_images")
+
+        # Ensure target folder exists
+        if not os.path.exists(target_dir):
+            os.makedirs(target_dir)
+
+        has_source_dir = bool(source_dir) and os.path.exists(source_dir)
+        if not has_source_dir:
+            log.warning(
+                f"Source image folder does not exist: {source_dir}")
+            if not self.settings['download_icons']:
+                return
+
+        # Collect needed image filenames
+        image_files_needed = set()
+        for achievement in achievements:
+            if achievement.get('icon'):
+                image_files_needed.add(achievement['icon'])
+            if achievement.get('icongray'):
+                image_files_needed.add(achievement['icongray'])
+
+        def copy_image(source_path, filename):
+            try:
+                shutil.copy2(source_path, os.path.join(target_dir, filename))
+                log.debug("Copy success: %s", filename)
+                self.stats['achievement images copied'] += 1
+            except Exception as e:
+                log.warning(f"Copy failed: {filename} - {e}")
+
+        # Copy files to achievement_images folder
+        missing_files = []
+        for filename in sorted(image_files_needed):
+            source_path = os.path.join(source_dir, filename) if has_source_dir else None
+            if source_path and os.path.exists(source_path):
+                copy_image(source_path, filename)
+            else:
+                missing_files.append(filename)
+
+        # Fall back to the Steam CDN for images the browser did not save
+        if missing_files and self.settings['download_icons'] and self.appid:
+            log.info(f"Getting {len(missing_files)} missing achievement images from the Steam CDN")
+            icons, missing_files = download_achievement_icons(
+                self.appid, missing_files, self.settings['icon_cache_dir'])
+            for filename, cached_path in icons.items():
+                copy_image(cached_path, filename)
+
+        for filename in missing_files:
+            log.debug("Source file does not exist: %s", os.path.join(source_dir or '', filename))
+        if missing_files:
+            self.stats['achievement images missing'] += len(missing_files)
+
+
+    @staticmethod
+    def find_missing_gray_icons(achievements, images):
+        """
+        Get the icons of achievements whose gray icon is missing or the same image as the icon
+
+        Args:
+            achievements (list): Achievement dicts
+            images: Folder with the achievement images, or a dict of the available
+                image file names to their paths (None for images downloaded during the run)
+
+        Returns:
+            list: Icon file names (each once) that need a generated gray icon
+        """
+        if isinstance(images, str):
+            images = {filename: os.path.join(images, filename) for filename in os.listdir(images)
+                      if os.path.isfile(os.path.join(images, filename))} if os.path.isdir(images) else {}
+
+        icons = []
+        for achievement in achievements:
+            icon = achievement.get('icon')
+            if not icon or icon in icons or icon not in images:
+                continue
+            icongray = achievement.get('icongray')
+            # Gray icons generated by an earlier run are generated again (unchanged ones are not rewritten)
+            if not icongray or icongray in (icon, gray_icon_name(icon)):
+                icons.append(icon)
+                continue
+            if icongray not in images:
+                icons.append(icon)
+                continue
+            # Downloaded images can only be compared once they are there
+            gray_path, icon_path = images[icongray], images[icon]
+            if gray_path and icon_path and os.path.getsize(gray_path) == os.path.getsize(icon_path):
+                with open(gray_path, 'rb') as f1, open(icon_path, 'rb') as f2:
+                    if f1.read() == f2.read():
+                        icons.append(icon)
+        return icons
+
+    def generate_gray_icons(self, achievements):
+        """
+        Generate gray icons for achievements without a usable one and update icongray / icon_gray
+
+        Returns:
+            int: Number of achievements updated
+        """
+        if not self.settings['generate_gray_icons']:
+            return 0
+
+        image_dir = os.path.join(
+            self.output_dir, "steam_settings", "achievement_images")
+        icons = self.find_missing_gray_icons(achievements, image_dir)
+        if not icons:
+            return 0
+
+        self.status("Generating gray icons...")
+        images = []
+        for icon in icons:
+            try:
+                with Image.open(os.path.join(image_dir, icon)) as image:
+                    image.load()
+                    images.append(image)
+            except Exception as e:
+                log.warning(f"Cannot open icon: {icon} - {e}")
+                images.append(None)
+
+        loaded = [(icon, image) for icon, image in zip(icons, images) if image is not None]
+        gray_images = make_gray_icons([image for _, image in loaded])
+        gray_names = {}
+        for (icon, _), gray_image in zip(loaded, gray_images):
+            gray_name = gray_icon_name(icon)
+            try:
+                self.writer.write(os.path.join(image_dir, gray_name),
+                                  encode_icon(gray_image, gray_name))
+                gray_names[icon] = gray_name
+            except Exception as e:
+                log.warning(f"Cannot save gray icon: {gray_name} - {e}")
+
+        updated = 0
+        for achievement in achievements:
+            gray_name = gray_names.get(achievement.get('icon'))
+            if gray_name and achievement.get('icongray') != gray_name:
+                achievement['icongray'] = gray_name
+                achievement['icon_gray'] = gray_name
+                updated += 1
+
+        log.info(f"Gray icons generated: {len(gray_names)}, achievements updated: {updated}")
+        return updated
+
+
+class GenerationService:
+    """
+    Run game information fetches, achievement extraction, config generation
+    and patch builds for HTTP clients
+
+    Jobs run on a bounded worker pool and share the Steam request cache and
+    the local catalog, so repeated requests for a game are served warm. Each
+    job writes into its own folder under service_dir.
+    """
+
+    JOB_TYPES = ("generate", "achievements", "patch")
+
+    # Settings holding saved page paths, which may name an upload instead
+    UPLOAD_SETTINGS = ("info_html", "achievement_html", "achievement_schema", "custom_ico_path")
+
+    # Settings holding game paths, which must be inside an allowed root
+    PATH_SETTINGS = ("game_root", "exe_path", "steamapi_dll_path", "previous_patch", "imgs_dir")
+
+    # Working folders chosen by the service, never by clients
+    SERVICE_SETTINGS = ("output_root", "temp_dir", "icon_cache_dir")
+
+    def __init__(self, service_dir=SERVICE_DIR, catalog=None, max_workers=SERVICE_WORKERS,
+                 max_queued=SERVICE_MAX_QUEUED, allowed_roots=()):
+        """
+        Args:
+            service_dir (str): Folder for uploads and job outputs
+            catalog (LocalCatalog): Local catalog shared by all jobs, None to disable
+            max_workers (int): Jobs running at the same time
+            max_queued (int): Jobs waiting or running before new ones are rejected
+            allowed_roots (list): Folders job settings may point into (game folders,
+                saved pages), everything else must be an upload
+        """
+        self.service_dir = service_dir
+        self.uploads_dir = os.path.join(service_dir, "uploads")
+        self.jobs_dir = os.path.join(service_dir, "jobs")
+        os.makedirs(self.uploads_dir, exist_ok=True)
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self.allowed_roots = [os.path.realpath(root) for root in allowed_roots]
+        self._upload_lock = threading.Lock()
+
+        self.catalog = catalog
+        self.max_queued = max_queued
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._jobs = {}
+        # Generators of finished jobs, patch jobs re-run their patch stage
+        self._generators = {}
+        # Patch jobs of the same generate job share its output folder, one runs at a time
+        self._patch_locks = {}
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def save_upload(self, filename, stream, length):
+        """
+        Save an uploaded page
+
+        Args:
+            filename (str): Original file name, only its extension is kept
+            stream: Readable request body
+            length (int): Body size in bytes
+
+        Returns:
+            str: Upload ID
+
+        Raises:
+            ValueError: The upload is too large or not a page / icon file
+            OverflowError: The uploads folder is full
+        """
+        if length > SERVICE_MAX_UPLOAD_SIZE:
+            raise ValueError(
+                f"Upload too large ({length} bytes, maximum {SERVICE_MAX_UPLOAD_SIZE})")
+
+        extension = os.path.splitext(os.path.basename(filename or ""))[1].lower()
+        if extension not in (".html", ".htm", ".json", ".ico"):
+            raise ValueError("Only .html, .htm, .json and .ico files can be uploaded")
+
+        upload_id = uuid.uuid4().hex + extension
+        upload_path = os.path.join(self.uploads_dir, upload_id)
+        with self._upload_lock:
+            if self._prune_uploads() + length > SERVICE_MAX_UPLOADS_SIZE:
+                raise OverflowError("Too many uploads, try again later")
+            # Reserve the file, so concurrent uploads count it
+            open(upload_path, "wb").close()
+            os.truncate(upload_path, length)
+
+        remaining = length
+        try:
+            with open(upload_path, "r+b") as f:
+                while remaining > 0:
+                    chunk = stream.read(min(HTML_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    remaining -= len(chunk)
+                f.truncate()
+        except BaseException:
+            os.remove(upload_path)
+            raise
+        log.info(f"Upload saved: {upload_id} ({length} bytes)")
+        return upload_id
+
+    def _prune_uploads(self):
+        """Delete uploads older than SERVICE_UPLOAD_MAX_AGE, returns the size of the remaining ones"""
+        expired = time.time() - SERVICE_UPLOAD_MAX_AGE
+        total = 0
+        with os.scandir(self.uploads_dir) as entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                    if stat.st_mtime < expired:
+                        os.remove(entry.path)
+                        log.info(f"Upload expired: {entry.name}")
+                    else:
+                        total += stat.st_size
+                except OSError:
+                    continue
+        return total
+
+    def _check_path(self, key, value):
+        """Check that a path setting points inside an allowed root"""
+        if not isinstance(value, str):
+            raise ValueError(f"{key} must be a path")
+        # Page store references are checked by their store file
+        reference = parse_page_reference(value)
+        real_path = os.path.realpath(reference[0] if reference else value)
+        for root in self.allowed_roots:
+            if os.path.commonpath([real_path, root]) == root:
+                return value
+        raise ValueError(f"{key} is outside the allowed folders: {value}")
+
+    def _resolve_upload(self, key, value):
+        """Map an upload ID to its saved path, other values must be inside an allowed root"""
+        if isinstance(value, str) and re.fullmatch(r"[0-9a-f]{32}\.(html|htm|json|ico)", value):
+            upload_path = os.path.join(self.uploads_dir, value)
+            if not os.path.isfile(upload_path):
+                raise ValueError(f"Unknown upload: {value}")
+            return upload_path
+        return self._check_path(key, value)
+
+    def resolve_settings(self, settings):
+        """
+        Replace upload IDs in job settings by saved page paths
+
+        Raises:
+            ValueError: A path setting is neither an upload nor inside an allowed root
+        """
+        settings = {key: value for key, value in settings.items()
+                    if key not in self.SERVICE_SETTINGS}
+        for key in self.UPLOAD_SETTINGS:
+            if settings.get(key):
+                settings[key] = self._resolve_upload(key, settings[key])
+        for key in self.PATH_SETTINGS:
+            if settings.get(key):
+                settings[key] = self._check_path(key, settings[key])
+        if settings.get('community_html'):
+            if not isinstance(settings['community_html'], dict):
+                raise ValueError("community_html must map languages to pages")
+            settings['community_html'] = {language: self._resolve_upload('community_html', value)
+                                          for language, value in settings['community_html'].items()}
+        return settings
+
+    def plan(self, settings):
+        """Plan a generate job without running it (see ConfigGenerator.plan)"""
+        settings = self.resolve_settings(settings)
+        settings['output_root'] = os.path.join(self.jobs_dir, "plan", "Output")
+        generator = ConfigGenerator(settings, self.catalog)
+        generator.detect_game_files(update_cache=False)
+        return generator.plan()
+
+    def get_game_info(self, appid, language="english", info_html=None):
+        """Get game name and DLC list (cached)"""
+        generator = ConfigGenerator(self.resolve_settings(
+            {'appid': appid, 'language': language, 'info_html': info_html}), self.catalog)
+        return generator.load_game_info()
+
+    def submit(self, job_type, settings):
+        """
+        Queue a job
+
+        Args:
+            job_type (str): "generate", "achievements" or "patch"
+            settings (dict): ConfigGenerator settings, a patch job names its generate job in "job"
+
+        Returns:
+            dict: Job status
+        """
+        if job_type not in self.JOB_TYPES:
+            raise ValueError(f"Unknown job type: {job_type}")
+        settings = self.resolve_settings(settings)
+
+        with self._lock:
+            if job_type == "patch" and settings.get('job') not in self._generators:
+                raise ValueError("Patch jobs need a finished generate job")
+
+            active = sum(1 for job in self._jobs.values()
+                         if job['state'] in ("queued", "running"))
+            if active >= self.max_queued:
+                raise OverflowError("Too many queued jobs, try again later")
+
+            job_id = uuid.uuid4().hex[:12]
+            job = {
+                'id': job_id,
+                'type': job_type,
+                'state': "queued",
+                'stage': "",
+                'messages': [],
+                'error': None,
+                'result': None,
+                'artifacts': [],
+                'created': time.time()
+            }
+            self._jobs[job_id] = job
+
+        self._pool.submit(self._run_job, job, settings)
+        return self.get_job(job_id)
+
+    def get_job(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return json.loads(json.dumps(job)) if job else None
+
+    def list_jobs(self):
+        with self._lock:
+            return [{key: job[key] for key in ('id', 'type', 'state', 'stage')}
+                    for job in self._jobs.values()]
+
+    def get_artifact_path(self, job_id, name):
+        """Get the path of a job artifact, None if it does not exist"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or name not in job['artifacts']:
+                return None
+        return os.path.join(self.jobs_dir, job_id, "artifacts", name)
+
+    def _update(self, job, **changes):
+        with self._lock:
+            job.update(changes)
+
+    def _run_job(self, job, settings):
+        job_dir = os.path.join(self.jobs_dir, job['id'])
+        artifacts_dir = os.path.join(job_dir, "artifacts")
+        os.makedirs(artifacts_dir, exist_ok=True)
+        self._update(job, state="running")
+
+        def notify(level, title, message):
+            with self._lock:
+                job['messages'].append(
+                    {'level': level, 'title': title, 'message': message})
+
+        try:
+            if job['type'] == "patch":
+                with self._lock:
+                    source = self._generators[settings['job']]
+                    patch_lock = self._patch_locks.setdefault(settings['job'], threading.Lock())
+                patch_settings = {key: settings[key] for key in (
+                    'patch_type', 'steamapi_dll_path', 'game_root', 'delta_patch', 'previous_patch')
+                    if key in settings}
+                patch_settings['generate_patch'] = True
+                generator = source.clone(patch_settings, notify=notify,
+                                         status=lambda text: self._update(job, stage=text))
+                with patch_lock:
+                    generator.run(['patch'])
+                    self._copy_patch_artifacts(job, generator, artifacts_dir)
+            else:
+                settings['output_root'] = os.path.join(job_dir, "Output")
+                settings['temp_dir'] = os.path.join(job_dir, "_temp")
+                generator = ConfigGenerator(settings, self.catalog, notify=notify,
+                                            status=lambda text: self._update(job, stage=text))
+
+                if job['type'] == "achievements":
+                    generator.load_game_info()
+                    achievements = generator.extract_achievements_from_html()
+                    self._save_artifact(job, "achievements.json", "".join(
+                        generator.emit_achievements_json(achievements)).encode('utf-8'))
+                    self._update(job, result={'game_info': generator.game_info,
+                                              'achievement_count': len(achievements)})
+                else:
+                    # Reject bad jobs before anything is written
+                    generator.detect_game_files()
+                    plan = generator.plan()
+                    for entry in plan['problems']:
+                        notify(entry['level'], "Plan", entry['message'])
+                    if not plan['ok']:
+                        raise ValueError("; ".join(entry['message'] for entry in plan['problems']
+                                                   if entry['level'] == 'error'))
+                    achievements = generator.run()
+                    self._package_output(job, generator)
+                    self._update(job, result={'game_info': generator.game_info,
+                                              'achievement_count': len(achievements)})
+                    with self._lock:
+                        self._generators[job['id']] = generator
+
+            if job['type'] == "generate" and generator.settings['generate_patch']:
+                self._copy_patch_artifacts(job, generator, artifacts_dir)
+
+            self._update(job, state="done", stage="")
+        except Exception as e:
+            log.warning(f"Job {job['id']} failed: {e}")
+            self._update(job, state="failed", error=str(e))
+
+    def _copy_patch_artifacts(self, job, generator, artifacts_dir):
+        """Copy Patch.zip, its manifest and delta patch of the output folder to the job artifacts"""
+        for name in ("Patch.zip", PATCH_MANIFEST_NAME, DELTA_PATCH_NAME, DELTA_DELETED_NAME):
+            patch_path = os.path.join(generator.output_dir, name)
+            if not os.path.exists(patch_path):
+                continue
+            shutil.copy2(patch_path, os.path.join(artifacts_dir, name))
+            with self._lock:
+                if name not in job['artifacts']:
+                    job['artifacts'].append(name)
+
+    def _save_artifact(self, job, name, content):
+        with open(os.path.join(self.jobs_dir, job['id'], "artifacts", name), "wb") as f:
+            f.write(content)
+        with self._lock:
+            job['artifacts'].append(name)
+
+    def _package_output(self, job, generator):
+        """Package Output/{game name} as output.zip"""
+        zip_path = os.path.join(self.jobs_dir, job['id'], "artifacts", "output.zip")
+        output_dir = generator.output_dir
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for root, dirs, files in os.walk(output_dir):
+                for file in files:
+                    if file == "Patch.zip":
+                        continue
+                    file_path = os.path.join(root, file)
+                    zipf.write(file_path, os.path.join(
+                        generator.safe_game_name, os.path.relpath(file_path, output_dir)))
+        with self._lock:
+            job['artifacts'].append("output.zip")
+
+
+class _ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API of GenerationService
+
+        GET  /api/games/{appid}?language=&info_html=  Game name and DLC list
+        POST /api/uploads?filename=                    Upload a saved page (application/octet-stream body), returns its upload ID
+        POST /api/plan                                 {"settings": {...}}, output plan of a generate job
+        POST /api/jobs                                 {"type": ..., "settings": {...}}, returns the queued job
+        GET  /api/jobs                                 All jobs
+        GET  /api/jobs/{id}                            Job status
+        GET  /api/jobs/{id}/artifacts/{name}           Download output.zip, achievements.json or Patch.zip
+    """
+
+    service = None
+
+    def log_message(self, format, *args):
+        log.info(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error_json(self, status, message):
+        self._send_json(status, {'error': message})
+
+    def _has_content_type(self, expected):
+        # Browsers send text/plain cross-site without asking first, other types they do not
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        return content_type == expected
+
+    def _send_file(self, file_path):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(file_path)))
+        self.send_header("Content-Disposition",
+                         f'attachment; filename="{os.path.basename(file_path)}"')
+        self.end_headers()
+        with open(file_path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        parts = [part for part in url.path.split("/") if part]
+
+        try:
+            if parts[:2] == ["api", "games"] and len(parts) == 3:
+                game_info = self.service.get_game_info(
+                    parts[2], query.get("language", "english"), query.get("info_html"))
+                if not game_info:
+                    self._send_error_json(404, "Failed to get game information")
+                else:
+                    self._send_json(200, game_info)
+            elif parts == ["api", "jobs"]:
+                self._send_json(200, self.service.list_jobs())
+            elif parts[:2] == ["api", "jobs"] and len(parts) == 3:
+                job = self.service.get_job(parts[2])
+                if job:
+                    self._send_json(200, job)
+                else:
+                    self._send_error_json(404, "Unknown job")
+            elif parts[:2] == ["api", "jobs"] and len(parts) == 5 and parts[3] == "artifacts":
+                artifact_path = self.service.get_artifact_path(parts[2], parts[4])
+                if artifact_path:
+                    self._send_file(artifact_path)
+                else:
+                    self._send_error_json(404, "Unknown artifact")
+            else:
+                self._send_error_json(404, "Not found")
+        except ValueError as e:
+            self._send_error_json(400, str(e))
+        except Exception as e:
+            self._send_error_json(500, str(e))
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        parts = [part for part in url.path.split("/") if part]
+        length = int(self.headers.get("Content-Length", 0))
+
+        try:
+            if parts == ["api", "uploads"] and not self._has_content_type("application/octet-stream"):
+                self._send_error_json(415, "Uploads must be sent as application/octet-stream")
+            elif parts == ["api", "uploads"]:
+                upload_id = self.service.save_upload(
+                    query.get("filename") or self.headers.get("X-Filename"), self.rfile, length)
+                self._send_json(201, {'upload_id': upload_id})
+            elif parts in (["api", "plan"], ["api", "jobs"]) and not self._has_content_type("application/json"):
+                self._send_error_json(415, "Requests must be sent as application/json")
+            elif parts == ["api", "plan"]:
+                request = json.loads(self.rfile.read(length) or b"{}")
+                self._send_json(200, self.service.plan(request.get("settings", {})))
+            elif parts == ["api", "jobs"]:
+                request = json.loads(self.rfile.read(length) or b"{}")
+                job = self.service.submit(
+                    request.get("type", "generate"), request.get("settings", {}))
+                self._send_json(202, job)
+            else:
+                self._send_error_json(404, "Not found")
+        except OverflowError as e:
+            self._send_error_json(503, str(e))
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_error_json(400, str(e))
+        except Exception as e:
+            self._send_error_json(500, str(e))
+
+
+class AchievementDisplayWindow:
+    def __init__(self, achievements, game_name, language="english"):
+        self.achievements = achievements
+        self.game_name = game_name
+        self.language = language
+        self.window = tk.Toplevel()
+        self.window.title(
+            f"Achievement List - Total {len(achievements)} achievements")
+        self.window.geometry("1000x800")
+
+        self.setup_ui()
+        self.display_achievements()
+
+    def setup_ui(self):
+        # Main frame
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Title
+        title_label = ttk.Label(main_frame, text=f"Achievement List ({len(self.achievements)} achievements)",
+                                font=("Arial", 14, "bold"))
+        title_label.pack(pady=(0, 10))
+
+        # Create scroll box
+        self.canvas = tk.Canvas(main_frame, bg="white")
+        self.scrollbar = ttk.Scrollbar(
+            main_frame, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = ttk.Frame(self.canvas)
+
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(
+                scrollregion=self.canvas.bbox("all"))
+        )
+
+        self.canvas.create_window(
+            (0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        # Bind mouse wheel
+        def _on_mousewheel(event):
+            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+        self.canvas.bind("<MouseWheel>", _on_mousewheel)
+
+        # Layout scroll components
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Bottom button bar
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        ttk.Button(button_frame, text="Close Window", command=self.window.destroy).pack(
+            side=tk.RIGHT, padx=5)
+
+    def display_achievements(self):
+        """Display achievement list"""
+        if not self.achievements:
+            ttk.Label(self.scrollable_frame,
+                      text="No achievement data available").pack(pady=20)
+            return
+
+        # Display each achievement
+        for i, achievement in enumerate(self.achievements):
+            self.create_achievement_widget(
+                self.scrollable_frame, achievement, i)
+
+    def create_achievement_widget(self, parent, achievement, index):
+        """Create display widget for a single achievement"""
+        # Main frame
+        achievement_frame = ttk.Frame(parent, relief=tk.RIDGE, borderwidth=1)
+        achievement_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        # Left side: Image area
+        image_frame = ttk.Frame(achievement_frame)
+        image_frame.pack(side=tk.LEFT, padx=10, pady=10)
+
+        # Get game name to build path
+        game_name = self.game_name
+        safe_game_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
+
+        # Load and display normal icon
+        icon_path = achievement.get('icon', '')
+        if icon_path:
+            full_icon_path = os.path.join(
+                "Output", safe_game_name, "steam_settings", "achievement_images", icon_path)
+            if os.path.exists(full_icon_path):
+                try:
+                    img = Image.open(full_icon_path)
+                    img = img.resize((64, 64), Image.Resampling.LANCZOS)
+                    photo = ImageTk.PhotoImage(img)
+
+                    icon_label = ttk.Label(image_frame, image=photo)
+                    icon_label.image = photo  # Keep reference
+                    icon_label.pack(side=tk.TOP, pady=2)
+
+                    ttk.Label(image_frame, text="Normal Icon",
+                              font=("Arial", 8)).pack()
+                except Exception as e:
+                    ttk.Label(image_frame, text="Normal Icon\nLoad Failed",
+                              width=12, anchor=tk.CENTER).pack(pady=2)
+            else:
+                ttk.Label(image_frame, text="No Normal Icon", width=12,
+                          anchor=tk.CENTER).pack(pady=2)
+        else:
+            ttk.Label(image_frame, text="No Normal Icon", width=12,
+                      anchor=tk.CENTER).pack(pady=2)
+
+        # Separator
+        ttk.Label(image_frame, text="").pack(pady=5)
+
+        # Load and display gray icon
+        icon_gray_path = achievement.get(
+            'icongray', achievement.get('icon_gray', ''))
+        if icon_gray_path:
+            full_icon_gray_path = os.path.join(
+                "Output", safe_game_name, "steam_settings", "achievement_images", icon_gray_path)
+            if os.path.exists(full_icon_gray_path):
+                try:
+                    img_gray = Image.open(full_icon_gray_path)
+                    img_gray = img_gray.resize(
+                        (64, 64), Image.Resampling.LANCZOS)
+                    photo_gray = ImageTk.PhotoImage(img_gray)
+
+                    icon_gray_label = ttk.Label(image_frame, image=photo_gray)
+                    icon_gray_label.image = photo_gray  # Keep reference
+                    icon_gray_label.pack(side=tk.TOP, pady=2)
+
+                    ttk.Label(image_frame, text="Gray Icon",
+                              font=("Arial", 8)).pack()
+                except Exception as e:
+                    ttk.Label(image_frame, text="Gray Icon\nLoad Failed",
+                              width=12, anchor=tk.CENTER).pack(pady=2)
+            else:
+                ttk.Label(image_frame, text="No Gray Icon", width=12,
+                          anchor=tk.CENTER).pack(pady=2)
+        else:
+            ttk.Label(image_frame, text="No Gray Icon", width=12,
+                      anchor=tk.CENTER).pack(pady=2)
+
+        # Right side: Text information
         text_frame = ttk.Frame(achievement_frame)
         text_frame.pack(side=tk.LEFT, fill=tk.BOTH,
                         expand=True, padx=10, pady=10)
@@ -491,12 +5633,14 @@ class AchievementDisplayWindow:
         title_label.pack(anchor=tk.W)
 
         # Display name
-        display_name = achievement.get('displayName', 'N/A')
+        display_name = localized_text(
+            achievement.get('displayName', 'N/A'), self.language)
         ttk.Label(text_frame, text=f"Display Name: {display_name}", font=(
             "Arial", 10, "bold")).pack(anchor=tk.W, pady=(5, 0))
 
         # Description
-        description = achievement.get('description', 'N/A')
+        description = localized_text(
+            achievement.get('description', 'N/A'), self.language)
         desc_label = ttk.Label(
             text_frame, text=f"Description: {description}", font=("Arial", 9), wraplength=500)
         desc_label.pack(anchor=tk.W, pady=(2, 0))
@@ -520,6 +5664,218 @@ class AchievementDisplayWindow:
             fill=tk.X, padx=5, pady=5)
 
 
+class JobQueueWindow:
+    """Queue of configured games, generated by a configurable number of workers"""
+
+    def __init__(self, root, max_workers=2):
+        self.root = root
+        self.jobs = []
+        self.max_workers_var = tk.IntVar(value=max_workers)
+        self.window = None
+        self.tree = None
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def show(self):
+        """Open the queue window, or bring it to front"""
+        if self.window is not None and self.window.winfo_exists():
+            self.window.deiconify()
+            self.window.lift()
+            return
+
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Job Queue")
+        self.window.geometry("800x400")
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Worker count
+        settings_frame = ttk.Frame(main_frame)
+        settings_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(settings_frame, text="Concurrent Jobs:").pack(side=tk.LEFT)
+        ttk.Spinbox(settings_frame, from_=1, to=8, width=5, textvariable=self.max_workers_var,
+                    command=self._dispatch).pack(side=tk.LEFT, padx=(5, 0))
+
+        # Job list
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(list_frame, columns=("appid", "state", "progress", "stage"),
+                                 selectmode="extended")
+        self.tree.heading("#0", text="Game")
+        self.tree.heading("appid", text="AppID")
+        self.tree.heading("state", text="Status")
+        self.tree.heading("progress", text="Progress")
+        self.tree.heading("stage", text="Step")
+        self.tree.column("#0", width=220)
+        self.tree.column("appid", width=80)
+        self.tree.column("state", width=80)
+        self.tree.column("progress", width=70)
+        self.tree.column("stage", width=300)
+        scrollbar = ttk.Scrollbar(
+            list_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<Double-1>", lambda e: self.show_results())
+
+        # Bottom button bar
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(button_frame, text="Show Results",
+                   command=self.show_results).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel Job",
+                   command=self.cancel_selected).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear Finished",
+                   command=self.clear_finished).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Close Window",
+                   command=self.window.withdraw).pack(side=tk.RIGHT, padx=5)
+
+    def add(self, generator):
+        """Queue a configured generator"""
+        with self._lock:
+            job = {
+                'id': self._next_id,
+                'generator': generator,
+                'state': "Queued",
+                'stage': "",
+                'progress': "",
+                'messages': [],
+                'achievements': []
+            }
+            self._next_id += 1
+            self.jobs.append(job)
+
+        # Jobs run concurrently, each needs its own temporary folder
+        generator.settings['temp_dir'] = f"_temp_{job['id']}"
+        generator.notify = lambda level, title, message: self._add_message(
+            job, f"{title}: {message}")
+        generator.ask_retry = lambda error: False
+        generator.status = lambda text: self._update(job, stage=text)
+        generator.progress = lambda done, total: self._update(
+            job, progress=f"{done}/{total}")
+
+        self.show()
+        self._dispatch()
+
+    def _update(self, job, **changes):
+        with self._lock:
+            job.update(changes)
+        self.root.after(0, self.refresh)
+
+    def _add_message(self, job, message):
+        with self._lock:
+            job['messages'].append(message)
+
+    def _dispatch(self):
+        """Start queued jobs while fewer than the configured number are running"""
+        try:
+            max_workers = max(1, int(self.max_workers_var.get()))
+        except (tk.TclError, ValueError):
+            max_workers = 1
+
+        with self._lock:
+            running = sum(1 for job in self.jobs if job['state'] == "Running")
+            for job in self.jobs:
+                if running >= max_workers:
+                    break
+                if job['state'] == "Queued":
+                    job['state'] = "Running"
+                    running += 1
+                    threading.Thread(target=self._run_job,
+                                     args=(job,), daemon=True).start()
+        self.root.after(0, self.refresh)
+
+    def _run_job(self, job):
+        generator = job['generator']
+        try:
+            # Check every input before anything is written
+            plan = generator.plan()
+            errors = [entry['message']
+                      for entry in plan['problems'] if entry['level'] == 'error']
+            if errors:
+                raise ValueError("; ".join(errors))
+
+            achievements = generator.run()
+            self._update(job, state="Done", achievements=achievements,
+                         stage=f"Generated to {generator.output_dir}")
+        except GenerationCancelled:
+            self._update(job, state="Cancelled", stage="")
+        except Exception as e:
+            log.warning(f"Job {job['id']} failed: {e}")
+            self._add_message(job, str(e))
+            self._update(job, state="Failed", stage=str(e))
+        finally:
+            self._dispatch()
+
+    def _selected_jobs(self):
+        if self.tree is None:
+            return []
+        selected = {int(item) for item in self.tree.selection()}
+        return [job for job in self.jobs if job['id'] in selected]
+
+    def cancel_selected(self):
+        """Cancel queued jobs, running jobs stop before their next step"""
+        for job in self._selected_jobs():
+            with self._lock:
+                if job['state'] == "Queued":
+                    job['state'] = "Cancelled"
+                elif job['state'] == "Running":
+                    job['stage'] = "Cancelling..."
+                    job['generator'].cancel()
+        self.refresh()
+
+    def clear_finished(self):
+        with self._lock:
+            self.jobs = [job for job in self.jobs
+                         if job['state'] in ("Queued", "Running")]
+        self.refresh()
+
+    def show_results(self):
+        """Show achievements and messages of the selected finished jobs"""
+        for job in self._selected_jobs():
+            if job['state'] not in ("Done", "Failed"):
+                continue
+            generator = job['generator']
+            game_name = generator.game_info.get('game_name', 'Game')
+            if job['achievements']:
+                AchievementDisplayWindow(
+                    job['achievements'], game_name, generator.settings['language'])
+
+            result_message = f"{game_name}: {job['state']}\n"
+            if job['state'] == "Done":
+                result_message += f"Output folder: {generator.output_dir}\n"
+                result_message += f"Achievement count: {len(job['achievements'])}\n"
+            for message in job['messages']:
+                result_message += f"- {message}\n"
+            messagebox.showinfo("Job Results", result_message,
+                                parent=self.window)
+
+    def refresh(self):
+        """Update the job list"""
+        if self.tree is None or not self.tree.winfo_exists():
+            return
+
+        with self._lock:
+            rows = [(str(job['id']), job['generator'].game_info.get('game_name', 'Game'),
+                     (job['generator'].appid, job['state'], job['progress'], job['stage']))
+                    for job in self.jobs]
+
+        existing = set(self.tree.get_children())
+        for item, game_name, values in rows:
+            if item in existing:
+                self.tree.item(item, text=game_name, values=values)
+                existing.discard(item)
+            else:
+                self.tree.insert("", tk.END, iid=item,
+                                 text=game_name, values=values)
+        for item in existing:
+            self.tree.delete(item)
+
+
 class GSEGeneratorGUI:
     def __init__(self, root):
         self.root = root
@@ -568,6 +5924,10 @@ class GSEGeneratorGUI:
         self.custom_ico_path = ""
         self.community_achievement_html = ""
 
+        # Multi-language achievement localization
+        self.multi_language_var = tk.BooleanVar(value=False)
+        self.localization_languages = []
+
         # Error handling flags
         self.missing_core_files = []
         self.missing_overlay_files = []
@@ -581,7 +5941,29 @@ class GSEGeneratorGUI:
         self.generate_patch_var = tk.BooleanVar(value=False)
         self.game_root_path_var = tk.StringVar()
         self.steamapi_dll_path = ""
+        self.detected_steamapi_dirs = []
         self.patch_type = ""  # "regular" or "experimental"
+        self.delta_patch_var = tk.BooleanVar(value=False)
+        self.previous_patch_path = ""
+
+        # Local catalog of apps, DLCs and achievements
+        self.use_catalog_var = tk.BooleanVar(value=True)
+        try:
+            self.catalog = LocalCatalog()
+        except sqlite3.Error as e:
+            log.warning(f"Cannot open local catalog: {e}")
+            self.catalog = None
+
+        # Watch mode re-runs the affected stages when inputs change
+        self.watch_var = tk.BooleanVar(value=False)
+        self.watcher = None
+
+        # Queue of configured games generated in the background
+        self.job_queue = JobQueueWindow(root)
+
+        # Speculative game information prefetch
+        self._prefetch_after_id = None
+        self._prefetch_cancel = None
 
         # Check directory integrity at startup
         self.check_directory_integrity()
@@ -596,27 +5978,12 @@ class GSEGeneratorGUI:
     def check_directory_integrity(self):
         """Check program directory integrity"""
         # Check core files
-        core_files = [
-            "ColdClientLoader.ini",
-            "GameOverlayRenderer.dll",
-            "GameOverlayRenderer64.dll",
-            "steamclient.dll",
-            "steamclient_loader_x64.exe",
-            "steamclient64.dll"
-        ]
-
-        for file in core_files:
+        for file in CORE_FILES:
             if not os.path.exists(os.path.join("source", file)):
                 self.missing_core_files.append(file)
 
         # Check overlay files
-        overlay_files = [
-            "steam_settings/configs.overlay.ini",
-            "steam_settings/sounds/overlay_achievement_notification.wav",
-            "steam_settings/fonts/Roboto-Medium.ttf"
-        ]
-
-        for file in overlay_files:
+        for file in OVERLAY_FILES:
             if not os.path.exists(os.path.join("source", file)):
                 self.missing_overlay_files.append(file)
 
@@ -641,22 +6008,47 @@ class GSEGeneratorGUI:
             )
             self.overlay_files_missing = True
 
-    def check_patch_files(self):
-        """Check if patch-related files exist"""
+        # Verify file hashes against the known-good manifest in the background
+        threading.Thread(target=self._verify_integrity_worker,
+                         daemon=True).start()
 
-        regular_files = [
-            "source/GSE_DLL/regular/steam_api.dll",
-            "source/GSE_DLL/regular/steam_api64.dll"
-        ]
+    def _verify_integrity_worker(self):
+        try:
+            result = verify_source_integrity()
+        except Exception as e:
+            log.warning(f"Failed to verify source files: {e}")
+            return
+        if result is None:
+            log.info(
+                f"{SOURCE_MANIFEST_PATH} not found, source files not verified")
+            return
+        log.info(f"Source files verified: {result['verified']}")
+        if result['missing'] or result['corrupted']:
+            self.root.after(0, self._show_integrity_problems, result)
+
+    def _show_integrity_problems(self, result):
+        """Show source files that do not match the manifest, corrupted core files block generation"""
+        for path in result['corrupted']:
+            file = os.path.relpath(path, "source").replace(os.sep, '/')
+            if file in CORE_FILES and file not in self.missing_core_files:
+                self.missing_core_files.append(file)
+            elif file in OVERLAY_FILES:
+                self.overlay_files_missing = True
 
-        experimental_files = [
-            "source/GSE_DLL/experimental/steam_api.dll",
-            "source/GSE_DLL/experimental/steam_api64.dll"
-        ]
+        problems = [f"{path} (corrupted)" for path in result['corrupted']] + \
+            [f"{path} (missing)" for path in result['missing']]
+        messagebox.showerror(
+            "Source Files Corrupted",
+            "The following files do not match the known-good source files, please download them again, see README file for details:\n" +
+            "\n".join(problems)
+        )
+        self.check_enable_extract_button()
 
+    def check_patch_files(self):
+        """Check if patch-related files exist"""
         missing_files = []
 
-        for file in regular_files + experimental_files:
+        for file in PATCH_FILES["regular"] + PATCH_FILES["experimental"]:
             if not os.path.exists(file):
                 missing_files.append(file)
 
@@ -670,22 +6062,6 @@ class GSEGeneratorGUI:
 
         return True
 
-    def get_relative_path(self, base_path, target_path):
-        """Get relative path"""
-        base_path = os.path.normpath(base_path)
-        target_path = os.path.normpath(target_path)
-
-        # Use os.path.relpath to get relative path
-        try:
-            relative_path = os.path.relpath(target_path, base_path)
-            # If relative path starts with .., it means target_path is not under base_path
-            if relative_path.startswith('..'):
-                return target_path
-            return relative_path
-        except ValueError:
-            # Different drive case
-            return target_path
-
     def setup_ui(self):
         # Main container
         main_container = ttk.Frame(self.root)
@@ -747,6 +6123,7 @@ class GSEGeneratorGUI:
         ttk.Label(appid_frame, text="AppID:", font=(
             "Arial", 10, "bold")).pack(side=tk.LEFT)
         self.appid_var = tk.StringVar()
+        self.appid_var.trace_add('write', self.on_appid_change)
         appid_entry = ttk.Entry(
             appid_frame, textvariable=self.appid_var, font=("Arial", 10), width=15)
         appid_entry.pack(side=tk.LEFT, padx=(10, 10))
@@ -801,6 +6178,24 @@ class GSEGeneratorGUI:
                         command=self.on_patch_checkbox_change).grid(
             row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
 
+        # Multi-language achievements option
+        ttk.Checkbutton(config_frame, text="Multi-Language Achievements", variable=self.multi_language_var,
+                        command=self.on_multi_language_change).grid(
+            row=6, column=0, columnspan=2, sticky=tk.W, pady=5)
+
+        # Local catalog option
+        ttk.Checkbutton(config_frame, text="Use Local Catalog", variable=self.use_catalog_var).grid(
+            row=6, column=5, columnspan=2, sticky=tk.W, pady=5)
+
+        # Watch mode option
+        ttk.Checkbutton(config_frame, text="Watch Mode", variable=self.watch_var,
+                        command=self.on_watch_mode_change).grid(
+            row=7, column=0, columnspan=2, sticky=tk.W, pady=5)
+
+        # Delta patch option
+        ttk.Checkbutton(config_frame, text="Delta Patch", variable=self.delta_patch_var).grid(
+            row=7, column=5, columnspan=2, sticky=tk.W, pady=5)
+
         # File selection area
         file_frame = ttk.LabelFrame(
             main_frame, text="File Selection", padding="15")
@@ -904,7 +6299,7 @@ class GSEGeneratorGUI:
         )
         achievement_link.pack(side=tk.LEFT, padx=(0, 20))
         achievement_link.bind(
-            "<Button-1>", lambda e: self.open_url(f"https://steamcommunity.com/stats/{self.appid_var.get()}/achievements/?l={self.game_language.get()}"))
+            "<Button-1>", lambda e: self.open_url(f"{COMMUNITY_URL}/stats/{self.appid_var.get()}/achievements/?l={self.game_language.get()}"))
 
         # Operation buttons
         button_frame = ttk.Frame(main_frame)
@@ -916,6 +6311,11 @@ class GSEGeneratorGUI:
                                          command=self.extract_achievements, state=initial_state)
         self.extract_button.pack(side=tk.LEFT, padx=(0, 10))
 
+        ttk.Button(button_frame, text="Add to Queue",
+                   command=self.add_to_queue).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(button_frame, text="Job Queue",
+                   command=lambda: self.job_queue.show()).pack(side=tk.LEFT, padx=(0, 10))
+
         ttk.Button(button_frame, text="Exit Program",
                    command=self.root.quit).pack(side=tk.RIGHT)
 
@@ -944,6 +6344,33 @@ class GSEGeneratorGUI:
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind("<MouseWheel>", _on_mousewheel)
 
+    def on_appid_change(self, *args):
+        """Schedule a debounced prefetch of game information when the AppID changes"""
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+            self._prefetch_after_id = None
+
+        # Cancel stale prefetch
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+        appid = str(self.appid_var.get()).strip()
+        if not appid.isdigit() or len(appid) > 10 or int(appid) == 0:
+            return
+
+        self._prefetch_after_id = self.root.after(
+            PREFETCH_DELAY_MS, self._start_prefetch, int(appid))
+
+    def _start_prefetch(self, appid):
+        """Start background prefetch of game information"""
+        self._prefetch_after_id = None
+        self._prefetch_cancel = threading.Event()
+        threading.Thread(target=prefetch_game_info,
+                         args=(appid, self.game_language.get(),
+                               self._prefetch_cancel),
+                         daemon=True).start()
+
     def on_patch_checkbox_change(self):
         """Handle patch checkbox state change"""
         if self.generate_patch_var.get():
@@ -951,6 +6378,65 @@ class GSEGeneratorGUI:
             if not self.check_patch_files():
                 self.generate_patch_var.set(False)
 
+    def on_multi_language_change(self):
+        """Handle multi-language achievements checkbox state change"""
+        if self.multi_language_var.get():
+            if not self.select_localization_languages():
+                self.multi_language_var.set(False)
+
+    def select_localization_languages(self):
+        """Select Steam Community languages for achievement localization"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Select Achievement Languages")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        # Center display
+        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() +
+                        50, self.root.winfo_rooty() + 50))
+
+        # Prompt text
+        ttk.Label(dialog, text="Please select the languages to fetch from Steam Community:",
+                  font=("Arial", 11)).pack(padx=20, pady=(20, 10))
+
+        # Language checkbox grid
+        languages_frame = ttk.Frame(dialog)
+        languages_frame.pack(padx=20, pady=5)
+
+        selected = self.localization_languages or [
+            "english", self.game_language.get()]
+        language_vars = {}
+        for index, (language_name, language_code) in enumerate(self.language_mapping.items()):
+            var = tk.BooleanVar(value=language_code in selected)
+            language_vars[language_code] = var
+            ttk.Checkbutton(languages_frame, text=language_name, variable=var).grid(
+                row=index // 3, column=index % 3, sticky=tk.W, padx=5, pady=2)
+
+        result = tk.BooleanVar(value=False)
+
+        # Button frame
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=10)
+
+        def confirm():
+            result.set(True)
+            dialog.destroy()
+
+        ttk.Button(button_frame, text="OK", command=confirm,
+                   width=10).pack(side=tk.LEFT, padx=20)
+        ttk.Button(button_frame, text="Cancel", command=dialog.destroy,
+                   width=10).pack(side=tk.LEFT, padx=20)
+
+        dialog.wait_window()
+
+        languages = [code for code, var in language_vars.items() if var.get()]
+        if not result.get() or not languages:
+            return False
+
+        self.localization_languages = languages
+        return True
+
     def browse_game_root_folder(self):
         """Browse game root directory"""
         folder = filedialog.askdirectory(
@@ -960,6 +6446,36 @@ class GSEGeneratorGUI:
             # Check if extract button can be enabled
             self.check_enable_extract_button()
 
+            # Look for the game EXE and steamapi dll in the background
+            self.detected_steamapi_dirs = []
+            self.status_var.set("Scanning game root directory...")
+            threading.Thread(target=self._detect_game_files_worker,
+                             args=(folder, self.game_info.get('game_name', '')), daemon=True).start()
+
+    def _detect_game_files_worker(self, folder, game_name):
+        try:
+            result = scan_game_root(folder, game_name)
+        except Exception as e:
+            log.warning(f"Game root scan failed: {e}")
+            result = {'exes': [], 'steam_api_dirs': []}
+        self.root.after(0, self._apply_detected_game_files, folder, result)
+
+    def _apply_detected_game_files(self, folder, result):
+        """Use the best EXE and steamapi dll folders found in the game root (unless changed meanwhile)"""
+        if os.path.normpath(self.game_root_path_var.get().strip()) != os.path.normpath(folder):
+            return
+
+        self.detected_steamapi_dirs = [os.path.normpath(os.path.join(folder, path))
+                                       for path in result['steam_api_dirs']]
+        exe_path = self.exe_path_var.get().strip()
+        if result['exes'] and not (exe_path and ConfigGenerator.is_within(folder, exe_path)):
+            self.exe_path_var.set(os.path.join(folder, result['exes'][0]['path']).replace('\\', '/'))
+
+        self.check_enable_extract_button()
+        if result['exes']:
+            self.status_var.set(
+                f"Detected game EXE: {result['exes'][0]['path']}, please check before generating")
+
     def setup_right_panel(self):
         """Setup right information panel"""
         # Game Header image display area
@@ -1033,6 +6549,15 @@ class GSEGeneratorGUI:
 
     def select_steamapi_dll_folder(self):
         """Select folder containing steamapi dll files"""
+        # Offer the folder found by the game root scan first
+        game_root_path = self.game_root_path_var.get().strip()
+        if self.detected_steamapi_dirs:
+            detected = self.detected_steamapi_dirs[0]
+            if ConfigGenerator.is_within(game_root_path, detected) and messagebox.askyesno(
+                    "SteamAPI DLL Folder", f"Use the detected steamapi dll folder?\n\n{detected}"):
+                self.steamapi_dll_path = detected
+                return True
+
         folder = filedialog.askdirectory(
             title="Select Folder Containing SteamAPI DLL Files")
         if folder:
@@ -1137,13 +6662,13 @@ class GSEGeneratorGUI:
         html_path = self.info_html_path_var.get()
 
         # Check if HTML file is provided
-        if not html_path or not os.path.exists(html_path) or self.pre_appid:
+        if not page_exists(html_path) or self.pre_appid:
             html_mode = False
         else:
             html_mode = True
 
-        # Check html file type
-        if html_path:
+        # Check html file type (page store references are HTML pages)
+        if html_path and not parse_page_reference(html_path):
             if not os.path.splitext(html_path)[1].lower() == '.html':
                 html_mode = False
                 messagebox.showerror("Warning",
@@ -1151,10 +6676,19 @@ class GSEGeneratorGUI:
                                      )
 
         try:
-            # Get game and DLC information
+            # Get game and DLC information, local catalog first
             web_language = self.game_language.get()
-            self.game_info = get_game_dlc_info(
-                appid, web_language, html_mode, html_path)
+            self.game_info = self.load_catalog_game_info(
+                appid, html_mode, html_path)
+            if not self.game_info:
+                self.game_info = get_game_dlc_info(
+                    appid, web_language, html_mode, html_path)
+                if self.game_info and self.catalog:
+                    if html_mode:
+                        self.catalog.store_app(
+                            self.game_info, 'steamdb_html', html_path)
+                    else:
+                        self.catalog.store_app(self.game_info, 'store_api')
             id = self.game_info.get('game_id', '')
             self.appid_var.set(id)
 
@@ -1166,45 +6700,31 @@ class GSEGeneratorGUI:
             self.root.after(0, self._update_game_info_ui)
 
         except Exception as e:
-            print(e)
+            log.info(e)
 
-    def download_game_images(self, appid):
-        """Download game images to _temp directory"""
-        temp_dir = "_temp"
-        if not os.path.exists(temp_dir):
-            os.makedirs(temp_dir)
+    def load_catalog_game_info(self, appid, html_mode, html_path):
+        """Get game information from the local catalog, None if not cataloged or outdated"""
+        if not self.catalog or not self.use_catalog_var.get():
+            return None
 
-        try:
-            # Download Header image
-            header_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/header.jpg"
-            header_response = requests.get(header_url)
-            if header_response.status_code == 200:
-                header_path = os.path.join(temp_dir, "header.jpg")
-                with open(header_path, "wb") as f:
-                    f.write(header_response.content)
-                print("Header image downloaded successfully")
-
-            # Download Logo
-            logo_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/logo.png"
-            logo_response = requests.get(logo_url)
-            if logo_response.status_code == 200:
-                logo_path = os.path.join(temp_dir, "logo.png")
-                with open(logo_path, "wb") as f:
-                    f.write(logo_response.content)
-                print("Logo downloaded successfully")
-
-            # Download library cover
-            library_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/library_600x900.jpg"
-            library_response = requests.get(library_url)
-            if library_response.status_code == 200:
-                library_path = os.path.join(
-                    temp_dir, "library_600x900.jpg")
-                with open(library_path, "wb") as f:
-                    f.write(library_response.content)
-                print("Library cover downloaded successfully")
+        if html_mode:
+            record = self.catalog.get_app_by_source(html_path)
+            if not record or not LocalCatalog.is_fresh(record, html_path):
+                return None
+        else:
+            if not appid:
+                return None
+            record = self.catalog.get_app(appid)
+            if not record:
+                return None
 
-        except Exception as e:
-            print(f"Failed to download images: {e}")
+        log.info(
+            f"Loaded game information from local catalog ({record['source']})")
+        return {key: record[key] for key in ('game_name', 'game_id', 'dlc_list')}
+
+    def download_game_images(self, appid):
+        """Download game images to _temp directory"""
+        download_game_images(appid)
 
     def _update_game_info_ui(self):
         """Update game information UI"""
@@ -1350,6 +6870,7 @@ class GSEGeneratorGUI:
         filename = filedialog.askopenfilename(
             title="Select Achievement HTML File",
             filetypes=[("HTML files", "*.html *.htm"),
+                       ("Achievement schema (GetSchemaForGame)", "*.json"),
                        ("All files", "*.*")]
         )
         if filename:
@@ -1367,516 +6888,224 @@ class GSEGeneratorGUI:
             filetypes=[("HTML files", "*.html *.htm"),
                        ("All files", "*.*")]
         )
-        if filename:
-            self.info_html_path_var.set(filename)
-
-    def extract_achievements(self):
-        # First validate required fields
-        if not self.username_var.get().strip():
-            messagebox.showerror("Error", "Please enter username")
-            return
-
-        if not self.userid_var.get().strip():
-            messagebox.showerror("Error", "Please enter user ID")
-            return
-
-        if not self.info_html_path_var.get().strip() and not self.appid_var.get().strip():
-            messagebox.showerror("Error", "Please enter AppID")
-            return
-
-        # Validate if game information has been fetched
-        if not self.game_info_fetched:
-            messagebox.showerror(
-                "Error", "Please get game information first")
-            return
-
-        # If patch generation is checked, perform patch-related validation and configuration
-        if self.generate_patch_var.get():
-            # Check patch files
-            if not self.check_patch_files():
-                return
-
-            # Select steamapi dll folder
-            if not self.select_steamapi_dll_folder():
-                messagebox.showwarning(
-                    "Warning", "steamapi dll folder not selected, operation cancelled")
-                return
-
-            # Select patch type
-            self.patch_type = self.select_patch_type()
-            if not self.patch_type:
-                messagebox.showwarning(
-                    "Warning", "Patch type not selected, operation cancelled")
-                return
-
-        # Check if HTML file is provided
-        if not self.achievement_html_path_var.get():
-            if os.path.isfile("achdb.html"):
-                self.achievement_html_path_var.set("achdb.html")
-                self.achievement_processing_failed = False
-            else:
-                if not self.achievement_html_path_var.get() or not os.path.exists(self.achievement_html_path_var.get()):
-                    self.achievement_processing_failed = True
-                    messagebox.showwarning(
-                        "Warning", "Missing SteamDB achievement HTML page, cannot display achievement configuration, please read README file for details")
-        else:
-            # Check html file type
-            if not (os.path.splitext(self.achievement_html_path_var.get())[1].lower() == '.html' or os.path.splitext(self.achievement_html_path_var.get())[1].lower() == '.htm'):
-                self.achievement_processing_failed = True
-                messagebox.showerror("Warning",
-                                     "Not an HTML file type, achievement fetch failed"
-                                     )
-            else:
-                self.achievement_processing_failed = False
-
-        # If custom ICO icon is selected, show selection dialog
-        if self.use_custom_ico_var.get():
-            if not self.select_custom_ico():
-                messagebox.showwarning(
-                    "Warning", "ICO file not selected, operation cancelled")
-                return
-
-        # Disable button and start progress bar
-        self.extract_button.config(state='disabled')
-        self.progress.start()
-
-        # Execute extraction operation in new thread
-        threading.Thread(target=self._extract_worker,
-                         args=(self.achievement_html_path_var.get(),), daemon=True).start()
-
-    def _extract_worker(self, html_path):
-        game_root_path = self.game_root_path_var.get().strip()
-        cmp_path = game_root_path.replace('/', '\\')
-        exe_path = self.exe_path_var.get().strip()
-
-        if not game_root_path or not os.path.exists(game_root_path):
-            messagebox.showerror(
-                "Error", "Please select a valid game root directory")
-            self.progress.stop()
-            self.status_var.set("Please reselect game root directory")
-            return
-
-        if not exe_path or not os.path.isfile(exe_path) or not exe_path.endswith(".exe"):
-            messagebox.showerror("Error", "Please select an EXE file")
-            self.progress.stop()
-            self.status_var.set("Please reselect game EXE file")
-            return
-
-        if not exe_path or not os.path.isfile(exe_path) or not os.path.commonpath([game_root_path, exe_path]) == cmp_path:
-            messagebox.showerror(
-                "Error", "Please select a valid game EXE file within the game root directory")
-            self.status_var.set(
-                "Please reselect game EXE file or game root directory")
-            self.progress.stop()
-            return
-
-        try:
-            # Get game name
-            game_name = self.game_info.get('game_name', 'Game')
-            safe_game_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
-
-            # First copy source folder to Output/{game name} folder
-            self.status_var.set("Copying source folder...")
-            self.copy_source_to_output(safe_game_name)
-
-            # Process game EXE file and icon replacement
-            self.status_var.set("Processing game EXE file...")
-            self.process_game_exe(safe_game_name)
-
-            achievements = []
-
-            # Only process achievements if HTML file is provided and not marked as failed
-            if html_path and os.path.exists(html_path) and not self.achievement_processing_failed:
-                self.status_var.set("Parsing HTML file...")
-                # Extract achievement data
-                achievements = self.extract_achievements_from_html(
-                    html_path)
-
-                # Check achievement count
-                if len(achievements) == 0:
-                    messagebox.showwarning(
-                        "Warning", "HTML file provided but no achievement data retrieved\nPlease get valid SteamDB achievement HTML page, see README file for details")
-                    self.achievement_processing_failed = True
-
-                # Copy images
-                if achievements:
-                    self.status_var.set("Copying image files...")
-                    self.copy_achievement_images(
-                        achievements, safe_game_name)
-
-                    # Auto save JSON file
-                    self.status_var.set("Saving config files...")
-                    self.save_json_file(achievements, safe_game_name)
-
-            # Generate config files
-            self.status_var.set("Generating config files...")
-            self.generate_config_files(safe_game_name)
-
-            # Copy game images to Output folder
-            self.status_var.set("Copying game images...")
-            self.copy_game_images_to_output(safe_game_name)
-
-            # Modify ColdClientLoader.ini
-            self.status_var.set("Configuring launcher...")
-            self.update_cold_client_loader_ini(safe_game_name)
-
-            # Delete steamclient_loader_x64.exe
-            self.status_var.set("Cleaning files...")
-            self.remove_steamclient_loader(safe_game_name)
-
-            # If patch generation is checked, execute patch generation operation
-            if self.generate_patch_var.get():
-                self.status_var.set("Generating patch...")
-                self.generate_patch(safe_game_name)
-
-            # Clean _temp directory
-            self.status_var.set("Cleaning temporary files...")
-            self.cleanup_temp_directory()
-
-            # Update UI in main thread
-            self.root.after(0, self._show_results,
-                            achievements, safe_game_name)
-
-        except Exception as e:
-            messagebox.showerror("Error",
-                                 f"Not a valid HTML file, or not a valid SteamDB achievement page, more info please visit README file \nInfo:{e}",
-                                 )
-            self.progress.stop()
-            self.extract_button.config(state='enable')
-            # self.root.after(0, lambda: self._handle_error(str(e)))
-
-    def generate_patch(self, safe_game_name):
-        """Generate patch"""
-
-        game_root_path = self.game_root_path_var.get().strip()
-        if not game_root_path or not os.path.exists(game_root_path):
-            messagebox.showerror(
-                "Error", "Please select a valid game root directory")
-            return
-        cmp_path = game_root_path.replace('/', '\\')
-        if not os.path.commonpath([game_root_path, self.steamapi_dll_path]) == cmp_path:
-            messagebox.showerror(
-                "Error", "Please select steamapi dll folder within the game root directory")
-            return
-
-        try:
-            # Get game root directory and steamapi dll relative path
-            game_root_path = self.game_root_path_var.get().strip()
-            if not game_root_path:
-                messagebox.showerror(
-                    "Error", "Please select game root directory")
-                return
-
-            # Get steamapi dll file relative path
-            dll_relative_path = self.get_relative_path(
-                game_root_path, self.steamapi_dll_path)
-
-            # Create relative path folder structure in _temp
-            temp_dir = "_temp"
-            if not os.path.exists(temp_dir):
-                os.makedirs(temp_dir)
-
-            temp_dll_path = os.path.join(temp_dir, dll_relative_path)
-            if not os.path.exists(temp_dll_path):
-                os.makedirs(temp_dll_path)
-
-            # Copy corresponding DLL files based on selected type
-            source_dll_dir = os.path.join(
-                "source", "GSE_DLL", self.patch_type)
-
-            # Copy all files to temp relative path
-            for item in os.listdir(source_dll_dir):
-                source_item = os.path.join(source_dll_dir, item)
-                target_item = os.path.join(temp_dll_path, item)
-
-                if os.path.isfile(source_item):
-                    shutil.copy2(source_item, target_item)
-                    print(f"Copy DLL file: {item}")
-                elif os.path.isdir(source_item):
-                    if os.path.exists(target_item):
-                        shutil.rmtree(target_item)
-                    shutil.copytree(source_item, target_item)
-                    print(f"Copy DLL folder: {item}")
-
-            # Move steam_settings folder to relative path
-            output_steam_settings = os.path.join(
-                "Output", safe_game_name, "steam_settings")
-            temp_steam_settings = os.path.join(
-                temp_dll_path, "steam_settings")
-
-            if os.path.exists(output_steam_settings):
-                if os.path.exists(temp_steam_settings):
-                    shutil.rmtree(temp_steam_settings)
-                shutil.copytree(output_steam_settings, temp_steam_settings)
-                print("Move steam_settings folder to patch path")
-
-            # Package as Patch.zip
-            zip_path = os.path.join("Output", safe_game_name, "Patch.zip")
-
-            # Get root folder to be packaged (first level of relative path)
-            relative_parts = dll_relative_path.split(os.sep)
-            if relative_parts:
-                root_folder_name = relative_parts[0]
-                root_folder_path = os.path.join(temp_dir, root_folder_name)
-
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for root, dirs, files in os.walk(root_folder_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            # Get path relative to temp_dir as path in zip
-                            arc_path = os.path.relpath(file_path, temp_dir)
-                            zipf.write(file_path, arc_path)
-
-                print(f"Patch packaged as: {zip_path}")
-
-        except Exception as e:
-            print(f"Failed to generate patch: {e}")
-            messagebox.showerror("Error", f"Failed to generate patch: {e}")
-
-    def update_cold_client_loader_ini(self, safe_game_name):
-        """Modify ColdClientLoader.ini file"""
-        ini_path = os.path.join(
-            "Output", safe_game_name, "ColdClientLoader.ini")
-
-        if not os.path.exists(ini_path):
-            print(
-                f"Warning: ColdClientLoader.ini file does not exist: {ini_path}")
-            return
-
-        try:
-            # Get game name and AppID
-            appid = self.appid_var.get().strip()
-
-            # Read INI file content
-            with open(ini_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Calculate game relative path
-            game_relative_path = ""
-            game_root_path = self.game_root_path_var.get().strip()
-            game_exe_path = self.exe_path_var.get().strip()
-
-            if game_root_path and game_exe_path and os.path.exists(game_exe_path):
-                game_relative_path = self.get_relative_path(
-                    game_root_path, game_exe_path)
-            else:
-                # If root directory or EXE path is not set, use original logic
-                if game_exe_path and os.path.exists(game_exe_path):
-                    game_relative_path = os.path.basename(game_exe_path)
-                else:
-                    game_relative_path = f"{safe_game_name}.exe"
-
-            # Modify Exe path
-            game_relative_path = self.get_relative_path(
-                game_root_path, game_exe_path).replace('\\', '/')
-            exe_pattern = r'^Exe=.*$'
-            new_exe_line = f"Exe={safe_game_name}" + \
-                "/"+f"{game_relative_path}"
-            content = re.sub(exe_pattern, new_exe_line,
-                             content, flags=re.MULTILINE)
-
-            # Modify AppId
-            appid_pattern = r'^AppId=.*$'
-            new_appid_line = f"AppId={appid}"
-            content = re.sub(appid_pattern, new_appid_line,
-                             content, flags=re.MULTILINE)
-
-            # Modify overlay injection
-            if self.overlay_var.get():
-                appid_pattern = r'^ForceInjectGameOverlayRenderer=.*$'
-                new_appid_line = f"ForceInjectGameOverlayRenderer=1"
-                content = re.sub(appid_pattern, new_appid_line,
-                                 content, flags=re.MULTILINE)
-
-            # Write back to file
-            with open(ini_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(
-                f"ColdClientLoader.ini updated: Exe: {new_exe_line}, AppId: {new_appid_line}")
-
-        except Exception as e:
-            print(f"Failed to modify ColdClientLoader.ini: {e}")
-
-    def remove_steamclient_loader(self, safe_game_name):
-        """Delete steamclient_loader_x64.exe file in Output folder"""
-        loader_path = os.path.join(
-            "Output", safe_game_name, "steamclient_loader_x64.exe")
-
-        if os.path.exists(loader_path):
-            try:
-                os.remove(loader_path)
-                print("steamclient_loader_x64.exe deleted")
-            except Exception as e:
-                print(f"Failed to delete steamclient_loader_x64.exe: {e}")
-        else:
-            print(
-                "steamclient_loader_x64.exe file does not exist, no need to delete")
-
-    def process_game_exe(self, safe_game_name):
-        """Process game EXE file and icon replacement"""
-        # Check if ResourceHacker exists
-        if not self.has_resource_hacker:
-            # Directly copy steamclient_loader_x64.exe and rename
-            source_loader = os.path.join(
-                "source", "steamclient_loader_x64.exe")
-            if os.path.exists(source_loader):
-                output_dir = os.path.join("Output", safe_game_name)
-                final_exe_path = os.path.join(
-                    output_dir, f"{safe_game_name}.exe")
-                shutil.copy2(source_loader, final_exe_path)
-                print(
-                    f"Directly copied steamclient_loader_x64.exe as: {final_exe_path}")
-                self.icon_replacement_failed = True
-                messagebox.showwarning(
-                    "Warning", "Cannot replace EXE icon, please check tool folder integrity, please read README file for details")
-            return
-        else:
-            self.icon_replacement_failed = False
+        if filename:
+            self.info_html_path_var.set(filename)
 
-        exe_path = self.exe_path_var.get().strip()
-        if not exe_path or not os.path.exists(exe_path):
-            self.exe_valid = False
-            print("Warning: Game EXE file not selected or file does not exist")
-            # If no game EXE file is selected, also directly copy steamclient_loader_x64.exe
-            source_loader = os.path.join(
-                "source", "steamclient_loader_x64.exe")
-            if os.path.exists(source_loader):
-                output_dir = os.path.join("Output", safe_game_name)
-                final_exe_path = os.path.join(
-                    output_dir, f"{safe_game_name}.exe")
-                shutil.copy2(source_loader, final_exe_path)
-                print(
-                    f"Directly copied steamclient_loader_x64.exe as: {final_exe_path}")
+    def extract_achievements(self):
+        generator = self.prepare_generator()
+        if not generator:
             return
-        else:
-            self.exe_valid = True
 
-        temp_dir = "_temp"
-        if not os.path.exists(temp_dir):
-            os.makedirs(temp_dir)
+        # A new generation replaces the watched one
+        self.stop_watch()
 
-        # Copy game EXE to _temp directory
-        game_exe_temp = os.path.join(temp_dir, "game.exe")
-        shutil.copy2(exe_path, game_exe_temp)
-        print(f"Game EXE copied to: {game_exe_temp}")
+        # Disable button and start progress bar
+        self.extract_button.config(state='disabled')
+        self.progress.start()
 
-        # Copy steamclient_loader_x64.exe to _temp directory
-        source_loader = os.path.join(
-            "source", "steamclient_loader_x64.exe")
-        if os.path.exists(source_loader):
-            loader_temp = os.path.join(
-                temp_dir, "steamclient_loader_x64.exe")
-            shutil.copy2(source_loader, loader_temp)
-            print(f"steamclient_loader_x64.exe copied to: {loader_temp}")
+        # Execute extraction operation in new thread
+        threading.Thread(target=self._extract_worker,
+                         args=(generator,), daemon=True).start()
 
-            # Decide which icon replacement method to use based on whether custom ICO icon is used
-            output_exe = os.path.join(temp_dir, "output.exe")
-            success = False
+    def add_to_queue(self):
+        """Add the game configured in the interface to the job queue"""
+        generator = self.prepare_generator()
+        if not generator:
+            return
 
-            if self.use_custom_ico_var.get() and self.custom_ico_path:
-                # Use custom ICO file
-                print(f"Using custom ICO file: {self.custom_ico_path}")
-                success = replace_exe_icon_with_ico(
-                    self.custom_ico_path, loader_temp, output_exe)
-            else:
-                # Use original icon extraction method
-                print("Using game EXE icon extraction method")
-                success = replace_exe_icon(
-                    game_exe_temp, loader_temp, output_exe)
+        self.job_queue.add(generator)
+        self.status_var.set(
+            f"{generator.game_info.get('game_name', 'Game')} added to job queue")
 
-            if success and os.path.exists(output_exe):
-                # Copy directly to Output folder
-                output_dir = os.path.join("Output", safe_game_name)
-                final_exe_path = os.path.join(
-                    output_dir, f"{safe_game_name}.exe")
-                shutil.copy2(output_exe, final_exe_path)
-                print(f"Final EXE file generated: {final_exe_path}")
-                self.icon_replacement_failed = False
-            else:
-                print("Icon replacement failed")
-                self.icon_replacement_failed = True
-        else:
-            print(
-                f"Warning: steamclient_loader_x64.exe does not exist in source folder: {source_loader}")
+    def prepare_generator(self):
+        """
+        Validate the interface fields, ask for patch / icon / translation options
+        and create the generator of the configured game
 
-    def cleanup_temp_directory(self):
-        """Clean _temp directory"""
-        temp_dir = "_temp"
-        if os.path.exists(temp_dir):
-            try:
-                shutil.rmtree(temp_dir)
-                print("_temp directory cleaned")
-            except Exception as e:
-                print(f"Failed to clean _temp directory: {e}")
+        Returns:
+            ConfigGenerator: None if validation failed or the user cancelled
+        """
+        # First validate required fields
+        if not self.username_var.get().strip():
+            messagebox.showerror("Error", "Please enter username")
+            return None
 
-    def copy_source_to_output(self, safe_game_name):
-        """Copy source folder contents to Output/{game name} folder, excluding GSE_DLL folder"""
-        source_dir = "source"
-        output_dir = os.path.join("Output", safe_game_name)
+        if not self.userid_var.get().strip():
+            messagebox.showerror("Error", "Please enter user ID")
+            return None
 
-        # Create Output/{game name} folder
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if not self.info_html_path_var.get().strip() and not self.appid_var.get().strip():
+            messagebox.showerror("Error", "Please enter AppID")
+            return None
 
-        # If source folder exists, copy all files and folders in it (excluding GSE_DLL)
-        if os.path.exists(source_dir):
-            for item in os.listdir(source_dir):
-                # Exclude GSE_DLL folder
-                if item == "GSE_DLL":
-                    print(f"Skip folder: {item}")
-                    continue
+        # Validate if game information has been fetched
+        if not self.game_info_fetched:
+            messagebox.showerror(
+                "Error", "Please get game information first")
+            return None
 
-                source_path = os.path.join(source_dir, item)
-                target_path = os.path.join(output_dir, item)
+        # If patch generation is checked, perform patch-related validation and configuration
+        if self.generate_patch_var.get():
+            # Check patch files
+            if not self.check_patch_files():
+                return None
 
-                if os.path.isfile(source_path):
-                    shutil.copy2(source_path, target_path)
-                    print(f"Copy file: {item}")
-                elif os.path.isdir(source_path):
-                    if os.path.exists(target_path):
-                        shutil.rmtree(target_path)
-                    shutil.copytree(source_path, target_path)
-                    print(f"Copy folder: {item}")
-            overlay_config_path = os.path.join(
-                output_dir, "steam_settings", "configs.overlay.ini")
-            if os.path.exists(overlay_config_path) and not self.overlay_var.get():
-                os.remove(overlay_config_path)
-                print("Delete file: steam_settings/configs.overlay.ini")
+            # Select steamapi dll folder
+            if not self.select_steamapi_dll_folder():
+                messagebox.showwarning(
+                    "Warning", "steamapi dll folder not selected, operation cancelled")
+                return None
 
+            # Select patch type
+            self.patch_type = self.select_patch_type()
+            if not self.patch_type:
+                messagebox.showwarning(
+                    "Warning", "Patch type not selected, operation cancelled")
+                return None
+
+            # Select previous patch, the last generated patch is used when cancelled
+            self.previous_patch_path = ""
+            if self.delta_patch_var.get():
+                self.previous_patch_path = filedialog.askopenfilename(
+                    title="Previous Patch.zip or Patch.manifest.json",
+                    filetypes=[("Previous patch", "*.zip *.json")]
+                )
+
+        # Check if HTML file is provided
+        if not self.achievement_html_path_var.get():
+            if os.path.isfile("achdb.html"):
+                self.achievement_html_path_var.set("achdb.html")
+                self.achievement_processing_failed = False
+            elif self.create_generator().load_catalog_achievements() is not None:
+                self.achievement_processing_failed = False
+            elif os.environ.get(SCHEMA_API_KEY_ENV):
+                # Achievements are downloaded from the Steam Web API schema
+                self.achievement_processing_failed = False
+            else:
+                if not self.achievement_html_path_var.get() or not os.path.exists(self.achievement_html_path_var.get()):
+                    self.achievement_processing_failed = True
+                    messagebox.showwarning(
+                        "Warning", "Missing SteamDB achievement HTML page, cannot display achievement configuration, please read README file for details")
         else:
-            print("Warning: source folder does not exist")
+            # Check html file type
+            if not (os.path.splitext(self.achievement_html_path_var.get())[1].lower() in ('.html', '.htm', '.json')
+                    or parse_page_reference(self.achievement_html_path_var.get())):
+                self.achievement_processing_failed = True
+                messagebox.showerror("Warning",
+                                     "Not an HTML or JSON file type, achievement fetch failed"
+                                     )
+            else:
+                self.achievement_processing_failed = False
 
-    def copy_game_images_to_output(self, safe_game_name):
-        """Copy game images to Output/{game name}/steam_settings folder"""
-        temp_dir = "_temp"
-        output_steam_settings = os.path.join(
-            "Output", safe_game_name, "steam_settings")
+        # If custom ICO icon is selected, show selection dialog
+        if self.use_custom_ico_var.get():
+            if not self.select_custom_ico():
+                messagebox.showwarning(
+                    "Warning", "ICO file not selected, operation cancelled")
+                return None
+
+        generator = self.create_generator()
+        generator.achievement_processing_failed = self.achievement_processing_failed
+
+        # Multi-language mode replaces the single-language translation
+        if generator.needs_community_choice():
+            generator.settings['use_community'] = self.enable_sc_localization()
+
+        return generator
+
+    def create_generator(self):
+        """Create a ConfigGenerator from the current GUI settings"""
+        info_html_path = self.info_html_path_var.get().strip()
+        if getattr(self, 'pre_appid', False) or not (
+                info_html_path.lower().endswith('.html') or parse_page_reference(info_html_path)):
+            info_html_path = None
+
+        # A .json achievement file is a saved GetSchemaForGame response
+        achievement_path = self.achievement_html_path_var.get()
+        achievement_schema = None
+        if achievement_path.lower().endswith('.json'):
+            achievement_path, achievement_schema = None, achievement_path
+
+        generator = ConfigGenerator({
+            'appid': self.appid_var.get().strip(),
+            'info_html': info_html_path,
+            'achievement_html': achievement_path,
+            'achievement_schema': achievement_schema,
+            'schema_api_key': os.environ.get(SCHEMA_API_KEY_ENV),
+            'community_languages': self.localization_languages if self.multi_language_var.get() else [],
+            'username': self.username_var.get(),
+            'userid': self.userid_var.get(),
+            'language': self.game_language.get(),
+            'local_storage': self.local_storage_var.get(),
+            'overlay': self.overlay_var.get(),
+            'game_root': self.game_root_path_var.get(),
+            'exe_path': self.exe_path_var.get(),
+            'use_custom_ico': self.use_custom_ico_var.get(),
+            'custom_ico_path': self.custom_ico_path,
+            'generate_patch': self.generate_patch_var.get(),
+            'patch_type': self.patch_type,
+            'steamapi_dll_path': self.steamapi_dll_path,
+            'delta_patch': self.generate_patch_var.get() and self.delta_patch_var.get(),
+            'previous_patch': self.previous_patch_path,
+            'use_catalog': self.use_catalog_var.get()
+        }, self.catalog, notify=self._notify, ask_retry=self._ask_community_retry, status=self.status_var.set)
+        generator.game_info = dict(self.game_info)
+        generator.has_resource_hacker = self.has_resource_hacker
+        return generator
+
+    def _notify(self, level, title, message):
+        """Show generator warnings and errors"""
+        if level == 'error':
+            messagebox.showerror(title, message)
+        else:
+            messagebox.showwarning(title, message)
 
-        # Ensure target folder exists
-        if not os.path.exists(output_steam_settings):
-            os.makedirs(output_steam_settings)
+    def _ask_community_retry(self, error):
+        """Ask whether to retry connecting to Steam Community"""
+        messagebox.showwarning(
+            "Warning", f"Cannot access SteamCommunity, please check network connection\nError：{error}")
 
-        # Copy three game images
-        game_images = ["header.jpg", "logo.png", "library_600x900.jpg"]
+        # Show retry option dialog
+        return messagebox.askyesno(
+            "Connection Failed",
+            "Retry connecting to Steam Community?\n\nSelecting 'No' will not use Steam Community achievement page as translation reference."
+        )
 
-        for image_file in game_images:
-            temp_image_path = os.path.join(temp_dir, image_file)
-            if os.path.exists(temp_image_path):
-                target_path = os.path.join(
-                    output_steam_settings, image_file)
-                try:
-                    shutil.copy2(temp_image_path, target_path)
-                    print(f"Copy game image success: {image_file}")
-                except Exception as e:
-                    print(f"Copy game image failed: {image_file} - {e}")
-            else:
-                print(f"Game image does not exist: {temp_image_path}")
+    def _extract_worker(self, generator):
+        # Check every input before anything is written
+        self.status_var.set("Checking inputs...")
+        plan = generator.plan()
+        errors = [entry['message']
+                  for entry in plan['problems'] if entry['level'] == 'error']
+        if errors:
+            messagebox.showerror("Error", "\n".join(errors))
+            self.status_var.set(
+                "Please reselect game EXE file or game root directory")
+            self.progress.stop()
+            self.extract_button.config(state='normal')
+            return
+
+        try:
+            achievements = generator.run()
+
+            # Update UI in main thread
+            self.root.after(0, self._show_results, generator, achievements)
+
+        except Exception as e:
+            messagebox.showerror("Error",
+                                 f"Not a valid HTML file, or not a valid SteamDB achievement page, more info please visit README file \nInfo:{e}",
+                                 )
+            self.progress.stop()
+            self.extract_button.config(state='enable')
+            # self.root.after(0, lambda: self._handle_error(str(e)))
 
-    def _show_results(self, achievements, safe_game_name):
+    def _show_results(self, generator, achievements):
         """Show results"""
         self.progress.stop()
         self.extract_button.config(state='normal')
+        self.achievement_processing_failed = generator.achievement_processing_failed
+        self.icon_replacement_failed = generator.icon_replacement_failed
+        self.exe_valid = generator.exe_valid
 
         # Build result message
         result_message = f"Config file generation complete!\n"
@@ -1886,7 +7115,7 @@ class GSEGeneratorGUI:
             # Set game name in achievement display window
             game_name = self.game_info.get('game_name', 'Game')
             achievement_window = AchievementDisplayWindow(
-                achievements, game_name)
+                achievements, game_name, self.game_language.get())
 
         # Build generated files list
         generated_files = ["steam_settings folder"]
@@ -1918,13 +7147,39 @@ class GSEGeneratorGUI:
         if self.generate_patch_var.get():
             generated_files.append("Patch.zip patch file")
 
-        result_message += f"Generated the following files to Output/{safe_game_name} folder:\n"
+        result_message += f"Generated the following files to Output/{generator.safe_game_name} folder:\n"
         for file_info in generated_files:
             result_message += f"- {file_info}\n"
 
         self.status_var.set(f"Successfully generated config files!")
         messagebox.showinfo("Success", result_message)
 
+        # Keep regenerating while inputs change
+        if self.watch_var.get():
+            self.start_watch(generator)
+
+    def on_watch_mode_change(self):
+        """Stop watching when watch mode is turned off"""
+        if not self.watch_var.get():
+            self.stop_watch()
+
+    def start_watch(self, generator):
+        """Re-run affected stages of the last generation when its inputs change"""
+        self.stop_watch()
+        self.watcher = generator.watch(
+            on_finished=lambda achievements, stages: self.root.after(0, self._on_watch_rerun, stages))
+        self.status_var.set("Watching input files for changes...")
+
+    def stop_watch(self):
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            log.info("Watch mode stopped")
+
+    def _on_watch_rerun(self, stages):
+        self.status_var.set(
+            f"Regenerated {', '.join(sorted(stages))} at {time.strftime('%H:%M:%S')}, watching...")
+
     def _handle_error(self, error_msg):
         """Handle error"""
         self.progress.stop()
@@ -1932,327 +7187,225 @@ class GSEGeneratorGUI:
         self.status_var.set("Processing failed")
         messagebox.showerror("Error", f"Processing failed: {error_msg}")
 
-    def generate_config_files(self, safe_game_name):
-        """Generate config files"""
-        # Generate configs.user.ini
-        self.generate_user_config(safe_game_name)
-
-        # Generate configs.app.ini
-        self.generate_app_config(safe_game_name)
-
-        # Generate steam_appid.txt
-        self.generate_steam_appid(safe_game_name)
-
-    def generate_user_config(self, safe_game_name):
-        """Generate configs.user.ini file"""
-        config_content = "[user::general]\n"
-        config_content += f"account_name={self.username_var.get().strip()}\n"
-        config_content += f"account_steamid={self.userid_var.get().strip()}\n"
-        config_content += f"language={self.game_language.get()}\n"
-
-        # If local storage is enabled, add related configuration
-        if self.local_storage_var.get():
-            config_content += "\n[user::saves]\n"
-            config_content += "local_save_path=./GSE Saves\n"
-            config_content += "saves_folder_name=Goldberg SteamEmu Saves\n"
-
-        # Ensure target folder exists
-        config_dir = os.path.join(
-            "Output", safe_game_name, "steam_settings")
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-
-        config_path = os.path.join(config_dir, "configs.user.ini")
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(config_content)
-
-    def generate_app_config(self, safe_game_name):
-        """Generate configs.app.ini file"""
-        config_content = ""
-
-        # Add DLC configuration
-        if self.game_info and self.game_info.get('dlc_list'):
-            config_content += "[app::dlcs]\n"
-            config_content += "unlock_all=0\n"
-            for dlc_id, dlc_name in self.game_info['dlc_list'].items():
-                config_content += f"{dlc_id}={dlc_name}\n"
-
-        if config_content:
-            # Ensure target folder exists
-            config_dir = os.path.join(
-                "Output", safe_game_name, "steam_settings")
-            if not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-
-            config_path = os.path.join(config_dir, "configs.app.ini")
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(config_content)
-
-    def generate_steam_appid(self, safe_game_name):
-        """Generate steam_appid.txt file"""
-        # Ensure target folder exists
-        config_dir = os.path.join(
-            "Output", safe_game_name, "steam_settings")
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-
-        appid_path = os.path.join(config_dir, "steam_appid.txt")
-        with open(appid_path, 'w', encoding='utf-8') as f:
-            f.write(self.appid_var.get().strip())
-
-    def save_json_file(self, achievements, safe_game_name):
-        """Auto save JSON file"""
-        # Ensure target folder exists
-        config_dir = os.path.join(
-            "Output", safe_game_name, "steam_settings")
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-
-        json_path = os.path.join(config_dir, "achievements.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(achievements, f, ensure_ascii=False, indent=2)
-
-    def extract_achievements_from_html(self, html_file_path):
-        """Extract achievement data"""
-        with open(html_file_path, 'r', encoding='utf-8') as file:
-            html_content = file.read()
-
-        soup = BeautifulSoup(html_content, 'html.parser')
-        achievements = []
-        achievement_divs = soup.find_all('div', class_='achievement')
-
-        sc_accesible = True
-        sc_enable = True
 
-        if html_file_path and (not self.achievement_processing_failed) and os.path.exists(html_file_path):
-            sc_enable = self.enable_sc_localization()
-        else:
-            self.achievement_processing_failed = True
-            messagebox.showerror(
-                "SteamDB achievement local HTML file not found",
-                f"Please check if the path file exists"
-            )
-            return False
-
-        if sc_enable:
-            if not os.path.isfile("achs.html"):
-                # Check if SteamCommunity link is accessible
-                steamcommunity_url = f"https://steamcommunity.com/stats/{self.appid_var.get()}/achievements/?l={self.game_language.get()}"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                }
-
-                success = False
-                while not success:
-                    try:
-                        steamcommunity_response = requests.get(
-                            steamcommunity_url, headers=headers, timeout=10)
-                        steamcommunity_response.raise_for_status()
-                        community_html_file = steamcommunity_response.content
-                        success = True
-                    except requests.RequestException as e:
-                        print(f"Cannot access SteamCommunity page: {e}")
-                        messagebox.showwarning(
-                            "Warning", f"Cannot access SteamCommunity, please check network connection\nError：{e}")
-
-                        # Show retry option dialog
-                        retry = messagebox.askyesno(
-                            "Connection Failed",
-                            "Retry connecting to Steam Community?\n\nSelecting 'No' will not use Steam Community achievement page as translation reference."
-                        )
-
-                        if not retry:
-                            messagebox.showerror(
-                                "Failed to get Steam Community localized achievements",
-                                "Will not use Steam Community achievement page as translation reference"
-                            )
-                            sc_accesible = False
-                            break
 
-                if success:
-                    sc_accesible = True
+def run_jobs(job_file_path, catalog_path=CATALOG_PATH, watch=False, plan_only=False):
+    """
+    Generate config files for the jobs in a JSON file without the GUI
 
-            else:
-                self.community_achievement_html = "achs.html"
-                path = self.community_achievement_html
-                with open(path, 'r', encoding='utf-8') as file:
-                    community_html_file = file.read()
+    Jobs are planned first, jobs with errors are skipped before anything is written.
 
-        else:
-            sc_accesible = False
+    Args:
+        job_file_path (str): JSON file with a job settings object or a list of them (see ConfigGenerator)
+        catalog_path (str): Local catalog database path
+        watch (bool): Keep watching job inputs until interrupted
+        plan_only (bool): Print the plan of every job as JSON instead of running it
+    """
+    with open(job_file_path, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+    if isinstance(jobs, dict):
+        jobs = [jobs]
+
+    # A dry run does not create the catalog
+    catalog = LocalCatalog(catalog_path) if not plan_only or os.path.exists(
+        catalog_path) else None
+    watchers = []
+    plans = []
+    try:
+        for job in jobs:
+            settings = dict(job)
+            # Jobs may be re-run concurrently in watch mode
+            settings.setdefault('temp_dir', f"_temp_{settings.get('appid')}")
+            generator = ConfigGenerator(settings, catalog)
+            generator.detect_game_files(update_cache=not plan_only)
+
+            plan = generator.plan()
+            if plan_only:
+                plans.append(plan)
+                continue
+            for entry in plan['problems']:
+                log.info(f"Job {settings.get('appid')} {entry['level']}: {entry['message']}")
+            if not plan['ok']:
+                log.info(f"Skip job {settings.get('appid')}")
+                continue
 
-        for achievement_div in achievement_divs:
             try:
-                # Extract achievement ID
-                achievement_id = achievement_div.get('id', '')
-                name = achievement_id.replace(
-                    'achievement-', '') if achievement_id.startswith('achievement-') else achievement_id
-
-                # Extract achievement name
-                achievement_name_div = achievement_div.find(
-                    'div', class_='achievement_name')
-                display_name = achievement_name_div.get_text(
-                    strip=True) if achievement_name_div else ""
-
-                # Extract achievement description
-                achievement_desc_div = achievement_div.find(
-                    'div', class_='achievement_desc')
-                description_raw = achievement_desc_div.get_text(
-                    strip=True) if achievement_desc_div else ""
-
-                # Check if it's a hidden achievement
-                hidden = 0
-                description_clean = description_raw
-
-                desc_copy = achievement_desc_div.__copy__()
-                i_tag = desc_copy.find('i')
-                if i_tag:
-                    hidden = 1
-                    i_tag.decompose()
-                description_clean = desc_copy.get_text(
-                    strip=True) if desc_copy else ""
-                description_clean = description_clean.rstrip('。')
-
-                # Extract icon
-                icon_img = achievement_div.find(
-                    'img', class_='achievement_image')
-                icon = ""
-                if icon_img:
-                    src = icon_img.get('src')
-                    if src and '.jpg' in src:
-                        # Handle normal src path
-                        filename = src.split('/')[-1]
-                        icon = filename
-                    else:
-                        # Handle data-name case
-                        data_name = icon_img.get('data-name')
-                        if data_name:
-                            icon = data_name
-
-                # Extract gray icon
-                icon_gray_img = achievement_div.find(
-                    'img', class_='achievement_image_small')
-                icongray = ""
-                if icon_gray_img:
-                    src = icon_gray_img.get('src')
-                    if src and '.jpg' in src:
-                        filename = src.split('/')[-1]
-                        icongray = filename
-                    else:
-                        data_name = icon_img.get('data-name')
-                        if data_name:
-                            icongray = data_name
-
-                achievement_data = {
-                    "name": name,
-                    "defaultvalue": 0,
-                    "displayName": display_name,
-                    "hidden": hidden,
-                    "description": description_clean,
-                    "icon": icon,
-                    "icongray": icongray,
-                    "icon_gray": icongray
-                }
-
-                achievements.append(achievement_data)
-
+                achievements = generator.run()
             except Exception as e:
-                print(f"Error processing achievement: {e}")
-                messagebox.showwarning(
-                    "Warning", "Error processing achievement")
+                log.warning(f"Job {settings.get('appid')} failed: {e}")
                 continue
+            log.info(
+                f"Generated {generator.output_dir} ({len(achievements)} achievements)")
 
-        if sc_accesible:
-            steamcommunity_soup = BeautifulSoup(
-                community_html_file, 'html.parser')
-            achievement_rows = steamcommunity_soup.find_all(
-                'div', class_='achieveRow')
-
-            for achievement in achievements:
-                try:
-                    page1_icon = achievement.get('icon', '')
-
-                    matching_row = None
-                    for achievement_row in achievement_rows:
-                        img_tag = achievement_row.find('img')
-                        if img_tag:
-                            src = img_tag.get('src', '')
-                            if src:
-                                page2_icon = src.split('/')[-1]
-                                if page1_icon == page2_icon:
-                                    matching_row = achievement_row
-                                    break
-
-                    if matching_row:
-                        achieve_txt_div = matching_row.find(
-                            'div', class_='achieveTxt')
-                        if achieve_txt_div:
-                            h3_tag = achieve_txt_div.find('h3')
-                            h5_tag = achieve_txt_div.find('h5')
-                            if h3_tag:
-                                display_name = h3_tag.text.strip()
-                                if display_name:
-                                    achievement['displayName'] = display_name
-                            if h5_tag:
-                                description = h5_tag.text.strip()
-                                if description:
-                                    achievement['description'] = description
-                    else:
-                        print(
-                            f"No matching achievements found, SteamDB achievements Page icon: {page1_icon}")
-
-                except Exception as e:
-                    print(
-                        f"Error getting achievement info from SteamCommunity page: {e}")
-                    messagebox.showwarning(
-                        "Warning", "Error getting achievement info from SteamCommunity page")
-
-        return achievements
-
-    def copy_achievement_images(self, achievements, safe_game_name):
-        """Copy achievement images to Output/{game name}/steam_settings/achievement_images folder"""
-        source_dir = "imgs"
-        target_dir = os.path.join(
-            "Output", safe_game_name, "steam_settings", "achievement_images")
-
-        # Ensure target folder exists
-        if not os.path.exists(target_dir):
-            os.makedirs(target_dir)
+            if watch:
+                watchers.append(generator.watch())
 
-        if not os.path.exists(source_dir):
-            print(
-                f"Warning: Source image folder does not exist: {source_dir}")
-            return
+        if watchers:
+            log.info("Watching for changes, press Ctrl+C to stop")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+        if plan_only:
+            print(json.dumps(plans, ensure_ascii=False, indent=2))
+    finally:
+        for watcher in watchers:
+            watcher.stop()
+        if catalog:
+            catalog.close()
 
-        # Collect needed image filenames
-        image_files_needed = set()
-        for achievement in achievements:
-            if achievement.get('icon'):
-                image_files_needed.add(achievement['icon'])
-            if achievement.get('icongray'):
-                image_files_needed.add(achievement['icongray'])
 
-        # Copy files to achievement_images folder
-        for filename in image_files_needed:
-            source_path = os.path.join(source_dir, filename)
-            target_path = os.path.join(target_dir, filename)
+def serve(port=SERVICE_PORT, service_dir=SERVICE_DIR, catalog_path=CATALOG_PATH, max_workers=SERVICE_WORKERS,
+          allowed_roots=()):
+    """
+    Run the HTTP service on localhost until interrupted
 
-            if os.path.exists(source_path):
-                try:
-                    shutil.copy2(source_path, target_path)
-                    print(f"Copy success: {filename}")
-                except Exception as e:
-                    print(f"Copy failed: {filename} - {e}")
-            else:
-                print(f"Source file does not exist: {source_path}")
+    Args:
+        port (int): Listening port
+        service_dir (str): Folder for uploads and job outputs
+        catalog_path (str): Local catalog database path
+        max_workers (int): Jobs running at the same time
+        allowed_roots (list): Folders job settings may point into
+    """
+    catalog = LocalCatalog(catalog_path)
+    service = GenerationService(service_dir, catalog, max_workers, allowed_roots=allowed_roots)
+    handler = type("ServiceRequestHandler", (_ServiceRequestHandler,), {
+        'service': service})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    log.info(f"GSE Generator service listening on http://127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        catalog.close()
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="GSE Generator - Steam Game Configuration File Generator")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="info",
+                        help="Console log level, debug also shows every copied file and DLC")
+    parser.add_argument("--log-file", metavar="FILE",
+                        help="Also write the full (debug) log to FILE")
+    parser.add_argument("--catalog", default=CATALOG_PATH,
+                        help="Local catalog database path")
+    parser.add_argument("--import-catalog", metavar="FOLDER",
+                        help="Import saved SteamDB / Steam Community pages from FOLDER into the local catalog and exit")
+    parser.add_argument("--scan", metavar="FOLDER",
+                        help="Scan FOLDER for saved SteamDB / Steam Community pages, write job inputs and exit")
+    parser.add_argument("--jobs-file", default="jobs.json",
+                        help="Job inputs file written by --scan")
+    parser.add_argument("--job", metavar="FILE",
+                        help="Generate config files for the job (JSON object) or jobs (JSON list) in FILE without the GUI")
+    parser.add_argument("--plan", action="store_true",
+                        help="With --job, print the files each job would write and its problems without writing anything")
+    parser.add_argument("--watch", action="store_true",
+                        help="With --job, keep watching job inputs and re-run the affected stages on change")
+    parser.add_argument("--write-source-manifest", action="store_true",
+                        help=f"Record the hashes of the (known-good) source folder in {SOURCE_MANIFEST_PATH} and exit")
+    parser.add_argument("--verify-source", action="store_true",
+                        help=f"Check the source folder against {SOURCE_MANIFEST_PATH} and exit")
+    parser.add_argument("--export-bundle", metavar="FILE",
+                        help="Pack generated game folders into the deduplicated bundle FILE and exit")
+    parser.add_argument("--bundle-games", nargs="+", metavar="FOLDER",
+                        help="With --export-bundle, game folders to pack (default: every folder in Output)")
+    parser.add_argument("--extract-bundle", metavar="FILE",
+                        help="Recreate the game folders of the bundle FILE and exit")
+    parser.add_argument("--bundle-dest", default="Output",
+                        help="With --extract-bundle, folder to extract the games to")
+    parser.add_argument("--page-store", default=PAGE_STORE_PATH,
+                        help="Page store database path")
+    parser.add_argument("--store-pages", metavar="FOLDER",
+                        help="Archive saved SteamDB / Steam Community pages from FOLDER in the compressed page store and exit")
+    parser.add_argument("--list-pages", action="store_true",
+                        help="List the pages of the page store with their references and exit")
+    parser.add_argument("--serve", nargs="?", type=int, const=SERVICE_PORT, metavar="PORT",
+                        help=f"Run the local HTTP service (default port {SERVICE_PORT})")
+    parser.add_argument("--service-dir", default=SERVICE_DIR,
+                        help="Folder for service uploads and job outputs")
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS,
+                        help="Service jobs running at the same time")
+    parser.add_argument("--allow-root", action="append", default=[], metavar="FOLDER",
+                        help="Folder service jobs may read game files and saved pages from (repeatable)")
+    args = parser.parse_args()
+    setup_logging(args.log_level, args.log_file)
+
+    if args.write_source_manifest:
+        count = write_source_manifest()
+        print(f"{count} source files recorded in {SOURCE_MANIFEST_PATH}")
+        return
+
+    if args.verify_source:
+        result = verify_source_integrity()
+        if result is None:
+            print(f"{SOURCE_MANIFEST_PATH} not found")
+            sys.exit(1)
+        for path in result['corrupted']:
+            print(f"Corrupted: {path}")
+        for path in result['missing']:
+            print(f"Missing: {path}")
+        print(f"Verified: {result['verified']}")
+        sys.exit(1 if result['corrupted'] or result['missing'] else 0)
+
+    if args.export_bundle:
+        game_dirs = args.bundle_games or sorted(
+            entry.path for entry in os.scandir("Output") if entry.is_dir())
+        stats = export_bundle(game_dirs, args.export_bundle)
+        print(f"Bundled {stats['games']} games into {args.export_bundle}: {stats['files']} files "
+              f"({stats['size']} bytes), {stats['unique_files']} unique ({stats['unique_size']} bytes)")
+        return
+
+    if args.extract_bundle:
+        names = extract_bundle(args.extract_bundle, args.bundle_dest)
+        print(f"Extracted {len(names)} games to {args.bundle_dest}")
+        return
+
+    if args.serve:
+        serve(args.serve, args.service_dir, args.catalog, args.workers, args.allow_root)
+        return
+
+    if args.job:
+        run_jobs(args.job, args.catalog, args.watch, args.plan)
+        return
+
+    if args.scan:
+        jobs, skipped = scan_saved_pages(args.scan)
+        save_job_inputs(jobs, args.jobs_file)
+        print(
+            f"Found {len(jobs)} games ({len(skipped)} pages skipped), job inputs saved to {args.jobs_file}")
+        return
+
+    if args.store_pages:
+        stats = store_saved_pages(args.store_pages, args.page_store)
+        print(f"Stored {stats['stored']} pages in {args.page_store} ({stats['size']} -> "
+              f"{stats['compressed_size']} bytes), {stats['duplicates']} already stored, "
+              f"{stats['skipped']} skipped")
+        return
+
+    if args.list_pages:
+        store = PageStore(args.page_store)
+        try:
+            for page in store.list_pages():
+                print(f"{page['reference']}  {page['size']} -> {page['compressed_size']} bytes")
+        finally:
+            store.close()
+        return
+
+    if args.import_catalog:
+        catalog = LocalCatalog(args.catalog)
+        try:
+            counts = import_saved_pages(catalog, args.import_catalog)
+        finally:
+            catalog.close()
+        print(
+            f"Imported {counts['info']} info pages, {counts['achievements']} achievement pages, "
+            f"{counts['community']} community pages ({counts['skipped']} skipped)")
+        return
+
     root = tk.Tk()
     app = GSEGeneratorGUI(root)
     root.mainloop()
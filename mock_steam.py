@@ -0,0 +1,595 @@
+"""
+Local stand-ins for the Steam services used by GSE_Generator_Py
+
+Recorded responses are replayed with configurable latency, bandwidth,
+throttling (429), server errors (5xx) and stalled connections, so the
+network paths can be timed without live Steam:
+
+    python mock_steam.py --synthesize recordings
+    python mock_steam.py --record recordings --appid 1245620 --languages english german
+    python mock_steam.py --serve recordings --latency 0.2 --error-rate 0.1
+    python mock_steam.py --load-test recordings --appid 1245620 --runs 5
+
+Recordings folder layout:
+    appdetails/{appid}_{language}.json    Store API appdetails ({appid}.json for any language)
+    cdn/{path}                            CDN files, e.g. cdn/steam/apps/{appid}/header.jpg
+    community/{appid}_{language}.html     Steam Community achievement pages
+"""
+import argparse
+import io
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from PIL import Image
+
+import GSE_Generator_Py as gse
+
+log = gse.log
+
+# Services and the module URL constants pointed at their stand-ins
+SERVICES = ("store", "cdn", "community")
+
+# Chunks per second written when the bandwidth is limited
+BANDWIDTH_CHUNKS_PER_SECOND = 20
+
+# Load test fault scenarios (FaultProfile arguments)
+SCENARIOS = {
+    'baseline': {},
+    'latency': {'latency': 0.2, 'jitter': 0.05},
+    'throttled': {'bandwidth': 256 * 1024},
+    'rate_limited': {'throttle_rate': 0.3, 'retry_after': 1},
+    'server_errors': {'error_rate': 0.2},
+    'stalled': {'stall_rate': 0.2, 'stall_seconds': 30.0},
+}
+
+# Request timeout used by the load test, so stalled requests fail quickly
+LOAD_TEST_TIMEOUT = 2
+
+
+class FaultProfile:
+    """
+    Latency and faults injected into the responses of a stand-in server
+
+    Outcomes are drawn from a generator seeded by (seed, path, request number
+    of that path), so a run is reproducible regardless of thread timing.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, bandwidth=None, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1, stall_rate=0.0, stall_seconds=30.0, seed=0):
+        """
+        Args:
+            latency (float): Delay before each response in seconds
+            jitter (float): Random extra delay, up to this many seconds
+            bandwidth (int): Response body bytes per second, None for unlimited
+            error_rate (float): Share of requests answered with 500/502/503
+            throttle_rate (float): Share of requests answered with 429
+            retry_after (int): Retry-After header of 429 responses
+            stall_rate (float): Share of responses that stop after half the body
+            stall_seconds (float): How long a stalled response hangs before closing
+            seed (int): Random seed
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._requests = Counter()
+
+    def decide(self, path):
+        """
+        Draw the outcome of a request
+
+        Returns:
+            tuple: (delay in seconds, outcome), outcome is 'ok', 'stall', 429 or a 5xx status
+        """
+        with self._lock:
+            self._requests[path] += 1
+            rng = random.Random(f"{self.seed}:{path}:{self._requests[path]}")
+        delay = self.latency + rng.uniform(0, self.jitter)
+        draw = rng.random()
+        if draw < self.throttle_rate:
+            return delay, 429
+        draw -= self.throttle_rate
+        if draw < self.error_rate:
+            return delay, rng.choice((500, 502, 503))
+        draw -= self.error_rate
+        if draw < self.stall_rate:
+            return delay, 'stall'
+        return delay, 'ok'
+
+
+class _MockSteamHandler(BaseHTTPRequestHandler):
+    """Replay recorded responses of one service (see MockSteamServer)"""
+
+    def log_message(self, format, *args):
+        log.debug("mock %s: %s", self.server.service, format % args)
+
+    def do_GET(self):
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        delay, outcome = server.profile.decide(url.path)
+        if delay and server.stop_event.wait(delay):
+            return
+
+        if outcome == 429:
+            server.count(outcome)
+            self.send_response(429)
+            self.send_header("Retry-After", str(server.profile.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if outcome != 'ok' and outcome != 'stall':
+            server.count(outcome)
+            self.send_response(outcome)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        response = server.lookup(url.path, dict(urllib.parse.parse_qsl(url.query)))
+        if response is None:
+            server.count(404)
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        server.count(outcome)
+        body, content_type = response
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if outcome == 'stall':
+            # Send half the body, then hang until the client gives up
+            self._write(body[:len(body) // 2])
+            server.stop_event.wait(server.profile.stall_seconds)
+            self.close_connection = True
+            return
+        self._write(body)
+
+    def _write(self, body):
+        bandwidth = self.server.profile.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+        chunk_size = max(1, bandwidth // BANDWIDTH_CHUNKS_PER_SECOND)
+        for offset in range(0, len(body), chunk_size):
+            if self.server.stop_event.wait(1 / BANDWIDTH_CHUNKS_PER_SECOND):
+                return
+            self.wfile.write(body[offset:offset + chunk_size])
+
+
+class MockSteamServer(ThreadingHTTPServer):
+    """
+    Stand-in of one Steam service on localhost
+
+    Services: 'store' (GET /api/appdetails?appids=&l=), 'cdn' (GET any
+    recorded path) and 'community' (GET /stats/{appid}/achievements/?l=).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, service, recordings_dir, profile=None, host="127.0.0.1", port=0):
+        if service not in SERVICES:
+            raise ValueError(f"Unknown service: {service}")
+        super().__init__((host, port), _MockSteamHandler)
+        self.service = service
+        self.recordings_dir = recordings_dir
+        self.profile = profile or FaultProfile()
+        self.stop_event = threading.Event()
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, outcome):
+        with self._stats_lock:
+            self.stats[str(outcome)] += 1
+
+    def _read(self, *parts):
+        path = os.path.join(self.recordings_dir, *parts)
+        # Only serve files inside the recordings folder
+        if os.path.commonpath([os.path.abspath(path), os.path.abspath(self.recordings_dir)]) \
+                != os.path.abspath(self.recordings_dir) or not os.path.isfile(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def lookup(self, path, query):
+        """
+        Get the recorded response of a request
+
+        Returns:
+            tuple: (body, content type), None when nothing is recorded
+        """
+        if self.service == "store":
+            appid, language = query.get("appids", ""), query.get("l", "english")
+            if path != "/api/appdetails" or not appid.isdigit():
+                return None
+            body = self._read("appdetails", f"{appid}_{language}.json") or \
+                self._read("appdetails", f"{appid}.json")
+            if body is None:
+                # The Store API answers unknown apps with success false
+                body = json.dumps({appid: {'success': False}}).encode()
+            return body, "application/json; charset=utf-8"
+
+        if self.service == "community":
+            match = re.fullmatch(r"/stats/(\d+)/achievements/?", path)
+            if not match:
+                return None
+            body = self._read("community", f"{match.group(1)}_{query.get('l', 'english')}.html")
+            return (body, "text/html; charset=utf-8") if body is not None else None
+
+        parts = [part for part in path.split("/") if part]
+        if not parts or any(part in (".", "..") for part in parts):
+            return None
+        body = self._read("cdn", *parts)
+        content_type = {".jpg": "image/jpeg", ".png": "image/png"}.get(
+            os.path.splitext(path)[1].lower(), "application/octet-stream")
+        return (body, content_type) if body is not None else None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        # Release stalled and throttled responses before shutting down
+        self.stop_event.set()
+        self.shutdown()
+        self.server_close()
+
+
+class MockSteam:
+    """
+    Run stand-ins of all services and point GSE_Generator_Py at them
+
+    The module URL constants (and the request timeout, if given) are
+    patched while the context is active, and the Steam response cache is
+    cleared on entry and exit.
+    """
+
+    def __init__(self, recordings_dir, profiles=None, request_timeout=None):
+        """
+        Args:
+            recordings_dir (str): Recordings folder
+            profiles (FaultProfile | dict): Profile of every service, or {service: profile}
+            request_timeout (float): STEAM_REQUEST_TIMEOUT while active, None to keep it
+        """
+        if not isinstance(profiles, dict):
+            profiles = {service: profiles for service in SERVICES}
+        self.servers = {service: MockSteamServer(service, recordings_dir, profiles.get(service))
+                        for service in SERVICES}
+        self.request_timeout = request_timeout
+        self._saved = {}
+
+    def __enter__(self):
+        for server in self.servers.values():
+            server.start()
+        patches = {
+            'STORE_API_URL': f"{self.servers['store'].base_url}/api/appdetails",
+            'STEAM_CDN_URL': self.servers['cdn'].base_url,
+            'ACHIEVEMENT_ICON_URL': self.servers['cdn'].base_url
+            + "/steamcommunity/public/images/apps/{appid}/{filename}",
+            'COMMUNITY_URL': self.servers['community'].base_url,
+        }
+        if self.request_timeout is not None:
+            patches['STEAM_REQUEST_TIMEOUT'] = self.request_timeout
+        for name, value in patches.items():
+            self._saved[name] = getattr(gse, name)
+            setattr(gse, name, value)
+        clear_steam_cache()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for name, value in self._saved.items():
+            setattr(gse, name, value)
+        self._saved.clear()
+        clear_steam_cache()
+        for server in self.servers.values():
+            server.stop()
+
+    def stats(self):
+        """Response outcomes by service"""
+        return {service: dict(server.stats) for service, server in self.servers.items()}
+
+
+def clear_steam_cache():
+    """Forget cached Store API responses and artwork"""
+    with gse._steam_cache_lock:
+        gse._steam_cache.clear()
+
+
+def record_responses(recordings_dir, appids, languages=("english",), timeout=30):
+    """
+    Record the live Steam responses of games, their DLCs and artwork
+
+    Returns:
+        int: Number of files recorded
+    """
+    recorded = 0
+
+    def save(relative_path, content):
+        nonlocal recorded
+        path = os.path.join(recordings_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        recorded += 1
+
+    for appid in appids:
+        for language in languages:
+            response = requests.get(f"{gse.STORE_API_URL}?appids={appid}&l={language}", timeout=timeout)
+            response.raise_for_status()
+            save(f"appdetails/{appid}_{language}.json", response.content)
+            data = response.json().get(str(appid), {})
+            for dlc_id in data.get('data', {}).get('dlc', []) if data.get('success') else []:
+                dlc_response = requests.get(
+                    f"{gse.STORE_API_URL}?appids={dlc_id}&l={language}", timeout=timeout)
+                if dlc_response.ok:
+                    save(f"appdetails/{dlc_id}_{language}.json", dlc_response.content)
+
+            response = requests.get(f"{gse.COMMUNITY_URL}/stats/{appid}/achievements/?l={language}",
+                                    headers=gse.COMMUNITY_HEADERS, timeout=timeout)
+            if response.ok:
+                save(f"community/{appid}_{language}.html", response.content)
+                for icon in gse.parse_community_achievements(response.content):
+                    if gse.is_plain_filename(icon):
+                        icon_response = requests.get(
+                            gse.ACHIEVEMENT_ICON_URL.format(appid=appid, filename=icon), timeout=timeout)
+                        if icon_response.ok:
+                            save(f"cdn/steamcommunity/public/images/apps/{appid}/{icon}",
+                                 icon_response.content)
+
+        for image_name in gse.GAME_IMAGES:
+            response = requests.get(f"{gse.STEAM_CDN_URL}/steam/apps/{appid}/{image_name}", timeout=timeout)
+            if response.ok:
+                save(f"cdn/steam/apps/{appid}/{image_name}", response.content)
+    return recorded
+
+
+def synthesize_recordings(recordings_dir, appid=1000, dlc_count=20, achievement_count=60,
+                          languages=("english", "german", "french"), seed=0):
+    """
+    Write synthetic recordings of one game, for load tests without live Steam
+
+    Artwork is random noise, so it does not compress better than real images.
+    """
+    rng = random.Random(seed)
+
+    def save(relative_path, content):
+        path = os.path.join(recordings_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    def noise_image(size, image_format):
+        image = Image.frombytes("RGB", size, rng.randbytes(size[0] * size[1] * 3))
+        buffer = io.BytesIO()
+        image.save(buffer, image_format)
+        return buffer.getvalue()
+
+    dlc_ids = [appid + index for index in range(1, dlc_count + 1)]
+    for language in languages:
+        save(f"appdetails/{appid}_{language}.json", json.dumps({str(appid): {
+            'success': True, 'data': {'name': f"Mock Game {appid}", 'dlc': dlc_ids}}}).encode())
+        for dlc_id in dlc_ids:
+            save(f"appdetails/{dlc_id}_{language}.json", json.dumps({str(dlc_id): {
+                'success': True, 'data': {'name': f"Mock DLC {dlc_id} ({language})"}}}).encode())
+
+    for image_name, size in zip(gse.GAME_IMAGES, [(460, 215), (640, 360), (600, 900)]):
+        save(f"cdn/steam/apps/{appid}/{image_name}",
+             noise_image(size, "PNG" if image_name.endswith(".png") else "JPEG"))
+
+    icons = [f"{rng.getrandbits(160):040x}.jpg" for _ in range(achievement_count)]
+    for icon in icons:
+        save(f"cdn/steamcommunity/public/images/apps/{appid}/{icon}", noise_image((64, 64), "JPEG"))
+
+    # Community pages carry a lot of markup around the achievement rows
+    boilerplate = "".join(f'<div class="responsive_menu_item" data-index="{index}"></div>\n'
+                          for index in range(4000))
+    for language in languages:
+        rows = "".join(
+            f'<div class="achieveRow"><div class="achieveImgHolder"><img src="{gse.ACHIEVEMENT_ICON_URL.format(appid=appid, filename=icon)}">'
+            f'</div><div class="achieveTxtHolder"><div class="achieveTxt"><h3>Achievement {index} ({language})</h3>'
+            f'<h5>Description of achievement {index} ({language})</h5></div></div></div>\n'
+            for index, icon in enumerate(icons))
+        save(f"community/{appid}_{language}.html",
+             f'<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>{boilerplate}{rows}'
+             f'{boilerplate}</body></html>'.encode('utf-8'))
+
+
+def _load_test_operations(appid, languages, timeout, work_dir):
+    """Operations timed by the load test: name -> callable returning whether it fully succeeded"""
+    def game_dlc_info():
+        game_info = gse.get_game_dlc_info(appid, languages[0])
+        return bool(game_info) and not any(
+            str(name).startswith(('Failed_to_get_', 'Unknown_DLC_')) for name in game_info['dlc_list'].values())
+
+    def game_images():
+        temp_dir = tempfile.mkdtemp(dir=work_dir)
+        try:
+            return gse.download_game_images(appid, temp_dir) == len(gse.GAME_IMAGES)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def community_page():
+        return bool(gse.parse_community_achievements(
+            gse.stream_community_achievement_page(appid, languages[0], timeout=timeout)))
+
+    def community_localizations():
+        localizations, failures = gse.get_community_localizations(appid, languages, html_dir=work_dir)
+        return not failures
+
+    operations = {
+        'get_game_dlc_info': game_dlc_info,
+        'download_game_images': game_images,
+        'community_page': community_page,
+    }
+    if len(languages) > 1:
+        operations['community_localizations'] = community_localizations
+    return operations
+
+
+def run_load_test(recordings_dir, appid, languages=("english",), scenarios=None, runs=5,
+                  timeout=LOAD_TEST_TIMEOUT, seed=0):
+    """
+    Time the network paths of GSE_Generator_Py against the stand-ins, per fault scenario
+
+    The Steam response cache is cleared before every run, so each run sends
+    its requests again.
+
+    Args:
+        recordings_dir (str): Recordings folder
+        appid (int): Game to fetch
+        languages (list): Languages; the first is used for single-page fetches
+        scenarios (list): Names from SCENARIOS, default all
+        runs (int): Runs of every operation per scenario
+        timeout (float): Request timeout in seconds
+        seed (int): Random seed of the fault profiles
+
+    Returns:
+        list: One dict per (scenario, operation) with runs, failures, min,
+            median, p95 and max seconds, and the response outcomes by service
+    """
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="mock_steam_")
+    try:
+        for scenario in scenarios or list(SCENARIOS):
+            profile = FaultProfile(seed=seed, **SCENARIOS[scenario])
+            with MockSteam(recordings_dir, profile, request_timeout=timeout) as mock:
+                for name, operation in _load_test_operations(appid, list(languages), timeout, work_dir).items():
+                    before = mock.stats()
+                    timings = []
+                    failures = 0
+                    for run in range(runs):
+                        clear_steam_cache()
+                        start = time.perf_counter()
+                        try:
+                            ok = operation()
+                        except Exception as e:
+                            log.debug("%s/%s run %d failed: %s", scenario, name, run, e)
+                            ok = False
+                        timings.append(time.perf_counter() - start)
+                        failures += not ok
+                    after = mock.stats()
+                    timings.sort()
+                    results.append({
+                        'scenario': scenario,
+                        'operation': name,
+                        'runs': runs,
+                        'failures': failures,
+                        'min': timings[0],
+                        'median': statistics.median(timings),
+                        'p95': timings[min(len(timings) - 1, round(0.95 * (len(timings) - 1)))],
+                        'max': timings[-1],
+                        'responses': {service: dict(Counter(after[service]) - Counter(before[service]))
+                                      for service in SERVICES if after[service] != before[service]},
+                    })
+                    log.info("%s / %s: median %.3f s, %d of %d failed", scenario, name,
+                             results[-1]['median'], failures, runs)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def format_load_test(results):
+    """Format load test results as a table"""
+    lines = [f"{'scenario':<14} {'operation':<24} {'runs':>4} {'fail':>4} "
+             f"{'min':>8} {'median':>8} {'p95':>8} {'max':>8}"]
+    for result in results:
+        lines.append(f"{result['scenario']:<14} {result['operation']:<24} {result['runs']:>4} "
+                     f"{result['failures']:>4} {result['min']:>8.3f} {result['median']:>8.3f} "
+                     f"{result['p95']:>8.3f} {result['max']:>8.3f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-ins for the Steam services used by GSE Generator, and a load test")
+    parser.add_argument("--synthesize", metavar="FOLDER",
+                        help="Write synthetic recordings of one game (--appid) to FOLDER and exit")
+    parser.add_argument("--record", metavar="FOLDER",
+                        help="Record live Steam responses of --appid in FOLDER and exit")
+    parser.add_argument("--serve", metavar="FOLDER",
+                        help="Serve the recordings in FOLDER until interrupted")
+    parser.add_argument("--load-test", metavar="FOLDER",
+                        help="Time the network paths against the recordings in FOLDER")
+    parser.add_argument("--appid", type=int, nargs="+", default=[1000])
+    parser.add_argument("--languages", nargs="+", default=["english"])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        help="With --load-test, fault scenarios to run (default: all)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=LOAD_TEST_TIMEOUT,
+                        help="With --load-test, request timeout in seconds")
+    parser.add_argument("--json", metavar="FILE", help="With --load-test, also write the results to FILE")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=int, help="Bytes per second")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall-seconds", type=float, default=30.0)
+    parser.add_argument("--log-level", choices=gse.LOG_LEVELS, default="info")
+    args = parser.parse_args()
+    gse.setup_logging(args.log_level)
+
+    if args.synthesize:
+        languages = args.languages if len(args.languages) > 1 else ["english", "german", "french"]
+        synthesize_recordings(args.synthesize, args.appid[0], languages=languages, seed=args.seed)
+        print(f"Synthetic recordings of appid {args.appid[0]} written to {args.synthesize}")
+        return
+
+    if args.record:
+        count = record_responses(args.record, args.appid, args.languages)
+        print(f"Recorded {count} responses in {args.record}")
+        return
+
+    if args.serve:
+        profile = FaultProfile(args.latency, args.jitter, args.bandwidth, args.error_rate,
+                               args.throttle_rate, 1, args.stall_rate, args.stall_seconds, args.seed)
+        with MockSteam(args.serve, profile) as mock:
+            for service, server in mock.servers.items():
+                print(f"{service}: {server.base_url}")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+        return
+
+    if args.load_test:
+        results = run_load_test(args.load_test, args.appid[0], args.languages, args.scenarios,
+                                args.runs, args.timeout, args.seed)
+        print(format_load_test(results))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+        return
+
+    parser.print_help()
+
+
+if __name__ == "__main__":
+    main()